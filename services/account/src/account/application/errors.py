@@ -20,3 +20,15 @@ class InvalidTokenError(Exception):
 
 class UserAlreadyDeletedError(Exception):
     pass
+
+
+class ServiceOverloadedError(Exception):
+    pass
+
+
+class InvalidCursorError(Exception):
+    pass
+
+
+class InvalidSelectionError(Exception):
+    pass
@@ -26,11 +26,17 @@ class User:
 class RefreshSession:
     id: UUID = field(default_factory=uuid4)
     user_id: UUID
-    refresh_token: str
+    token_digest: bytes
     expires_in: datetime
     created_at: datetime
 
 
+@dataclass(kw_only=True)
+class RefreshToken:
+    value: str
+    session: RefreshSession
+
+
 @dataclass(kw_only=True)
 class TokenPayload:
     user_id: UUID
@@ -43,3 +49,5 @@ class JwtToken:
     payload: TokenPayload
     expires_in: datetime
     created_at: datetime
+    jti: str | None = None
+    session_id: UUID | None = None
@@ -0,0 +1,6 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SessionPolicy:
+    max_sessions_per_user: int
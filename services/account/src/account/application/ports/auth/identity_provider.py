@@ -1,11 +1,20 @@
 from typing import Protocol
 from uuid import UUID
 
-from account.application.models import User, UserRole
+from account.application.models import JwtToken, User, UserRole
 
 
 class IdentityProvider(Protocol):
+    def access_token(self) -> JwtToken: ...
     def user(self) -> User: ...
     def user_id(self) -> UUID: ...
     def user_roles(self) -> set[UserRole]: ...
     def is_authenticated(self) -> bool: ...
+
+
+class AsyncIdentityProvider(Protocol):
+    def access_token(self) -> JwtToken: ...
+    async def user(self) -> User: ...
+    def user_id(self) -> UUID: ...
+    def user_roles(self) -> set[UserRole]: ...
+    def is_authenticated(self) -> bool: ...
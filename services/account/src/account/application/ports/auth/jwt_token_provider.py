@@ -1,9 +1,15 @@
+from datetime import datetime
 from typing import Protocol
+from uuid import UUID
 
 from account.application.models import JwtToken, TokenPayload
 
 
 class JwtTokenProvider(Protocol):
     def validate(self, token: str) -> JwtToken: ...
-    def create_access_token(self, payload: TokenPayload) -> JwtToken: ...
-    def create_refresh_token(self, payload: TokenPayload) -> JwtToken: ...
+    def create_access_token(
+        self,
+        payload: TokenPayload,
+        issued_at: datetime,
+        session_id: UUID | None = None,
+    ) -> JwtToken: ...
@@ -1,6 +1,14 @@
+from collections.abc import Sequence
 from typing import Protocol
 
 
 class PasswordService(Protocol):
     def hash(self, plain_password: str) -> str: ...
+    def hash_many(self, plain_passwords: Sequence[str]) -> list[str]: ...
     def verify(self, plain_password: str, password_hash: str) -> bool: ...
+    def needs_rehash(self, password_hash: str) -> bool: ...
+    async def hash_async(self, plain_password: str) -> str: ...
+    async def hash_many_async(self, plain_passwords: Sequence[str]) -> list[str]: ...
+    async def verify_async(
+        self, plain_password: str, password_hash: str
+    ) -> bool: ...
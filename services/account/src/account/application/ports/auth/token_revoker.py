@@ -0,0 +1,27 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+from account.application.models import JwtToken
+
+
+class TokenRevoker(Protocol):
+    def revoke(self, jwt_token: JwtToken) -> None: ...
+    def revoke_issued_before(
+        self, user_id: UUID, issued_before: datetime
+    ) -> None: ...
+    def revoke_many_issued_before(
+        self, user_ids: Sequence[UUID], issued_before: datetime
+    ) -> None: ...
+    def remove_expired(self, now: datetime, limit: int) -> int: ...
+
+
+class AsyncTokenRevoker(Protocol):
+    async def revoke(self, jwt_token: JwtToken) -> None: ...
+    async def revoke_issued_before(
+        self, user_id: UUID, issued_before: datetime
+    ) -> None: ...
+    async def revoke_many_issued_before(
+        self, user_ids: Sequence[UUID], issued_before: datetime
+    ) -> None: ...
@@ -3,3 +3,7 @@ from typing import Protocol
 
 class Commitable(Protocol):
     def commit(self) -> None: ...
+
+
+class AsyncCommitable(Protocol):
+    async def commit(self) -> None: ...
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator, Iterator, Sequence
 from dataclasses import dataclass
 from typing import Protocol
 from uuid import UUID
@@ -5,19 +6,26 @@ from uuid import UUID
 from account.application.models import UserRole
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountInfo:
     id: UUID
     first_name: str
     last_name: str
     username: str
-    roles: set[UserRole]
+    roles: frozenset[UserRole]
     is_active: bool
 
 
+@dataclass(frozen=True)
+class AccountCursor:
+    username: str
+    id: UUID
+
+
 @dataclass(frozen=True, kw_only=True)
 class AccountFilter:
     user_id: UUID | None = None
+    user_ids: Sequence[UUID] | None = None
     role: UserRole | None = None
     only_active: bool = True
     name_filter: str | None = None
@@ -27,8 +35,16 @@ class AccountFilter:
 class ManyAccountFilter(AccountFilter):
     from_: int
     count: int
+    after: AccountCursor | None = None
 
 
 class AccountReader(Protocol):
     def read(self, filter_: ManyAccountFilter) -> list[AccountInfo]: ...
     def read_one(self, filter_: AccountFilter) -> AccountInfo | None: ...
+    def stream(self, filter_: AccountFilter) -> Iterator[AccountInfo]: ...
+
+
+class AsyncAccountReader(Protocol):
+    async def read(self, filter_: ManyAccountFilter) -> list[AccountInfo]: ...
+    async def read_one(self, filter_: AccountFilter) -> AccountInfo | None: ...
+    def stream(self, filter_: AccountFilter) -> AsyncIterator[AccountInfo]: ...
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
@@ -7,6 +8,27 @@ from account.application.models import RefreshSession
 class RefreshSessionGateway(Protocol):
     def add(self, refresh_session: RefreshSession) -> None: ...
     def remove(self, refresh_session: RefreshSession) -> None: ...
-    def with_user_id(self, user_id: UUID) -> RefreshSession | None: ...
+    def with_id(self, user_id: UUID, session_id: UUID) -> RefreshSession | None: ...
+    def active_for(self, user_id: UUID) -> list[RefreshSession]: ...
+    def evict_oldest(self, user_id: UUID, keep: int) -> int: ...
+    def remove_all(self, user_id: UUID) -> int: ...
     def with_refresh_token(self, refresh_token: str) -> RefreshSession | None: ...
     def exists_with_refresh(self, refresh_token: str) -> bool: ...
+    def remove_expired(self, now: datetime, limit: int) -> int: ...
+    def refresh_statistics(self) -> None: ...
+    def create_partitions(self, now: datetime, until: datetime) -> int: ...
+    def drop_expired_partitions(self, now: datetime) -> int: ...
+
+
+class AsyncRefreshSessionGateway(Protocol):
+    def add(self, refresh_session: RefreshSession) -> None: ...
+    async def remove(self, refresh_session: RefreshSession) -> None: ...
+    async def with_id(
+        self, user_id: UUID, session_id: UUID
+    ) -> RefreshSession | None: ...
+    async def active_for(self, user_id: UUID) -> list[RefreshSession]: ...
+    async def evict_oldest(self, user_id: UUID, keep: int) -> int: ...
+    async def remove_all(self, user_id: UUID) -> int: ...
+    async def with_refresh_token(
+        self, refresh_token: str
+    ) -> RefreshSession | None: ...
@@ -1,12 +1,41 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from typing import Protocol
 from uuid import UUID
 
-from account.application.models import User
+from account.application.models import User, UserRole
+from account.application.ports.data.account_reader import AccountFilter
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserChanges:
+    roles: set[UserRole] | None = None
+    is_active: bool | None = None
 
 
 class UserGateway(Protocol):
     def add(self, user: User) -> None: ...
+    def add_many(self, users: Sequence[User]) -> set[str]: ...
     def idenified(self, user_id: UUID) -> User | None: ...
     def named_with(self, username: str) -> User | None: ...
     def exists_named(self, username: str) -> bool: ...
     def exists_identified(self, user_id: UUID) -> bool: ...
+    def existing_usernames(self, usernames: Iterable[str]) -> set[str]: ...
+    def existing_ids(self, user_ids: Iterable[UUID]) -> set[UUID]: ...
+    def update_many(
+        self, filter_: AccountFilter, changes: UserChanges
+    ) -> list[UUID]: ...
+
+
+class AsyncUserGateway(Protocol):
+    def add(self, user: User) -> None: ...
+    async def idenified(self, user_id: UUID) -> User | None: ...
+    async def named_with(self, username: str) -> User | None: ...
+    async def exists_named(self, username: str) -> bool: ...
+    async def exists_identified(self, user_id: UUID) -> bool: ...
+    async def add_many(self, users: Sequence[User]) -> set[str]: ...
+    async def existing_usernames(self, usernames: Iterable[str]) -> set[str]: ...
+    async def existing_ids(self, user_ids: Iterable[UUID]) -> set[UUID]: ...
+    async def update_many(
+        self, filter_: AccountFilter, changes: UserChanges
+    ) -> list[UUID]: ...
@@ -0,0 +1,5 @@
+from typing import Protocol
+
+
+class DistributedLock(Protocol):
+    def try_acquire(self, name: str) -> bool: ...
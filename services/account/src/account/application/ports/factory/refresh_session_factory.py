@@ -1,7 +1,9 @@
+from datetime import datetime
 from typing import Protocol
+from uuid import UUID
 
-from account.application.models import RefreshSession
+from account.application.models import RefreshToken
 
 
 class RefreshSessionFactory(Protocol):
-    def from_refresh_token(self, refresh_token: str) -> RefreshSession: ...
+    def create(self, user_id: UUID, issued_at: datetime) -> RefreshToken: ...
@@ -1,9 +1,12 @@
-from dataclasses import dataclass
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from enum import StrEnum
 from uuid import UUID
 
 from account.application.errors import (
     AuthenticationError,
     AuthorizationError,
+    InvalidSelectionError,
     UserAlreadyDeletedError,
     UserAlreadyExistsError,
     UserNotFoundError,
@@ -11,14 +14,17 @@ from account.application.errors import (
 from account.application.models import UserRole
 from account.application.ports.auth.identity_provider import IdentityProvider
 from account.application.ports.auth.password_service import PasswordService
+from account.application.ports.auth.token_revoker import TokenRevoker
+from account.application.ports.clock import Clock
 from account.application.ports.commitable import Commitable
 from account.application.ports.data.account_reader import (
+    AccountCursor,
     AccountFilter,
     AccountInfo,
     AccountReader,
     ManyAccountFilter,
 )
-from account.application.ports.data.user_gateway import UserGateway
+from account.application.ports.data.user_gateway import UserChanges, UserGateway
 from account.application.ports.factory.user_factory import UserFactory
 
 
@@ -38,22 +44,186 @@ class AccountRequest:
     roles: set[UserRole]
 
 
+class ImportStatus(StrEnum):
+    CREATED = "created"
+    VALID = "valid"
+    CONFLICT = "conflict"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+
+
+@dataclass
+class InvalidImportRow:
+    username: str
+    errors: list[str]
+
+
+type ImportRow = AccountRequest | InvalidImportRow
+
+
+@dataclass
+class ImportRowResult:
+    row: int
+    username: str
+    status: ImportStatus
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ImportReport:
+    dry_run: bool
+    created: int
+    rejected: int
+    rows: list[ImportRowResult]
+
+
+@dataclass
+class AccountSelection:
+    ids: list[UUID] | None = None
+    role: UserRole | None = None
+    name_filter: str | None = None
+
+
+@dataclass
+class BulkUpdateRequest:
+    selection: AccountSelection
+    roles: set[UserRole]
+
+
+@dataclass
+class BulkChangeReport:
+    affected: list[UUID]
+    missing: list[UUID]
+    already_deleted: list[UUID]
+
+
+def selection_filter(
+    selection: AccountSelection, *, only_active: bool
+) -> AccountFilter:
+    by_filter = selection.role is not None or selection.name_filter is not None
+
+    if (selection.ids is None) == (not by_filter):
+        raise InvalidSelectionError("Select accounts either by ids or by filter")
+
+    return AccountFilter(
+        user_ids=selection.ids,
+        role=selection.role,
+        name_filter=selection.name_filter,
+        only_active=only_active,
+    )
+
+
+def unaffected_ids(selection: AccountSelection, affected: list[UUID]) -> list[UUID]:
+    affected_ids = set(affected)
+
+    return [
+        id_ for id_ in dict.fromkeys(selection.ids or ()) if id_ not in affected_ids
+    ]
+
+
+def bulk_change_report(
+    affected: list[UUID], unaffected: list[UUID], existing: set[UUID]
+) -> BulkChangeReport:
+    return BulkChangeReport(
+        affected,
+        missing=[id_ for id_ in unaffected if id_ not in existing],
+        already_deleted=[id_ for id_ in unaffected if id_ in existing],
+    )
+
+
+def screen_import(
+    requests: Sequence[ImportRow], existing_usernames: set[str]
+) -> list[ImportStatus | None]:
+    seen: set[str] = set()
+    statuses: list[ImportStatus | None] = []
+
+    for request in requests:
+        if isinstance(request, InvalidImportRow):
+            statuses.append(ImportStatus.INVALID)
+
+            continue
+
+        if request.username in existing_usernames:
+            statuses.append(ImportStatus.CONFLICT)
+        elif request.username in seen:
+            statuses.append(ImportStatus.DUPLICATE)
+        else:
+            statuses.append(None)
+
+        seen.add(request.username)
+
+    return statuses
+
+
+def import_usernames(requests: Sequence[ImportRow]) -> set[str]:
+    return {
+        request.username
+        for request in requests
+        if isinstance(request, AccountRequest)
+    }
+
+
+def accepted_imports(
+    requests: Sequence[ImportRow], statuses: Sequence[ImportStatus | None]
+) -> list[AccountRequest]:
+    return [
+        request
+        for request, status in zip(requests, statuses, strict=True)
+        if status is None and isinstance(request, AccountRequest)
+    ]
+
+
+def import_report(
+    requests: Sequence[ImportRow],
+    statuses: Sequence[ImportStatus | None],
+    inserted: set[str],
+    *,
+    dry_run: bool,
+) -> ImportReport:
+    rows = []
+
+    for row, (request, status) in enumerate(zip(requests, statuses, strict=True), 1):
+        if status is None and dry_run:
+            status = ImportStatus.VALID
+        elif status is None:
+            status = (
+                ImportStatus.CREATED
+                if request.username in inserted
+                else ImportStatus.CONFLICT
+            )
+
+        errors = request.errors if isinstance(request, InvalidImportRow) else []
+
+        rows.append(ImportRowResult(row, request.username, status, errors))
+
+    created = sum(row.status is ImportStatus.CREATED for row in rows)
+    rejected = sum(
+        row.status not in {ImportStatus.CREATED, ImportStatus.VALID} for row in rows
+    )
+
+    return ImportReport(dry_run, created, rejected, rows)
+
+
 class AccountService:
     def __init__(
         self,
+        clock: Clock,
         commitable: Commitable,
         user_gateway: UserGateway,
         user_factory: UserFactory,
         account_reader: AccountReader,
         password_service: PasswordService,
         identity_provider: IdentityProvider,
+        token_revoker: TokenRevoker,
     ) -> None:
+        self._clock = clock
         self._commitable = commitable
         self._user_gateway = user_gateway
         self._user_factory = user_factory
         self._account_reader = account_reader
         self._password_service = password_service
         self._identity_provider = identity_provider
+        self._token_revoker = token_revoker
 
     def get_me(self) -> AccountInfo:
         user_id = self._identity_provider.user_id()
@@ -77,7 +247,12 @@ class AccountService:
 
         self._commitable.commit()
 
-    def all_accounts(self, from_: int, count: int) -> list[AccountInfo]:
+    def all_accounts(
+        self,
+        from_: int,
+        count: int,
+        after: AccountCursor | None = None,
+    ) -> list[AccountInfo]:
         roles = self._identity_provider.user_roles()
 
         if not any(role == UserRole.ADMIN for role in roles):
@@ -87,9 +262,18 @@ class AccountService:
             from_=from_,
             count=count,
             only_active=False,
+            after=after,
         )
         return self._account_reader.read(filter_)
 
+    def export_accounts(self) -> Iterator[AccountInfo]:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        return self._account_reader.stream(AccountFilter(only_active=False))
+
     def create_account(self, request: AccountRequest) -> None:
         roles = self._identity_provider.user_roles()
 
@@ -113,6 +297,46 @@ class AccountService:
 
         self._commitable.commit()
 
+    def import_accounts(
+        self,
+        requests: Sequence[ImportRow],
+        *,
+        dry_run: bool = False,
+    ) -> ImportReport:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        existing_usernames = self._user_gateway.existing_usernames(
+            import_usernames(requests)
+        )
+        statuses = screen_import(requests, existing_usernames)
+        accepted = accepted_imports(requests, statuses)
+
+        if dry_run or not accepted:
+            return import_report(requests, statuses, set(), dry_run=dry_run)
+
+        password_hashes = self._password_service.hash_many(
+            [request.password for request in accepted]
+        )
+        new_users = [
+            self._user_factory.new_user(
+                request.first_name,
+                request.last_name,
+                request.username,
+                password_hash,
+                request.roles,
+            )
+            for request, password_hash in zip(accepted, password_hashes, strict=True)
+        ]
+
+        inserted = self._user_gateway.add_many(new_users)
+
+        self._commitable.commit()
+
+        return import_report(requests, statuses, inserted, dry_run=dry_run)
+
     def update_account(self, id_: UUID, request: AccountRequest) -> None:
         roles = self._identity_provider.user_roles()
 
@@ -132,6 +356,8 @@ class AccountService:
         user.username = request.username
         user.roles = request.roles
 
+        self._token_revoker.revoke_issued_before(user.id, self._clock.now())
+
         self._commitable.commit()
 
     def delete_account(self, id_: UUID) -> None:
@@ -148,15 +374,56 @@ class AccountService:
         if not user.is_active:
             raise UserAlreadyDeletedError("User already deleted")
 
-        user.is_active = True
+        user.is_active = False
+
+        self._token_revoker.revoke_issued_before(user.id, self._clock.now())
 
         self._commitable.commit()
 
+    def bulk_update_accounts(self, request: BulkUpdateRequest) -> BulkChangeReport:
+        return self._change_accounts(
+            request.selection, UserChanges(roles=request.roles), only_active=False
+        )
+
+    def bulk_delete_accounts(self, selection: AccountSelection) -> BulkChangeReport:
+        return self._change_accounts(
+            selection, UserChanges(is_active=False), only_active=True
+        )
+
+    def _change_accounts(
+        self,
+        selection: AccountSelection,
+        changes: UserChanges,
+        *,
+        only_active: bool,
+    ) -> BulkChangeReport:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        filter_ = selection_filter(selection, only_active=only_active)
+
+        affected = self._user_gateway.update_many(filter_, changes)
+        unaffected = unaffected_ids(selection, affected)
+        existing = (
+            self._user_gateway.existing_ids(unaffected)
+            if only_active and unaffected
+            else set()
+        )
+
+        self._token_revoker.revoke_many_issued_before(affected, self._clock.now())
+
+        self._commitable.commit()
+
+        return bulk_change_report(affected, unaffected, existing)
+
     def all_doctors(
         self,
         from_: int,
         count: int,
         name_filter: str | None = None,
+        after: AccountCursor | None = None,
     ) -> list[AccountInfo]:
         if not self._identity_provider.is_authenticated():
             raise AuthenticationError("Not authenticated")
@@ -166,6 +433,8 @@ class AccountService:
             count=count,
             only_active=True,
             name_filter=name_filter,
+            role=UserRole.DOCTOR,
+            after=after,
         )
         return self._account_reader.read(filter_)
 
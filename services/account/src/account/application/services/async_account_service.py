@@ -0,0 +1,295 @@
+from collections.abc import AsyncIterator, Sequence
+from uuid import UUID
+
+from account.application.errors import (
+    AuthenticationError,
+    AuthorizationError,
+    UserAlreadyDeletedError,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
+from account.application.models import UserRole
+from account.application.ports.auth.identity_provider import AsyncIdentityProvider
+from account.application.ports.auth.password_service import PasswordService
+from account.application.ports.auth.token_revoker import AsyncTokenRevoker
+from account.application.ports.clock import Clock
+from account.application.ports.commitable import AsyncCommitable
+from account.application.ports.data.account_reader import (
+    AccountCursor,
+    AccountFilter,
+    AccountInfo,
+    AsyncAccountReader,
+    ManyAccountFilter,
+)
+from account.application.ports.data.user_gateway import AsyncUserGateway, UserChanges
+from account.application.ports.factory.user_factory import UserFactory
+from account.application.services.account_service import (
+    AccountRequest,
+    AccountSelection,
+    BulkChangeReport,
+    BulkUpdateRequest,
+    ImportReport,
+    ImportRow,
+    UpdateMeRequest,
+    accepted_imports,
+    bulk_change_report,
+    import_report,
+    import_usernames,
+    screen_import,
+    selection_filter,
+    unaffected_ids,
+)
+
+
+class AsyncAccountService:
+    def __init__(
+        self,
+        clock: Clock,
+        commitable: AsyncCommitable,
+        user_gateway: AsyncUserGateway,
+        user_factory: UserFactory,
+        account_reader: AsyncAccountReader,
+        password_service: PasswordService,
+        identity_provider: AsyncIdentityProvider,
+        token_revoker: AsyncTokenRevoker,
+    ) -> None:
+        self._clock = clock
+        self._commitable = commitable
+        self._user_gateway = user_gateway
+        self._user_factory = user_factory
+        self._account_reader = account_reader
+        self._password_service = password_service
+        self._identity_provider = identity_provider
+        self._token_revoker = token_revoker
+
+    async def get_me(self) -> AccountInfo:
+        user_id = self._identity_provider.user_id()
+
+        account = await self._account_reader.read_one(AccountFilter(user_id=user_id))
+
+        if account is None:
+            raise AuthenticationError("Not authenticated")
+
+        return account
+
+    async def update_me(self, request: UpdateMeRequest) -> None:
+        user = await self._identity_provider.user()
+
+        if await self._user_gateway.exists_named(request.username):
+            raise UserAlreadyExistsError("User with this username already exists")
+
+        user.first_name = request.first_name
+        user.last_name = request.last_name
+        user.username = request.username
+
+        await self._commitable.commit()
+
+    async def all_accounts(
+        self,
+        from_: int,
+        count: int,
+        after: AccountCursor | None = None,
+    ) -> list[AccountInfo]:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        filter_ = ManyAccountFilter(
+            from_=from_,
+            count=count,
+            only_active=False,
+            after=after,
+        )
+        return await self._account_reader.read(filter_)
+
+    def export_accounts(self) -> AsyncIterator[AccountInfo]:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        return self._account_reader.stream(AccountFilter(only_active=False))
+
+    async def create_account(self, request: AccountRequest) -> None:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        if await self._user_gateway.exists_named(request.username):
+            raise UserAlreadyExistsError("User with this username already exists")
+
+        password_hash = await self._password_service.hash_async(request.password)
+
+        new_user = self._user_factory.new_user(
+            request.first_name,
+            request.last_name,
+            request.username,
+            password_hash,
+            request.roles,
+        )
+
+        self._user_gateway.add(new_user)
+
+        await self._commitable.commit()
+
+    async def import_accounts(
+        self,
+        requests: Sequence[ImportRow],
+        *,
+        dry_run: bool = False,
+    ) -> ImportReport:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        existing_usernames = await self._user_gateway.existing_usernames(
+            import_usernames(requests)
+        )
+        statuses = screen_import(requests, existing_usernames)
+        accepted = accepted_imports(requests, statuses)
+
+        if dry_run or not accepted:
+            return import_report(requests, statuses, set(), dry_run=dry_run)
+
+        password_hashes = await self._password_service.hash_many_async(
+            [request.password for request in accepted]
+        )
+        new_users = [
+            self._user_factory.new_user(
+                request.first_name,
+                request.last_name,
+                request.username,
+                password_hash,
+                request.roles,
+            )
+            for request, password_hash in zip(accepted, password_hashes, strict=True)
+        ]
+
+        inserted = await self._user_gateway.add_many(new_users)
+
+        await self._commitable.commit()
+
+        return import_report(requests, statuses, inserted, dry_run=dry_run)
+
+    async def update_account(self, id_: UUID, request: AccountRequest) -> None:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        user = await self._user_gateway.idenified(id_)
+
+        if user is None:
+            raise UserNotFoundError("User with this id not found")
+
+        if await self._user_gateway.exists_named(request.username):
+            raise UserAlreadyExistsError("User with this username already exists")
+
+        user.first_name = request.first_name
+        user.last_name = request.last_name
+        user.username = request.username
+        user.roles = request.roles
+
+        await self._token_revoker.revoke_issued_before(user.id, self._clock.now())
+
+        await self._commitable.commit()
+
+    async def delete_account(self, id_: UUID) -> None:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        user = await self._user_gateway.idenified(id_)
+
+        if user is None:
+            raise UserNotFoundError("User with this id not found")
+
+        if not user.is_active:
+            raise UserAlreadyDeletedError("User already deleted")
+
+        user.is_active = False
+
+        await self._token_revoker.revoke_issued_before(user.id, self._clock.now())
+
+        await self._commitable.commit()
+
+    async def bulk_update_accounts(
+        self, request: BulkUpdateRequest
+    ) -> BulkChangeReport:
+        return await self._change_accounts(
+            request.selection, UserChanges(roles=request.roles), only_active=False
+        )
+
+    async def bulk_delete_accounts(
+        self, selection: AccountSelection
+    ) -> BulkChangeReport:
+        return await self._change_accounts(
+            selection, UserChanges(is_active=False), only_active=True
+        )
+
+    async def _change_accounts(
+        self,
+        selection: AccountSelection,
+        changes: UserChanges,
+        *,
+        only_active: bool,
+    ) -> BulkChangeReport:
+        roles = self._identity_provider.user_roles()
+
+        if not any(role == UserRole.ADMIN for role in roles):
+            raise AuthorizationError("Access denied")
+
+        filter_ = selection_filter(selection, only_active=only_active)
+
+        affected = await self._user_gateway.update_many(filter_, changes)
+        unaffected = unaffected_ids(selection, affected)
+        existing = (
+            await self._user_gateway.existing_ids(unaffected)
+            if only_active and unaffected
+            else set()
+        )
+
+        await self._token_revoker.revoke_many_issued_before(
+            affected, self._clock.now()
+        )
+
+        await self._commitable.commit()
+
+        return bulk_change_report(affected, unaffected, existing)
+
+    async def all_doctors(
+        self,
+        from_: int,
+        count: int,
+        name_filter: str | None = None,
+        after: AccountCursor | None = None,
+    ) -> list[AccountInfo]:
+        if not self._identity_provider.is_authenticated():
+            raise AuthenticationError("Not authenticated")
+
+        filter_ = ManyAccountFilter(
+            from_=from_,
+            count=count,
+            only_active=True,
+            name_filter=name_filter,
+            role=UserRole.DOCTOR,
+            after=after,
+        )
+        return await self._account_reader.read(filter_)
+
+    async def doctor_identified(self, id_: UUID) -> AccountInfo:
+        if not self._identity_provider.is_authenticated():
+            raise AuthenticationError("Not authenticated")
+
+        filter_ = AccountFilter(user_id=id_, only_active=True, role=UserRole.DOCTOR)
+
+        account = await self._account_reader.read_one(filter_)
+
+        if account is None:
+            raise UserNotFoundError("User with this id not found")
+
+        return account
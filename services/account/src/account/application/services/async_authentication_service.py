@@ -0,0 +1,200 @@
+from collections.abc import Sequence
+
+from account.application.errors import (
+    AuthenticationError,
+    InvalidTokenError,
+    UserAlreadyExistsError,
+)
+from account.application.models import JwtToken, User
+from account.application.policies import SessionPolicy
+from account.application.ports.auth.identity_provider import AsyncIdentityProvider
+from account.application.ports.auth.jwt_token_provider import (
+    JwtTokenProvider,
+    TokenPayload,
+)
+from account.application.ports.auth.password_service import PasswordService
+from account.application.ports.auth.token_revoker import AsyncTokenRevoker
+from account.application.ports.clock import Clock
+from account.application.ports.commitable import AsyncCommitable
+from account.application.ports.data.refresh_session_gateway import (
+    AsyncRefreshSessionGateway,
+)
+from account.application.ports.data.user_gateway import AsyncUserGateway
+from account.application.ports.factory.refresh_session_factory import (
+    RefreshSessionFactory,
+)
+from account.application.ports.factory.user_factory import UserFactory
+from account.application.services.authentication_service import (
+    CredentialsResponse,
+    SessionInfo,
+    SignInRequest,
+    SignUpRequest,
+    TokenValidationResult,
+)
+
+
+class AsyncAuthenticationService:
+    def __init__(
+        self,
+        clock: Clock,
+        commitable: AsyncCommitable,
+        user_factory: UserFactory,
+        user_gateway: AsyncUserGateway,
+        password_service: PasswordService,
+        identity_provider: AsyncIdentityProvider,
+        jwt_token_provider: JwtTokenProvider,
+        refresh_session_factory: RefreshSessionFactory,
+        refresh_session_gateway: AsyncRefreshSessionGateway,
+        session_policy: SessionPolicy,
+        token_revoker: AsyncTokenRevoker,
+    ) -> None:
+        self._clock = clock
+        self._commitable = commitable
+        self._user_factory = user_factory
+        self._user_gateway = user_gateway
+        self._password_service = password_service
+        self._identity_provider = identity_provider
+        self._jwt_token_provider = jwt_token_provider
+        self._refresh_session_factory = refresh_session_factory
+        self._refresh_session_gateway = refresh_session_gateway
+        self._session_policy = session_policy
+        self._token_revoker = token_revoker
+
+    async def sign_up(self, request: SignUpRequest) -> None:
+        if await self._user_gateway.exists_named(request.username):
+            raise UserAlreadyExistsError("User with this username already exists")
+
+        password_hash = await self._password_service.hash_async(request.password)
+
+        new_user = self._user_factory.standart_user(
+            request.first_name,
+            request.last_name,
+            request.username,
+            password_hash,
+        )
+
+        self._user_gateway.add(new_user)
+
+        await self._commitable.commit()
+
+    def _issue_credentials(self, user: User) -> CredentialsResponse:
+        issued_at = self._clock.now()
+        token_payload = TokenPayload(user_id=user.id, roles=user.roles)
+        refresh_token = self._refresh_session_factory.create(user.id, issued_at)
+
+        access_token = self._jwt_token_provider.create_access_token(
+            token_payload, issued_at, session_id=refresh_token.session.id
+        )
+
+        self._refresh_session_gateway.add(refresh_token.session)
+
+        return CredentialsResponse(access_token.value, refresh_token.value)
+
+    async def sign_in(self, request: SignInRequest) -> CredentialsResponse:
+        user = await self._user_gateway.named_with(request.username)
+
+        if user is None:
+            raise AuthenticationError("Wrong username or password")
+
+        if not await self._password_service.verify_async(
+            request.password, user.password_hash
+        ):
+            raise AuthenticationError("Wrong username or password")
+
+        if self._password_service.needs_rehash(user.password_hash):
+            user.password_hash = await self._password_service.hash_async(
+                request.password
+            )
+
+        await self._refresh_session_gateway.evict_oldest(
+            user.id, keep=self._session_policy.max_sessions_per_user - 1
+        )
+
+        credentials = self._issue_credentials(user)
+
+        await self._commitable.commit()
+
+        return credentials
+
+    async def sign_out(self) -> None:
+        access_token = self._identity_provider.access_token()
+
+        await self._token_revoker.revoke(access_token)
+
+        if access_token.session_id is not None:
+            refresh_session = await self._refresh_session_gateway.with_id(
+                access_token.payload.user_id, access_token.session_id
+            )
+
+            if refresh_session is not None:
+                await self._refresh_session_gateway.remove(refresh_session)
+
+        await self._commitable.commit()
+
+    async def sign_out_everywhere(self) -> None:
+        user_id = self._identity_provider.user_id()
+
+        await self._refresh_session_gateway.remove_all(user_id)
+        await self._token_revoker.revoke_issued_before(user_id, self._clock.now())
+
+        await self._commitable.commit()
+
+    async def active_sessions(self) -> list[SessionInfo]:
+        user_id = self._identity_provider.user_id()
+
+        return [
+            SessionInfo(
+                id=refresh_session.id,
+                created_at=refresh_session.created_at,
+                expires_in=refresh_session.expires_in,
+            )
+            for refresh_session in await self._refresh_session_gateway.active_for(
+                user_id
+            )
+        ]
+
+    def introspect(self, access_token: str) -> JwtToken:
+        return self._jwt_token_provider.validate(access_token)
+
+    def validate(self, access_token: str) -> TokenPayload:
+        jwt_token = self.introspect(access_token)
+
+        return jwt_token.payload
+
+    def validate_many(
+        self, access_tokens: Sequence[str]
+    ) -> list[TokenValidationResult]:
+        results = []
+
+        for access_token in access_tokens:
+            try:
+                payload = self.validate(access_token)
+
+            except InvalidTokenError as e:
+                results.append(TokenValidationResult(error=str(e)))
+
+            else:
+                results.append(TokenValidationResult(payload=payload))
+
+        return results
+
+    async def refresh(self, refresh_token: str) -> CredentialsResponse:
+        refresh_session = await self._refresh_session_gateway.with_refresh_token(
+            refresh_token
+        )
+
+        if refresh_session is None or refresh_session.expires_in < self._clock.now():
+            raise InvalidTokenError("Invalid refresh token")
+
+        await self._refresh_session_gateway.remove(refresh_session)
+
+        user = await self._user_gateway.idenified(refresh_session.user_id)
+
+        if user is None:
+            raise InvalidTokenError("Invalid refresh token")
+
+        credentials = self._issue_credentials(user)
+
+        await self._commitable.commit()
+
+        return credentials
@@ -1,16 +1,22 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
 
 from account.application.errors import (
     AuthenticationError,
     InvalidTokenError,
     UserAlreadyExistsError,
 )
+from account.application.models import JwtToken, User
+from account.application.policies import SessionPolicy
 from account.application.ports.auth.identity_provider import IdentityProvider
 from account.application.ports.auth.jwt_token_provider import (
     JwtTokenProvider,
     TokenPayload,
 )
 from account.application.ports.auth.password_service import PasswordService
+from account.application.ports.auth.token_revoker import TokenRevoker
 from account.application.ports.clock import Clock
 from account.application.ports.commitable import Commitable
 from account.application.ports.data.refresh_session_gateway import (
@@ -43,6 +49,19 @@ class CredentialsResponse:
     refresh_token: str
 
 
+@dataclass
+class TokenValidationResult:
+    payload: TokenPayload | None = None
+    error: str | None = None
+
+
+@dataclass
+class SessionInfo:
+    id: UUID
+    created_at: datetime
+    expires_in: datetime
+
+
 class AuthenticationService:
     def __init__(
         self,
@@ -55,6 +74,8 @@ class AuthenticationService:
         jwt_token_provider: JwtTokenProvider,
         refresh_session_factory: RefreshSessionFactory,
         refresh_session_gateway: RefreshSessionGateway,
+        session_policy: SessionPolicy,
+        token_revoker: TokenRevoker,
     ) -> None:
         self._clock = clock
         self._commitable = commitable
@@ -65,6 +86,8 @@ class AuthenticationService:
         self._jwt_token_provider = jwt_token_provider
         self._refresh_session_factory = refresh_session_factory
         self._refresh_session_gateway = refresh_session_gateway
+        self._session_policy = session_policy
+        self._token_revoker = token_revoker
 
     def sign_up(self, request: SignUpRequest) -> None:
         if self._user_gateway.exists_named(request.username):
@@ -83,6 +106,19 @@ class AuthenticationService:
 
         self._commitable.commit()
 
+    def _issue_credentials(self, user: User) -> CredentialsResponse:
+        issued_at = self._clock.now()
+        token_payload = TokenPayload(user_id=user.id, roles=user.roles)
+        refresh_token = self._refresh_session_factory.create(user.id, issued_at)
+
+        access_token = self._jwt_token_provider.create_access_token(
+            token_payload, issued_at, session_id=refresh_token.session.id
+        )
+
+        self._refresh_session_gateway.add(refresh_token.session)
+
+        return CredentialsResponse(access_token.value, refresh_token.value)
+
     def sign_in(self, request: SignInRequest) -> CredentialsResponse:
         user = self._user_gateway.named_with(request.username)
 
@@ -92,44 +128,85 @@ class AuthenticationService:
         if not self._password_service.verify(request.password, user.password_hash):
             raise AuthenticationError("Wrong username or password")
 
-        token_payload = TokenPayload(user_id=user.id, roles=user.roles)
+        if self._password_service.needs_rehash(user.password_hash):
+            user.password_hash = self._password_service.hash(request.password)
 
-        access_token = self._jwt_token_provider.create_access_token(token_payload)
-        refresh_token = self._jwt_token_provider.create_refresh_token(token_payload)
-
-        refresh_session = self._refresh_session_factory.from_refresh_token(
-            refresh_token.value
+        self._refresh_session_gateway.evict_oldest(
+            user.id, keep=self._session_policy.max_sessions_per_user - 1
         )
 
-        self._refresh_session_gateway.add(refresh_session)
+        credentials = self._issue_credentials(user)
 
         self._commitable.commit()
 
-        return CredentialsResponse(access_token.value, refresh_token.value)
+        return credentials
 
     def sign_out(self) -> None:
-        user_id = self._identity_provider.user_id()
+        access_token = self._identity_provider.access_token()
 
-        refresh_session = self._refresh_session_gateway.with_user_id(user_id)
+        self._token_revoker.revoke(access_token)
 
-        if refresh_session is None or refresh_session.expires_in < self._clock.now():
-            return
+        if access_token.session_id is not None:
+            refresh_session = self._refresh_session_gateway.with_id(
+                access_token.payload.user_id, access_token.session_id
+            )
 
-        self._refresh_session_gateway.remove(refresh_session)
+            if refresh_session is not None:
+                self._refresh_session_gateway.remove(refresh_session)
 
         self._commitable.commit()
 
+    def sign_out_everywhere(self) -> None:
+        user_id = self._identity_provider.user_id()
+
+        self._refresh_session_gateway.remove_all(user_id)
+        self._token_revoker.revoke_issued_before(user_id, self._clock.now())
+
+        self._commitable.commit()
+
+    def active_sessions(self) -> list[SessionInfo]:
+        user_id = self._identity_provider.user_id()
+
+        return [
+            SessionInfo(
+                id=refresh_session.id,
+                created_at=refresh_session.created_at,
+                expires_in=refresh_session.expires_in,
+            )
+            for refresh_session in self._refresh_session_gateway.active_for(user_id)
+        ]
+
+    def introspect(self, access_token: str) -> JwtToken:
+        return self._jwt_token_provider.validate(access_token)
+
     def validate(self, access_token: str) -> TokenPayload:
-        jwt_token = self._jwt_token_provider.validate(access_token)
+        jwt_token = self.introspect(access_token)
 
         return jwt_token.payload
 
+    def validate_many(
+        self, access_tokens: Sequence[str]
+    ) -> list[TokenValidationResult]:
+        results = []
+
+        for access_token in access_tokens:
+            try:
+                payload = self.validate(access_token)
+
+            except InvalidTokenError as e:
+                results.append(TokenValidationResult(error=str(e)))
+
+            else:
+                results.append(TokenValidationResult(payload=payload))
+
+        return results
+
     def refresh(self, refresh_token: str) -> CredentialsResponse:
         refresh_session = self._refresh_session_gateway.with_refresh_token(
             refresh_token
         )
 
-        if refresh_session is None:
+        if refresh_session is None or refresh_session.expires_in < self._clock.now():
             raise InvalidTokenError("Invalid refresh token")
 
         self._refresh_session_gateway.remove(refresh_session)
@@ -139,21 +216,8 @@ class AuthenticationService:
         if user is None:
             raise InvalidTokenError("Invalid refresh token")
 
-        token_payload = TokenPayload(user_id=user.id, roles=user.roles)
-
-        new_access_token = self._jwt_token_provider.create_access_token(
-            token_payload
-        )
-        new_refresh_token = self._jwt_token_provider.create_refresh_token(
-            token_payload
-        )
-
-        refresh_session = self._refresh_session_factory.from_refresh_token(
-            new_refresh_token.value
-        )
-
-        self._refresh_session_gateway.add(refresh_session)
+        credentials = self._issue_credentials(user)
 
         self._commitable.commit()
 
-        return CredentialsResponse(new_access_token.value, new_refresh_token.value)
+        return credentials
@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+from account.application.ports.auth.token_revoker import TokenRevoker
+from account.application.ports.clock import Clock
+from account.application.ports.commitable import Commitable
+from account.application.ports.data.refresh_session_gateway import (
+    RefreshSessionGateway,
+)
+from account.application.ports.distributed_lock import DistributedLock
+
+MAINTENANCE_LOCK_NAME = "account-maintenance"
+
+
+@dataclass
+class PartitionsReport:
+    created: int = 0
+    dropped: int = 0
+
+
+class MaintenanceService:
+    def __init__(
+        self,
+        clock: Clock,
+        commitable: Commitable,
+        distributed_lock: DistributedLock,
+        refresh_session_gateway: RefreshSessionGateway,
+        token_revoker: TokenRevoker,
+    ) -> None:
+        self._clock = clock
+        self._commitable = commitable
+        self._distributed_lock = distributed_lock
+        self._refresh_session_gateway = refresh_session_gateway
+        self._token_revoker = token_revoker
+
+    def purge_expired_sessions(self, batch_size: int, max_batches: int) -> int:
+        reclaimed = 0
+
+        for _ in range(max_batches):
+            if not self._distributed_lock.try_acquire(MAINTENANCE_LOCK_NAME):
+                break
+
+            removed = self._refresh_session_gateway.remove_expired(
+                self._clock.now(), batch_size
+            )
+
+            self._commitable.commit()
+
+            reclaimed += removed
+
+            if removed < batch_size:
+                break
+
+        if reclaimed:
+            self._refresh_session_gateway.refresh_statistics()
+
+            self._commitable.commit()
+
+        return reclaimed
+
+    def purge_expired_revocations(self, batch_size: int, max_batches: int) -> int:
+        reclaimed = 0
+
+        for _ in range(max_batches):
+            if not self._distributed_lock.try_acquire(MAINTENANCE_LOCK_NAME):
+                break
+
+            removed = self._token_revoker.remove_expired(
+                self._clock.now(), batch_size
+            )
+
+            self._commitable.commit()
+
+            reclaimed += removed
+
+            if removed < batch_size:
+                break
+
+        return reclaimed
+
+    def rotate_partitions(self, lookahead: timedelta) -> PartitionsReport:
+        if not self._distributed_lock.try_acquire(MAINTENANCE_LOCK_NAME):
+            return PartitionsReport()
+
+        now = self._clock.now()
+
+        report = PartitionsReport(
+            created=self._refresh_session_gateway.create_partitions(
+                now, now + lookahead
+            ),
+        )
+
+        self._commitable.commit()
+
+        if not self._distributed_lock.try_acquire(MAINTENANCE_LOCK_NAME):
+            return report
+
+        report.dropped = self._refresh_session_gateway.drop_expired_partitions(now)
+
+        self._commitable.commit()
+
+        return report
@@ -1,36 +1,228 @@
-from datetime import timedelta
-from os import environ
+import json
+from datetime import UTC, datetime, timedelta
+from os import cpu_count, environ
+from pathlib import Path
+from tempfile import gettempdir
 
 from fastapi import FastAPI
 
-from account.infrastructure.auth.auth_config import AuthConfig
+from account.application.models import UserRole
+from account.application.policies import SessionPolicy
+from account.infrastructure.auth.auth_config import AuthConfig, SigningKey
+from account.infrastructure.auth.hashing_config import HashingConfig
+from account.infrastructure.auth.password_pool_config import PasswordPoolConfig
+from account.infrastructure.directory_config import DirectoryConfig
+from account.infrastructure.maintenance_config import MaintenanceConfig
 from account.infrastructure.persistence.map import setup_mappers
-from account.infrastructure.providers import ConnectionString, setup_container
-from account.presentation.dishka import setup_dishka
+from account.infrastructure.pool_config import PoolConfig
+from account.infrastructure.providers import (
+    ConnectionString,
+    setup_async_container,
+    setup_container,
+)
+from account.infrastructure.replica_config import ReplicaConfig
+from account.infrastructure.seed_config import (
+    DEFAULT_SEED_ACCOUNTS,
+    SeedAccount,
+    SeedConfig,
+)
+from account.presentation.crypto_operations import setup_crypto_operations
+from account.presentation.directory_sync import setup_directory_sync
+from account.presentation.dishka import setup_async_dishka, setup_dishka
 from account.presentation.event_handlers import setup_event_handlers
 from account.presentation.exception_handlers import setup_exception_handlers
+from account.presentation.maintenance import setup_maintenance
 from account.presentation.models import Message
+from account.presentation.password_threads import setup_password_threads
+from account.presentation.revocation_sync import setup_revocation_sync
 from account.presentation.routers import (
     account_router,
+    async_account_router,
+    async_authentication_router,
+    async_doctor_router,
     authentication_router,
     doctor_router,
+    metrics_router,
+    well_known_router,
 )
 
 
+def _aware_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+
+    return value.astimezone(UTC)
+
+
+def get_signing_keys() -> tuple[SigningKey, ...]:
+    if "JWT_KEYSET_FILE" not in environ:
+        return ()
+
+    raw_keys = json.loads(Path(environ["JWT_KEYSET_FILE"]).read_text())
+
+    return tuple(
+        SigningKey(
+            kid=key["kid"],
+            public_key=key["public_key"],
+            private_key=key.get("private_key"),
+            not_after=(
+                _aware_utc(datetime.fromisoformat(key["not_after"]))
+                if key.get("not_after")
+                else None
+            ),
+        )
+        for key in raw_keys
+    )
+
+
 def get_auth_config() -> AuthConfig:
     return AuthConfig(
-        jwt_secret=environ["JWT_SECRET"],
+        jwt_secret=environ.get("JWT_SECRET", ""),
         access_expiration=timedelta(seconds=int(environ["ACCESS_TOKEN_EXPIRATION"])),
         refresh_expiration=timedelta(
             seconds=int(environ["REFRESH_TOKEN_EXPIRATION"])
         ),
+        token_cache_size=int(environ.get("TOKEN_CACHE_SIZE", "4096")),
+        token_cache_ttl=timedelta(seconds=int(environ.get("TOKEN_CACHE_TTL", "60"))),
+        jwt_algorithm=environ.get("JWT_ALGORITHM", "HS256"),
+        signing_keys=get_signing_keys(),
+        signing_key_id=environ.get("JWT_SIGNING_KEY_ID"),
+        jwks_max_age=timedelta(seconds=int(environ.get("JWKS_MAX_AGE", "300"))),
+        revocation_horizon=timedelta(
+            seconds=int(environ.get("REVOCATION_HORIZON", "60"))
+        ),
+        revocation_channel=environ.get("REVOCATION_CHANNEL", "postgres"),
+    )
+
+
+def get_password_pool_config() -> PasswordPoolConfig:
+    workers = int(environ.get("PASSWORD_POOL_WORKERS", cpu_count() or 1))
+
+    return PasswordPoolConfig(
+        workers=workers,
+        max_in_flight=int(
+            environ.get("PASSWORD_POOL_MAX_IN_FLIGHT", max(workers, 1) * 2)
+        ),
+        queue_timeout=timedelta(
+            seconds=float(environ.get("PASSWORD_POOL_QUEUE_TIMEOUT", "5"))
+        ),
+    )
+
+
+def get_hashing_config() -> HashingConfig:
+    rounds_cache = environ.get(
+        "PASSWORD_HASH_ROUNDS_FILE",
+        str(Path(gettempdir()) / "account-password-hash-rounds.json"),
     )
 
+    return HashingConfig(
+        scheme=environ.get("PASSWORD_HASH_SCHEME", "bcrypt"),
+        verify_budget=timedelta(
+            milliseconds=int(environ.get("PASSWORD_VERIFY_BUDGET_MS", "250"))
+        ),
+        rounds=(
+            int(environ["PASSWORD_HASH_ROUNDS"])
+            if "PASSWORD_HASH_ROUNDS" in environ
+            else None
+        ),
+        rounds_cache=Path(rounds_cache) if rounds_cache else None,
+    )
+
+
+def get_seed_config() -> SeedConfig:
+    if "SEED_ACCOUNTS_FILE" in environ:
+        raw_accounts = Path(environ["SEED_ACCOUNTS_FILE"]).read_text()
+    elif "SEED_ACCOUNTS" in environ:
+        raw_accounts = environ["SEED_ACCOUNTS"]
+    else:
+        return SeedConfig(DEFAULT_SEED_ACCOUNTS)
+
+    accounts = tuple(
+        SeedAccount(
+            first_name=account["first_name"],
+            last_name=account["last_name"],
+            username=account["username"],
+            password=account["password"],
+            roles=frozenset(UserRole(role) for role in account["roles"]),
+        )
+        for account in json.loads(raw_accounts)
+    )
+
+    return SeedConfig(accounts)
+
+
+def get_maintenance_config(auth_config: AuthConfig) -> MaintenanceConfig:
+    partition_margin = timedelta(
+        days=int(environ.get("MAINTENANCE_PARTITION_MARGIN_DAYS", "2"))
+    )
+
+    return MaintenanceConfig(
+        enabled=environ.get("MAINTENANCE_ENABLED", "true").lower() == "true",
+        interval=timedelta(seconds=int(environ.get("MAINTENANCE_INTERVAL", "300"))),
+        batch_size=int(environ.get("MAINTENANCE_BATCH_SIZE", "1000")),
+        max_batches=int(environ.get("MAINTENANCE_MAX_BATCHES", "100")),
+        partition_lookahead=auth_config.refresh_expiration + partition_margin,
+    )
+
+
+def get_session_policy() -> SessionPolicy:
+    max_sessions_per_user = int(environ.get("MAX_SESSIONS_PER_USER", "5"))
+
+    if max_sessions_per_user < 1:
+        raise ValueError(
+            f"MAX_SESSIONS_PER_USER must be at least 1: {max_sessions_per_user}"
+        )
+
+    return SessionPolicy(max_sessions_per_user=max_sessions_per_user)
+
 
 def get_db_connection_string() -> ConnectionString:
     return environ["DB_CONNECTION_STRING"]
 
 
+def get_pool_config() -> PoolConfig:
+    recycle = int(environ.get("DB_POOL_RECYCLE", "1800"))
+
+    return PoolConfig(
+        size=int(environ.get("DB_POOL_SIZE", "5")),
+        max_overflow=int(environ.get("DB_POOL_MAX_OVERFLOW", "10")),
+        pre_ping=environ.get("DB_POOL_PRE_PING", "true").lower() == "true",
+        recycle=timedelta(seconds=recycle) if recycle >= 0 else None,
+        timeout=timedelta(seconds=float(environ.get("DB_POOL_TIMEOUT", "30"))),
+    )
+
+
+def get_replica_config() -> ReplicaConfig:
+    return ReplicaConfig(
+        connection_string=environ.get("DB_REPLICA_CONNECTION_STRING") or None,
+        read_your_writes=timedelta(
+            seconds=float(environ.get("DB_REPLICA_READ_YOUR_WRITES", "5"))
+        ),
+        lag_probe_interval=timedelta(
+            seconds=float(environ.get("DB_REPLICA_LAG_PROBE_INTERVAL", "10"))
+        ),
+    )
+
+
+def get_directory_config() -> DirectoryConfig:
+    return DirectoryConfig(
+        cache_size=int(environ.get("DOCTOR_DIRECTORY_CACHE_SIZE", "1024")),
+        cache_ttl=timedelta(
+            seconds=float(environ.get("DOCTOR_DIRECTORY_CACHE_TTL", "300"))
+        ),
+        channel=environ.get("DOCTOR_DIRECTORY_CHANNEL", "postgres"),
+    )
+
+
+def get_persistence_mode() -> str:
+    persistence_mode = environ.get("PERSISTENCE_MODE", "sync")
+
+    if persistence_mode not in {"sync", "async"}:
+        raise ValueError(f"Unknown persistence mode: {persistence_mode}")
+
+    return persistence_mode
+
+
 def bootstrap() -> FastAPI:
     app = FastAPI(
         root_path="/api",
@@ -43,22 +235,57 @@ def bootstrap() -> FastAPI:
         title="Микросервис аккаунтов платформы Simbir.Health",
     )
 
-    app.include_router(account_router)
-    app.include_router(authentication_router)
-    app.include_router(doctor_router)
+    persistence_mode = get_persistence_mode()
+
+    if persistence_mode == "async":
+        app.include_router(async_account_router)
+        app.include_router(async_authentication_router)
+        app.include_router(async_doctor_router)
+    else:
+        app.include_router(account_router)
+        app.include_router(authentication_router)
+        app.include_router(doctor_router)
+
+    app.include_router(metrics_router)
+    app.include_router(well_known_router)
 
     auth_config = get_auth_config()
+    password_pool_config = get_password_pool_config()
+    hashing_config = get_hashing_config()
+    seed_config = get_seed_config()
+    maintenance_config = get_maintenance_config(auth_config)
+    session_policy = get_session_policy()
     db_connection_string = get_db_connection_string()
+    pool_config = get_pool_config()
+    replica_config = get_replica_config()
+    directory_config = get_directory_config()
 
     context = {
         AuthConfig: auth_config,
+        PasswordPoolConfig: password_pool_config,
+        HashingConfig: hashing_config,
+        SeedConfig: seed_config,
+        MaintenanceConfig: maintenance_config,
+        SessionPolicy: session_policy,
         ConnectionString: db_connection_string,
+        PoolConfig: pool_config,
+        ReplicaConfig: replica_config,
+        DirectoryConfig: directory_config,
     }
     container = setup_container(context)
 
     setup_mappers()
     setup_event_handlers(app)
+    setup_maintenance(app)
+    setup_revocation_sync(app)
+    setup_directory_sync(app)
+    setup_password_threads(app)
     setup_dishka(app, container)
+
+    if persistence_mode == "async":
+        setup_async_dishka(app, setup_async_container(context, container))
+
+    setup_crypto_operations(app)
     setup_exception_handlers(app)
 
     return app
@@ -1,5 +1,13 @@
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
+
+
+@dataclass(frozen=True, kw_only=True)
+class SigningKey:
+    kid: str
+    public_key: str
+    private_key: str | None = None
+    not_after: datetime | None = None
 
 
 @dataclass(frozen=True)
@@ -7,3 +15,11 @@ class AuthConfig:
     jwt_secret: str
     access_expiration: timedelta
     refresh_expiration: timedelta
+    token_cache_size: int = 4096
+    token_cache_ttl: timedelta = timedelta(seconds=60)
+    jwt_algorithm: str = "HS256"
+    signing_keys: tuple[SigningKey, ...] = ()
+    signing_key_id: str | None = None
+    jwks_max_age: timedelta = timedelta(minutes=5)
+    revocation_horizon: timedelta = timedelta(seconds=60)
+    revocation_channel: str = "postgres"
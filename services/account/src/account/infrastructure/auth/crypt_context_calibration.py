@@ -0,0 +1,148 @@
+import fcntl
+import json
+from dataclasses import dataclass
+from datetime import timedelta
+from math import floor, log2
+from time import perf_counter
+from typing import Any
+
+from passlib.context import CryptContext
+from passlib.registry import get_crypt_handler
+
+from account.infrastructure.auth.hashing_config import HashingConfig
+
+SUPPORTED_SCHEMES = ("bcrypt", "pbkdf2_sha256", "argon2")
+
+_CALIBRATION_SECRET = "calibration-secret"  # noqa: S105
+_SAMPLES = 3
+
+
+@dataclass(frozen=True)
+class _RoundsModel:
+    probe: int
+    logarithmic: bool
+
+
+_ROUNDS_MODELS = {
+    "bcrypt": _RoundsModel(probe=8, logarithmic=True),
+    "pbkdf2_sha256": _RoundsModel(probe=20_000, logarithmic=False),
+    "argon2": _RoundsModel(probe=2, logarithmic=False),
+}
+
+
+def _verify_time(scheme: str, rounds: int) -> float:
+    handler = get_crypt_handler(scheme).using(rounds=rounds)
+    password_hash = handler.hash(_CALIBRATION_SECRET)
+    timings = []
+
+    for _ in range(_SAMPLES):
+        started_at = perf_counter()
+        handler.verify(_CALIBRATION_SECRET, password_hash)
+        timings.append(perf_counter() - started_at)
+
+    return min(timings)
+
+
+def _estimate_rounds(scheme: str, budget: float) -> int:
+    model = _ROUNDS_MODELS[scheme]
+    probe_time = _verify_time(scheme, model.probe)
+
+    if model.logarithmic:
+        return model.probe + floor(log2(budget / probe_time))
+
+    return floor(model.probe * budget / probe_time)
+
+
+def _supported_handler(scheme: str) -> Any:
+    if scheme not in SUPPORTED_SCHEMES:
+        raise ValueError(f"Unsupported password hash scheme {scheme}")
+
+    return get_crypt_handler(scheme)
+
+
+def calibrate_rounds(hashing_config: HashingConfig) -> int:
+    handler = _supported_handler(hashing_config.scheme)
+    budget = hashing_config.verify_budget.total_seconds()
+
+    rounds = _estimate_rounds(hashing_config.scheme, budget)
+    rounds = max(handler.min_rounds, min(rounds, handler.max_rounds))
+
+    if _ROUNDS_MODELS[hashing_config.scheme].logarithmic:
+        while (
+            rounds > handler.min_rounds
+            and _verify_time(hashing_config.scheme, rounds) > budget
+        ):
+            rounds -= 1
+
+    return rounds
+
+
+def _cache_key(hashing_config: HashingConfig) -> str:
+    budget_ms = hashing_config.verify_budget // timedelta(milliseconds=1)
+
+    return f"{hashing_config.scheme}:{budget_ms}"
+
+
+def _cached_rounds(hashing_config: HashingConfig) -> int:
+    if hashing_config.rounds_cache is None:
+        return calibrate_rounds(hashing_config)
+
+    key = _cache_key(hashing_config)
+
+    with hashing_config.rounds_cache.open("a+") as cache_file:
+        fcntl.flock(cache_file, fcntl.LOCK_EX)
+        cache_file.seek(0)
+
+        try:
+            cached_rounds = json.loads(cache_file.read() or "{}")
+        except json.JSONDecodeError:
+            cached_rounds = {}
+
+        if key not in cached_rounds:
+            cached_rounds[key] = calibrate_rounds(hashing_config)
+
+            cache_file.seek(0)
+            cache_file.truncate()
+            json.dump(cached_rounds, cache_file)
+
+        return cached_rounds[key]
+
+
+def configured_rounds(hashing_config: HashingConfig) -> int:
+    handler = _supported_handler(hashing_config.scheme)
+
+    if hashing_config.rounds is None:
+        return _cached_rounds(hashing_config)
+
+    if not handler.min_rounds <= hashing_config.rounds <= handler.max_rounds:
+        raise ValueError(
+            f"Password hash rounds for {hashing_config.scheme} must be between "
+            f"{handler.min_rounds} and {handler.max_rounds}"
+        )
+
+    return hashing_config.rounds
+
+
+def calibrated_crypt_context(
+    hashing_config: HashingConfig, rounds: int
+) -> CryptContext:
+    scheme = hashing_config.scheme
+    handler = get_crypt_handler(scheme)
+
+    if _ROUNDS_MODELS[scheme].logarithmic:
+        min_rounds = max(handler.min_rounds, rounds - 1)
+        max_rounds = min(handler.max_rounds, rounds + 1)
+    else:
+        min_rounds = max(1, floor(rounds * (1 - hashing_config.rounds_tolerance)))
+        max_rounds = floor(rounds * (1 + hashing_config.rounds_tolerance))
+
+    return CryptContext(
+        schemes=[scheme, *(s for s in SUPPORTED_SCHEMES if s != scheme)],
+        default=scheme,
+        deprecated="auto",
+        **{
+            f"{scheme}__default_rounds": rounds,
+            f"{scheme}__min_rounds": min_rounds,
+            f"{scheme}__max_rounds": max_rounds,
+        },
+    )
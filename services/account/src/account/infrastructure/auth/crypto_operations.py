@@ -0,0 +1,62 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from account.infrastructure.metrics import MetricsRegistry
+
+OPERATIONS_PER_REQUEST_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 100, 500)
+
+
+@dataclass(slots=True)
+class CryptoOperations:
+    signs: int = 0
+    verifications: int = 0
+
+
+_current_operations: ContextVar[CryptoOperations | None] = ContextVar(
+    "crypto_operations", default=None
+)
+
+
+class CryptoOperationsRecorder:
+    def __init__(self, metrics: MetricsRegistry) -> None:
+        self._signs = metrics.counter("jwt_sign_operations")
+        self._verifications = metrics.counter("jwt_verify_operations")
+        self._signs_per_request = metrics.histogram(
+            "jwt_signs_per_request", OPERATIONS_PER_REQUEST_BUCKETS
+        )
+        self._verifications_per_request = metrics.histogram(
+            "jwt_verifications_per_request", OPERATIONS_PER_REQUEST_BUCKETS
+        )
+
+    def record_sign(self) -> None:
+        self._signs.inc()
+
+        operations = _current_operations.get()
+
+        if operations is not None:
+            operations.signs += 1
+
+    def record_verification(self) -> None:
+        self._verifications.inc()
+
+        operations = _current_operations.get()
+
+        if operations is not None:
+            operations.verifications += 1
+
+    @contextmanager
+    def request_scope(self) -> Iterator[CryptoOperations]:
+        operations = CryptoOperations()
+        token = _current_operations.set(operations)
+
+        try:
+            yield operations
+
+        finally:
+            _current_operations.reset(token)
+
+            if operations.signs or operations.verifications:
+                self._signs_per_request.observe(operations.signs)
+                self._verifications_per_request.observe(operations.verifications)
@@ -0,0 +1,180 @@
+from asyncio import (
+    CancelledError,
+    ensure_future,
+    gather,
+    shield,
+    to_thread,
+    wrap_future,
+)
+from asyncio import Future as AsyncFuture
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, Future
+from functools import cache
+from threading import BoundedSemaphore
+from time import perf_counter
+
+from passlib.context import CryptContext
+
+from account.application.errors import ServiceOverloadedError
+from account.application.ports.auth.password_service import PasswordService
+from account.infrastructure.auth.password_pool_config import PasswordPoolConfig
+from account.infrastructure.metrics import MetricsRegistry
+
+
+@cache
+def _worker_crypt_context(crypt_context_config: str) -> CryptContext:
+    return CryptContext.from_string(crypt_context_config)
+
+
+def _hash(crypt_context_config: str, plain_password: str) -> str:
+    return _worker_crypt_context(crypt_context_config).hash(plain_password)
+
+
+def _verify(
+    crypt_context_config: str, plain_password: str, password_hash: str
+) -> bool:
+    return _worker_crypt_context(crypt_context_config).verify(
+        plain_password, password_hash
+    )
+
+
+class ExecutorPasswordService(PasswordService):
+    def __init__(
+        self,
+        crypt_context: CryptContext,
+        executor: Executor,
+        pool_config: PasswordPoolConfig,
+        metrics: MetricsRegistry,
+    ) -> None:
+        self._crypt_context = crypt_context
+        self._crypt_context_config = crypt_context.to_string()
+        self._executor = executor
+        self._workers = pool_config.workers
+        self._max_in_flight = pool_config.max_in_flight
+        self._queue_timeout = pool_config.queue_timeout.total_seconds()
+        self._slots = BoundedSemaphore(pool_config.max_in_flight)
+        self._in_flight = metrics.gauge("password_pool_in_flight")
+        self._utilisation = metrics.gauge("password_pool_utilisation")
+        self._rejected = metrics.counter("password_pool_rejected")
+        self._queue_wait = metrics.histogram("password_pool_queue_wait_seconds")
+        self._run_time = metrics.histogram("password_pool_run_seconds")
+        self._bulk_hashes = metrics.counter("password_pool_bulk_hashes")
+
+    def _occupy(self, queued_at: float) -> float:
+        started_at = perf_counter()
+        self._queue_wait.observe(started_at - queued_at)
+        self._in_flight.inc()
+        self._utilisation.set(self._in_flight.value / self._max_in_flight)
+
+        return started_at
+
+    def _release(self, started_at: float) -> None:
+        self._in_flight.dec()
+        self._utilisation.set(self._in_flight.value / self._max_in_flight)
+        self._slots.release()
+        self._run_time.observe(perf_counter() - started_at)
+
+    def _reject(self) -> ServiceOverloadedError:
+        self._rejected.inc()
+
+        return ServiceOverloadedError("Too many concurrent password operations")
+
+    def _start[T](
+        self, queued_at: float, func: Callable[..., T], *args: str
+    ) -> Future[T]:
+        started_at = self._occupy(queued_at)
+
+        try:
+            future = self._executor.submit(func, self._crypt_context_config, *args)
+        except BaseException:
+            self._release(started_at)
+            raise
+
+        future.add_done_callback(lambda _: self._release(started_at))
+
+        return future
+
+    def _submit[T](self, func: Callable[..., T], *args: str) -> Future[T]:
+        queued_at = perf_counter()
+
+        if not self._slots.acquire(timeout=self._queue_timeout):
+            raise self._reject()
+
+        return self._start(queued_at, func, *args)
+
+    def _run[T](self, func: Callable[..., T], *args: str) -> T:
+        return self._submit(func, *args).result()
+
+    def _release_abandoned(self, acquiring: AsyncFuture[bool]) -> None:
+        if not acquiring.cancelled() and acquiring.result():
+            self._slots.release()
+
+    async def _acquire_async(self) -> bool:
+        if self._slots.acquire(blocking=False):
+            return True
+
+        acquiring = ensure_future(
+            to_thread(self._slots.acquire, timeout=self._queue_timeout)
+        )
+
+        try:
+            return await shield(acquiring)
+        except CancelledError:
+            acquiring.add_done_callback(self._release_abandoned)
+            raise
+
+    async def _submit_async[T](
+        self, func: Callable[..., T], *args: str
+    ) -> Future[T]:
+        queued_at = perf_counter()
+
+        if not await self._acquire_async():
+            raise self._reject()
+
+        return self._start(queued_at, func, *args)
+
+    async def _run_async[T](self, func: Callable[..., T], *args: str) -> T:
+        return await wrap_future(await self._submit_async(func, *args))
+
+    def hash(self, plain_password: str) -> str:
+        return self._run(_hash, plain_password)
+
+    def hash_many(self, plain_passwords: Sequence[str]) -> list[str]:
+        hashes: list[str] = []
+
+        for start in range(0, len(plain_passwords), self._workers):
+            wave = [
+                self._submit(_hash, plain_password)
+                for plain_password in plain_passwords[start : start + self._workers]
+            ]
+            hashes.extend(future.result() for future in wave)
+
+        self._bulk_hashes.inc(len(plain_passwords))
+
+        return hashes
+
+    def verify(self, plain_password: str, password_hash: str) -> bool:
+        return self._run(_verify, plain_password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return self._crypt_context.needs_update(password_hash)
+
+    async def hash_async(self, plain_password: str) -> str:
+        return await self._run_async(_hash, plain_password)
+
+    async def hash_many_async(self, plain_passwords: Sequence[str]) -> list[str]:
+        hashes: list[str] = []
+
+        for start in range(0, len(plain_passwords), self._workers):
+            wave = [
+                await self._submit_async(_hash, plain_password)
+                for plain_password in plain_passwords[start : start + self._workers]
+            ]
+            hashes.extend(await gather(*map(wrap_future, wave)))
+
+        self._bulk_hashes.inc(len(plain_passwords))
+
+        return hashes
+
+    async def verify_async(self, plain_password: str, password_hash: str) -> bool:
+        return await self._run_async(_verify, plain_password, password_hash)
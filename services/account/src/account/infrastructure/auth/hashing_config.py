@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class HashingConfig:
+    scheme: str
+    verify_budget: timedelta
+    rounds_tolerance: float = 0.25
+    rounds: int | None = None
+    rounds_cache: Path | None = None
@@ -2,38 +2,36 @@ from uuid import UUID
 
 from account.application.errors import AuthenticationError
 from account.application.models import JwtToken, User, UserRole
-from account.application.ports.auth.identity_provider import IdentityProvider
+from account.application.ports.auth.identity_provider import (
+    AsyncIdentityProvider,
+    IdentityProvider,
+)
 from account.application.ports.auth.jwt_token_provider import JwtTokenProvider
-from account.application.ports.data.user_gateway import UserGateway
+from account.application.ports.data.user_gateway import AsyncUserGateway, UserGateway
 from account.infrastructure.auth.auth_config import AuthConfig
 from account.infrastructure.auth.auth_token_gettable import AuthTokenGettable
 
 
-class HttpIdentityProvider(IdentityProvider):
+class TokenIdentityProvider:
     def __init__(
         self,
-        auth_config: AuthConfig,
-        user_gateway: UserGateway,
         jwt_token_provider: JwtTokenProvider,
         auth_token_gettable: AuthTokenGettable,
     ) -> None:
-        self._auth_config = auth_config
-        self._user_gateway = user_gateway
         self._jwt_token_provider = jwt_token_provider
         self._auth_token_gettable = auth_token_gettable
+        self._introspection: JwtToken | None = None
 
     def _introspect(self) -> JwtToken:
-        token = self._auth_token_gettable.get_auth_token()
-
-        return self._jwt_token_provider.validate(token)
+        if self._introspection is None:
+            token = self._auth_token_gettable.get_auth_token()
 
-    def user(self) -> User:
-        user = self._user_gateway.idenified(self.user_id())
+            self._introspection = self._jwt_token_provider.validate(token)
 
-        if user is None:
-            raise AuthenticationError("Not authenticated")
+        return self._introspection
 
-        return user
+    def access_token(self) -> JwtToken:
+        return self._introspect()
 
     def user_id(self) -> UUID:
         introspection = self._introspect()
@@ -53,3 +51,45 @@ class HttpIdentityProvider(IdentityProvider):
             return False
 
         return True
+
+
+class HttpIdentityProvider(TokenIdentityProvider, IdentityProvider):
+    def __init__(
+        self,
+        auth_config: AuthConfig,
+        user_gateway: UserGateway,
+        jwt_token_provider: JwtTokenProvider,
+        auth_token_gettable: AuthTokenGettable,
+    ) -> None:
+        super().__init__(jwt_token_provider, auth_token_gettable)
+
+        self._auth_config = auth_config
+        self._user_gateway = user_gateway
+
+    def user(self) -> User:
+        user = self._user_gateway.idenified(self.user_id())
+
+        if user is None:
+            raise AuthenticationError("Not authenticated")
+
+        return user
+
+
+class AsyncHttpIdentityProvider(TokenIdentityProvider, AsyncIdentityProvider):
+    def __init__(
+        self,
+        user_gateway: AsyncUserGateway,
+        jwt_token_provider: JwtTokenProvider,
+        auth_token_gettable: AuthTokenGettable,
+    ) -> None:
+        super().__init__(jwt_token_provider, auth_token_gettable)
+
+        self._user_gateway = user_gateway
+
+    async def user(self) -> User:
+        user = await self._user_gateway.idenified(self.user_id())
+
+        if user is None:
+            raise AuthenticationError("Not authenticated")
+
+        return user
@@ -1,5 +1,6 @@
 from datetime import datetime
-from uuid import UUID
+from typing import Any
+from uuid import UUID, uuid4
 
 from jose import JWTError, jwt
 
@@ -8,17 +9,52 @@ from account.application.models import JwtToken, TokenPayload, UserRole
 from account.application.ports.auth.jwt_token_provider import JwtTokenProvider
 from account.application.ports.clock import Clock
 from account.infrastructure.auth.auth_config import AuthConfig
+from account.infrastructure.auth.crypto_operations import CryptoOperationsRecorder
+from account.infrastructure.auth.jwt_key_ring import ActiveKey, JwtKeyRing
+from account.infrastructure.auth.revocation_list import RevocationList
+from account.infrastructure.auth.token_cache import ValidatedTokenCache
 
 
 class JoseJwtTokenProvider(JwtTokenProvider):
-    def __init__(self, clock: Clock, auth_config: AuthConfig) -> None:
+    def __init__(
+        self,
+        clock: Clock,
+        auth_config: AuthConfig,
+        key_ring: JwtKeyRing,
+        token_cache: ValidatedTokenCache,
+        crypto_operations: CryptoOperationsRecorder,
+        revocation_list: RevocationList,
+    ) -> None:
         self._clock = clock
         self._auth_config = auth_config
+        self._key_ring = key_ring
+        self._token_cache = token_cache
+        self._crypto_operations = crypto_operations
+        self._revocation_list = revocation_list
 
-    def validate(self, token: str) -> JwtToken:
+    def _encode(self, claims: dict[str, Any], signing_key: ActiveKey) -> str:
+        headers = None if signing_key.kid is None else {"kid": signing_key.kid}
+
+        self._crypto_operations.record_sign()
+
+        return jwt.encode(
+            claims,
+            signing_key.key,
+            algorithm=self._key_ring.algorithm,
+            headers=headers,
+        )
+
+    def _decode(self, token: str, kid: str | None) -> JwtToken:
         try:
+            key = self._key_ring.verification_key(kid)
+
+            if key is None:
+                raise InvalidTokenError("Invalid token")
+
+            self._crypto_operations.record_verification()
+
             credentials = jwt.decode(
-                token, key=self._auth_config.jwt_secret, algorithms=["HS256"]
+                token, key=key, algorithms=[self._key_ring.algorithm]
             )
 
         except JWTError as e:
@@ -34,50 +70,65 @@ class JoseJwtTokenProvider(JwtTokenProvider):
             user_id=UUID(credentials["user_id"]),
             roles={UserRole(user_role) for user_role in credentials["roles"]},
         )
+        session_id = credentials.get("sid")
 
         return JwtToken(
             value=token,
             payload=payload,
             expires_in=expires_in,
             created_at=created_at,
+            jti=credentials.get("jti"),
+            session_id=None if session_id is None else UUID(session_id),
         )
 
-    def create_access_token(self, payload: TokenPayload) -> JwtToken:
-        now = self._clock.now()
-        to_encode = {
-            "user_id": str(payload.user_id),
-            "roles": [role.value for role in payload.roles],
-            "iat": int(now.timestamp()),
-            "exp": int((now + self._auth_config.access_expiration).timestamp()),
-        }
+    def validate(self, token: str) -> JwtToken:
+        jwt_token = self._token_cache.get(token)
 
-        token = jwt.encode(
-            to_encode, self._auth_config.jwt_secret, algorithm="HS256"
-        )
+        if jwt_token is None:
+            try:
+                kid = jwt.get_unverified_header(token).get("kid")
+            except JWTError as e:
+                raise InvalidTokenError("Invalid token") from e
 
-        return JwtToken(
-            value=token,
-            payload=payload,
-            expires_in=now + self._auth_config.access_expiration,
-            created_at=now,
-        )
+            jwt_token = self._decode(token, kid)
+
+            self._token_cache.put(jwt_token, self._key_ring.retires_at(kid))
+
+        if self._revocation_list.is_revoked(jwt_token):
+            raise InvalidTokenError("Token revoked")
 
-    def create_refresh_token(self, payload: TokenPayload) -> JwtToken:
-        now = self._clock.now()
+        return jwt_token
+
+    def create_access_token(
+        self,
+        payload: TokenPayload,
+        issued_at: datetime,
+        session_id: UUID | None = None,
+    ) -> JwtToken:
+        iat = int(issued_at.timestamp())
+        exp = int((issued_at + self._auth_config.access_expiration).timestamp())
+        jti = uuid4().hex
+        signing_key = self._key_ring.signing_key()
         to_encode = {
+            "jti": jti,
             "user_id": str(payload.user_id),
             "roles": [role.value for role in payload.roles],
-            "iat": int(now.timestamp()),
-            "exp": int((now + self._auth_config.refresh_expiration).timestamp()),
+            "iat": iat,
+            "exp": exp,
         }
 
-        token = jwt.encode(
-            to_encode, self._auth_config.jwt_secret, algorithm="HS256"
-        )
+        if session_id is not None:
+            to_encode["sid"] = str(session_id)
 
-        return JwtToken(
-            value=token,
+        jwt_token = JwtToken(
+            value=self._encode(to_encode, signing_key),
             payload=payload,
-            expires_in=now + self._auth_config.refresh_expiration,
-            created_at=now,
+            expires_in=datetime.fromtimestamp(exp, self._clock.tz),
+            created_at=datetime.fromtimestamp(iat, self._clock.tz),
+            jti=jti,
+            session_id=session_id,
         )
+
+        self._token_cache.put(jwt_token, self._key_ring.retires_at(signing_key.kid))
+
+        return jwt_token
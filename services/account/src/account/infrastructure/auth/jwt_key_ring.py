@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from jose import jwk
+from jose.backends.base import Key
+
+from account.application.ports.clock import Clock
+from account.infrastructure.auth.auth_config import AuthConfig
+
+SYMMETRIC_ALGORITHMS = frozenset({"HS256", "HS384", "HS512"})
+ASYMMETRIC_ALGORITHMS = frozenset(
+    {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"}
+)
+
+
+@dataclass(frozen=True)
+class ActiveKey:
+    kid: str | None
+    key: Key
+
+
+class JwtKeyRing:
+    def __init__(self, clock: Clock, auth_config: AuthConfig) -> None:
+        self._clock = clock
+        self.algorithm = auth_config.jwt_algorithm
+        self._not_after: dict[str | None, datetime] = {}
+        self._jwks: dict[str, dict[str, Any]] = {}
+
+        if self.algorithm in SYMMETRIC_ALGORITHMS:
+            if not auth_config.jwt_secret:
+                raise ValueError(f"{self.algorithm} requires a JWT secret")
+
+            secret = jwk.construct(auth_config.jwt_secret, self.algorithm)
+
+            self._signing_keys = [ActiveKey(kid=None, key=secret)]
+            self._verification_keys: dict[str | None, Key] = {None: secret}
+
+            return
+
+        if self.algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"Unsupported JWT algorithm {self.algorithm}")
+
+        self._verification_keys = {}
+
+        for signing_key in auth_config.signing_keys:
+            public_key = jwk.construct(signing_key.public_key, self.algorithm)
+
+            self._verification_keys[signing_key.kid] = public_key
+            self._jwks[signing_key.kid] = {
+                **public_key.to_dict(),
+                "kid": signing_key.kid,
+                "use": "sig",
+            }
+
+            if signing_key.not_after is not None:
+                self._not_after[signing_key.kid] = signing_key.not_after
+
+        signing_keys = [
+            ActiveKey(
+                kid=signing_key.kid,
+                key=jwk.construct(signing_key.private_key, self.algorithm),
+            )
+            for signing_key in reversed(auth_config.signing_keys)
+            if signing_key.private_key is not None
+        ]
+        # The pinned key signs until it retires, then the newest configured
+        # private key that is still valid takes over.
+        self._signing_keys = sorted(
+            signing_keys,
+            key=lambda signing_key: signing_key.kid != auth_config.signing_key_id,
+        )
+
+        if self._current_signing_key() is None:
+            raise ValueError("No private key configured for JWT signing")
+
+    def _is_retired(self, kid: str | None) -> bool:
+        not_after = self._not_after.get(kid)
+
+        return not_after is not None and not_after < self._clock.now()
+
+    def _current_signing_key(self) -> ActiveKey | None:
+        return next(
+            (
+                signing_key
+                for signing_key in self._signing_keys
+                if not self._is_retired(signing_key.kid)
+            ),
+            None,
+        )
+
+    def signing_key(self) -> ActiveKey:
+        signing_key = self._current_signing_key()
+
+        if signing_key is None:
+            raise RuntimeError("Every configured JWT signing key is retired")
+
+        return signing_key
+
+    def retires_at(self, kid: str | None) -> datetime | None:
+        return self._not_after.get(kid)
+
+    def verification_key(self, kid: str | None) -> Key | None:
+        if self._is_retired(kid):
+            return None
+
+        return self._verification_keys.get(kid)
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        return {
+            "keys": [
+                public_jwk
+                for kid, public_jwk in self._jwks.items()
+                if not self._is_retired(kid)
+            ]
+        }
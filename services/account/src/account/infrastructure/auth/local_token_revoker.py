@@ -0,0 +1,91 @@
+from collections.abc import Sequence
+from datetime import datetime
+from uuid import UUID
+
+from account.application.models import JwtToken
+from account.application.ports.auth.token_revoker import (
+    AsyncTokenRevoker,
+    TokenRevoker,
+)
+from account.infrastructure.auth.auth_config import AuthConfig
+from account.infrastructure.auth.revocation_list import (
+    Revocation,
+    RevocationList,
+    token_revocation,
+    watermark_revocation,
+)
+
+
+class LocalTokenRevoker(TokenRevoker):
+    def __init__(
+        self,
+        auth_config: AuthConfig,
+        revocation_list: RevocationList,
+    ) -> None:
+        self._auth_config = auth_config
+        self._revocation_list = revocation_list
+
+    def _publish(self, revocations: Sequence[Revocation]) -> None:
+        for revocation in revocations:
+            self._revocation_list.apply(revocation)
+
+    def revoke(self, jwt_token: JwtToken) -> None:
+        revocation = token_revocation(jwt_token)
+
+        if revocation is not None:
+            self._publish([revocation])
+
+    def revoke_issued_before(self, user_id: UUID, issued_before: datetime) -> None:
+        self.revoke_many_issued_before([user_id], issued_before)
+
+    def revoke_many_issued_before(
+        self, user_ids: Sequence[UUID], issued_before: datetime
+    ) -> None:
+        self._publish(
+            [
+                watermark_revocation(
+                    user_id, issued_before, self._auth_config.access_expiration
+                )
+                for user_id in user_ids
+            ]
+        )
+
+    def remove_expired(self, now: datetime, limit: int) -> int:
+        return self._revocation_list.prune(now)
+
+
+class AsyncLocalTokenRevoker(AsyncTokenRevoker):
+    def __init__(
+        self,
+        auth_config: AuthConfig,
+        revocation_list: RevocationList,
+    ) -> None:
+        self._auth_config = auth_config
+        self._revocation_list = revocation_list
+
+    async def _publish(self, revocations: Sequence[Revocation]) -> None:
+        for revocation in revocations:
+            self._revocation_list.apply(revocation)
+
+    async def revoke(self, jwt_token: JwtToken) -> None:
+        revocation = token_revocation(jwt_token)
+
+        if revocation is not None:
+            await self._publish([revocation])
+
+    async def revoke_issued_before(
+        self, user_id: UUID, issued_before: datetime
+    ) -> None:
+        await self.revoke_many_issued_before([user_id], issued_before)
+
+    async def revoke_many_issued_before(
+        self, user_ids: Sequence[UUID], issued_before: datetime
+    ) -> None:
+        await self._publish(
+            [
+                watermark_revocation(
+                    user_id, issued_before, self._auth_config.access_expiration
+                )
+                for user_id in user_ids
+            ]
+        )
@@ -1,3 +1,6 @@
+from asyncio import to_thread
+from collections.abc import Sequence
+
 from passlib.context import CryptContext
 
 from account.application.ports.auth.password_service import PasswordService
@@ -10,5 +13,20 @@ class PasslibPasswordService(PasswordService):
     def hash(self, plain_password: str) -> str:
         return self._crypt_context.hash(plain_password)
 
+    def hash_many(self, plain_passwords: Sequence[str]) -> list[str]:
+        return [self.hash(plain_password) for plain_password in plain_passwords]
+
     def verify(self, plain_password: str, password_hash: str) -> bool:
         return self._crypt_context.verify(plain_password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        return self._crypt_context.needs_update(password_hash)
+
+    async def hash_async(self, plain_password: str) -> str:
+        return await to_thread(self.hash, plain_password)
+
+    async def hash_many_async(self, plain_passwords: Sequence[str]) -> list[str]:
+        return await to_thread(self.hash_many, plain_passwords)
+
+    async def verify_async(self, plain_password: str, password_hash: str) -> bool:
+        return await to_thread(self.verify, plain_password, password_hash)
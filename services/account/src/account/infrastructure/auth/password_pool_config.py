@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class PasswordPoolConfig:
+    workers: int
+    max_in_flight: int
+    queue_timeout: timedelta
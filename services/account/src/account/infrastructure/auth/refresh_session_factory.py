@@ -1,20 +1,29 @@
-from account.application.models import RefreshSession
-from account.application.ports.auth.jwt_token_provider import JwtTokenProvider
+from datetime import datetime
+from secrets import token_urlsafe
+from uuid import UUID
+
+from account.application.models import RefreshSession, RefreshToken
 from account.application.ports.factory.refresh_session_factory import (
     RefreshSessionFactory,
 )
+from account.infrastructure.auth.auth_config import AuthConfig
+from account.infrastructure.auth.refresh_token_digest import refresh_token_digest
+
+REFRESH_TOKEN_BYTES = 32
 
 
 class RefreshSessionFactoryImpl(RefreshSessionFactory):
-    def __init__(self, jwt_token_provider: JwtTokenProvider) -> None:
-        self._jwt_token_provider = jwt_token_provider
+    def __init__(self, auth_config: AuthConfig) -> None:
+        self._auth_config = auth_config
 
-    def from_refresh_token(self, refresh_token: str) -> RefreshSession:
-        jwt_token = self._jwt_token_provider.validate(refresh_token)
+    def create(self, user_id: UUID, issued_at: datetime) -> RefreshToken:
+        value = token_urlsafe(REFRESH_TOKEN_BYTES)
 
-        return RefreshSession(
-            refresh_token=refresh_token,
-            expires_in=jwt_token.expires_in,
-            created_at=jwt_token.created_at,
-            user_id=jwt_token.payload.user_id,
+        session = RefreshSession(
+            user_id=user_id,
+            token_digest=refresh_token_digest(value),
+            expires_in=issued_at + self._auth_config.refresh_expiration,
+            created_at=issued_at,
         )
+
+        return RefreshToken(value=value, session=session)
@@ -0,0 +1,5 @@
+from hashlib import sha256
+
+
+def refresh_token_digest(refresh_token: str) -> bytes:
+    return sha256(refresh_token.encode()).digest()
@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Lock
+from uuid import UUID
+
+from account.application.models import JwtToken
+from account.infrastructure.metrics import MetricsRegistry
+
+
+@dataclass(frozen=True, kw_only=True)
+class Revocation:
+    user_id: UUID
+    expires_in: datetime
+    jti: str | None = None
+    issued_before: datetime | None = None
+
+
+def token_revocation(jwt_token: JwtToken) -> Revocation | None:
+    if jwt_token.jti is None:
+        return None
+
+    return Revocation(
+        user_id=jwt_token.payload.user_id,
+        expires_in=jwt_token.expires_in,
+        jti=jwt_token.jti,
+    )
+
+
+def watermark_revocation(
+    user_id: UUID, issued_before: datetime, access_expiration: timedelta
+) -> Revocation:
+    # iat carries whole seconds, so the watermark must not be finer than it
+    issued_before = issued_before.replace(microsecond=0)
+
+    return Revocation(
+        user_id=user_id,
+        expires_in=issued_before + access_expiration,
+        issued_before=issued_before,
+    )
+
+
+class RevocationList:
+    def __init__(self, metrics: MetricsRegistry) -> None:
+        self._lock = Lock()
+        self._denied_tokens: dict[str, datetime] = {}
+        self._watermarks: dict[UUID, Revocation] = {}
+        self._size = metrics.gauge("revocation_list_size")
+        self._rejected = metrics.counter("revoked_tokens_rejected")
+
+    def apply(self, revocation: Revocation) -> None:
+        with self._lock:
+            if revocation.jti is not None:
+                expires_in = self._denied_tokens.get(revocation.jti)
+
+                if expires_in is None or expires_in < revocation.expires_in:
+                    self._denied_tokens[revocation.jti] = revocation.expires_in
+
+            elif revocation.issued_before is not None:
+                current = self._watermarks.get(revocation.user_id)
+
+                if current is None or current.expires_in < revocation.expires_in:
+                    self._watermarks[revocation.user_id] = revocation
+
+            self._size.set(len(self._denied_tokens) + len(self._watermarks))
+
+    def is_revoked(self, jwt_token: JwtToken) -> bool:
+        revoked = jwt_token.jti is not None and jwt_token.jti in self._denied_tokens
+
+        if not revoked:
+            watermark = self._watermarks.get(jwt_token.payload.user_id)
+
+            revoked = (
+                watermark is not None
+                and watermark.issued_before is not None
+                and jwt_token.created_at < watermark.issued_before
+            )
+
+        if revoked:
+            self._rejected.inc()
+
+        return revoked
+
+    def prune(self, now: datetime) -> int:
+        with self._lock:
+            expired_tokens = [
+                jti
+                for jti, expires_in in self._denied_tokens.items()
+                if expires_in <= now
+            ]
+            expired_watermarks = [
+                user_id
+                for user_id, watermark in self._watermarks.items()
+                if watermark.expires_in <= now
+            ]
+
+            for jti in expired_tokens:
+                del self._denied_tokens[jti]
+
+            for user_id in expired_watermarks:
+                del self._watermarks[user_id]
+
+            self._size.set(len(self._denied_tokens) + len(self._watermarks))
+
+        return len(expired_tokens) + len(expired_watermarks)
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from datetime import datetime
+from hashlib import sha256
+from threading import Lock
+
+from account.application.models import JwtToken
+from account.application.ports.clock import Clock
+from account.infrastructure.auth.auth_config import AuthConfig
+from account.infrastructure.metrics import MetricsRegistry
+
+
+class ValidatedTokenCache:
+    def __init__(
+        self,
+        clock: Clock,
+        auth_config: AuthConfig,
+        metrics: MetricsRegistry,
+    ) -> None:
+        self._clock = clock
+        self._max_size = auth_config.token_cache_size
+        self._ttl = auth_config.token_cache_ttl
+        self._lock = Lock()
+        self._entries: OrderedDict[bytes, tuple[datetime, JwtToken]] = OrderedDict()
+        self._hits = metrics.counter("token_cache_hits")
+        self._misses = metrics.counter("token_cache_misses")
+
+    def _key(self, token: str) -> bytes:
+        return sha256(token.encode()).digest()
+
+    def get(self, token: str) -> JwtToken | None:
+        key = self._key(token)
+        now = self._clock.now()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            self._misses.inc()
+
+            return None
+
+        self._hits.inc()
+
+        return entry[1]
+
+    def put(self, jwt_token: JwtToken, key_retires_at: datetime | None) -> None:
+        if self._max_size <= 0:
+            return
+
+        key = self._key(jwt_token.value)
+        valid_until = min(self._clock.now() + self._ttl, jwt_token.expires_in)
+
+        if key_retires_at is not None:
+            valid_until = min(valid_until, key_retires_at)
+
+        with self._lock:
+            self._entries[key] = (valid_until, jwt_token)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class DirectoryConfig:
+    cache_size: int = 1024
+    cache_ttl: timedelta = timedelta(minutes=5)
+    channel: str = "postgres"
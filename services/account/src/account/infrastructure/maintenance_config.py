@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class MaintenanceConfig:
+    enabled: bool
+    interval: timedelta
+    batch_size: int
+    max_batches: int
+    partition_lookahead: timedelta
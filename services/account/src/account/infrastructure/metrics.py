@@ -0,0 +1,132 @@
+from bisect import bisect_left
+from collections.abc import Sequence
+from threading import Lock
+from typing import Protocol
+
+MetricValue = int | float | dict[str, int | float | dict[str, int]]
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Metric(Protocol):
+    def collect(self) -> MetricValue: ...
+
+
+class Counter(Metric):
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def collect(self) -> MetricValue:
+        return self._value
+
+
+class Gauge(Metric):
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._value: float = 0
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def collect(self) -> MetricValue:
+        return self._value
+
+
+class Histogram(Metric):
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._lock = Lock()
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._count = 0
+        self._sum: float = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._buckets, value)
+
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+
+    def collect(self) -> MetricValue:
+        with self._lock:
+            counts = list(self._counts)
+            count, sum_ = self._count, self._sum
+
+        buckets: dict[str, int] = {}
+        cumulative = 0
+
+        for bound, bucket_count in zip(self._buckets, counts, strict=False):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+
+        buckets["+Inf"] = count
+
+        return {"count": count, "sum": sum_, "buckets": buckets}
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: dict[str, Metric] = {}
+
+    def _register[M: Metric](self, name: str, metric: M) -> M:
+        with self._lock:
+            registered = self._metrics.setdefault(name, metric)
+
+        if not isinstance(registered, type(metric)):
+            raise TypeError(f"Metric {name} is already registered as another type")
+
+        return registered
+
+    def counter(self, name: str) -> Counter:
+        return self._register(name, Counter())
+
+    def gauge(self, name: str) -> Gauge:
+        return self._register(name, Gauge())
+
+    def histogram(
+        self, name: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(name, Histogram(buckets))
+
+    def collect(self) -> dict[str, MetricValue]:
+        with self._lock:
+            metrics = dict(self._metrics)
+
+        return {name: metric.collect() for name, metric in sorted(metrics.items())}
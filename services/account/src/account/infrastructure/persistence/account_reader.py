@@ -1,76 +1,155 @@
-from sqlalchemy import RowMapping, func, select
+from collections.abc import AsyncIterator, Iterator
+from functools import cache
+
+from sqlalchemy import Row, Select, Update, any_, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from account.application.models import UserRole
 from account.application.ports.data.account_reader import (
     AccountFilter,
     AccountInfo,
     AccountReader,
+    AsyncAccountReader,
     ManyAccountFilter,
 )
-from account.infrastructure.persistence.tables import users
+from account.infrastructure.persistence.tables import users, users_full_name
+
+STREAM_BATCH_SIZE = 1000
+
+
+ACCOUNT_COLUMNS = (
+    users.c.id,
+    users.c.first_name,
+    users.c.last_name,
+    users.c.username,
+    users.c.roles,
+    users.c.is_active,
+)
+
+
+@cache
+def _roles(roles: tuple[UserRole, ...]) -> frozenset[UserRole]:
+    return frozenset(roles)
+
+
+def _load(row: Row) -> AccountInfo:
+    id_, first_name, last_name, username, roles, is_active = row
+
+    return AccountInfo(
+        id_, first_name, last_name, username, _roles(tuple(roles)), is_active
+    )
+
+
+def apply_account_filter[S: (Select, Update)](stmt: S, filter_: AccountFilter) -> S:
+    if filter_.user_id:
+        stmt = stmt.where(users.c.id == filter_.user_id)
+
+    if filter_.user_ids is not None:
+        stmt = stmt.where(
+            users.c.id == any_(literal(list(filter_.user_ids), ARRAY(PG_UUID)))
+        )
+
+    if filter_.role:
+        stmt = stmt.where(users.c.roles.contains([filter_.role]))
+
+    if filter_.name_filter:
+        stmt = stmt.where(users_full_name.ilike(filter_.name_filter))
+
+    if filter_.only_active:
+        stmt = stmt.where(users.c.is_active)
+
+    return stmt
+
+
+def _ordered() -> Select:
+    return select(*ACCOUNT_COLUMNS).order_by(users.c.username, users.c.id)
+
+
+def _read_stmt(filter_: ManyAccountFilter) -> Select:
+    stmt = (
+        apply_account_filter(_ordered(), filter_)
+        .offset(filter_.from_)
+        .limit(filter_.count)
+    )
+
+    if filter_.after:
+        stmt = stmt.where(
+            tuple_(users.c.username, users.c.id)
+            > tuple_(filter_.after.username, filter_.after.id)
+        )
+
+    return stmt
+
+
+def _read_one_stmt(filter_: AccountFilter) -> Select:
+    return apply_account_filter(select(*ACCOUNT_COLUMNS), filter_)
+
+
+def _stream_stmt(filter_: AccountFilter) -> Select:
+    return apply_account_filter(_ordered(), filter_).execution_options(
+        yield_per=STREAM_BATCH_SIZE
+    )
 
 
 class SqlalchemyAccountReader(AccountReader):
     def __init__(self, session: Session) -> None:
         self._session = session
 
-    def _load(self, row: RowMapping) -> AccountInfo:
-        return AccountInfo(
-            id=row["id"],
-            username=row["username"],
-            first_name=row["first_name"],
-            last_name=row["last_name"],
-            roles=set(row["roles"]),
-            is_active=row["is_active"],
-        )
-
     def read(self, filter_: ManyAccountFilter) -> list[AccountInfo]:
-        stmt = select(users).offset(filter_.from_).limit(filter_.count)
+        stmt = _read_stmt(filter_)
 
-        if filter_.user_id:
-            stmt = stmt.where(users.c.id == filter_.user_id)
+        return [_load(row) for row in self._session.execute(stmt)]
 
-        if filter_.role:
-            stmt = stmt.where(users.c.roles.contains(filter_.role.value))
+    def read_one(self, filter_: AccountFilter) -> AccountInfo | None:
+        stmt = _read_one_stmt(filter_)
 
-        if filter_.name_filter:
-            stmt = stmt.where(
-                func.concat(
-                    users.c.first_name,
-                    " ",
-                    users.c.last_name,
-                ).ilike(
-                    filter_.name_filter,
-                )
-            )
+        row = self._session.execute(stmt).one_or_none()
 
-        if filter_.only_active:
-            stmt = stmt.where(users.c.is_active is True)
+        if row is None:
+            return None
 
-        return [self._load(row) for row in self._session.execute(stmt).mappings()]
+        return _load(row)
+
+    def stream(self, filter_: AccountFilter) -> Iterator[AccountInfo]:
+        stmt = _stream_stmt(filter_)
+
+        with self._session.execute(stmt) as result:
+            for row in result:
+                yield _load(row)
 
-    def read_one(self, filter_: AccountFilter) -> AccountInfo | None:
-        stmt = select(users)
 
-        if filter_.user_id:
-            stmt = stmt.where(users.c.id == filter_.user_id)
+class SqlalchemyAsyncAccountReader(AsyncAccountReader):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def read(self, filter_: ManyAccountFilter) -> list[AccountInfo]:
+        stmt = _read_stmt(filter_)
 
-        if filter_.role:
-            stmt = stmt.where(users.c.roles.contains(filter_.role.value))
+        result = await self._session.execute(stmt)
 
-        if filter_.name_filter:
-            stmt = stmt.where(
-                func.concat(users.c.first_name, " ", users.c.last_name).ilike(
-                    filter_.name_filter
-                )
-            )
+        return [_load(row) for row in result]
 
-        if filter_.only_active:
-            stmt = stmt.where(users.c.is_active.is_(True))
+    async def read_one(self, filter_: AccountFilter) -> AccountInfo | None:
+        stmt = _read_one_stmt(filter_)
 
-        row = self._session.execute(stmt).mappings().one_or_none()
+        result = await self._session.execute(stmt)
+        row = result.one_or_none()
 
         if row is None:
             return None
 
-        return self._load(row)
+        return _load(row)
+
+    async def stream(self, filter_: AccountFilter) -> AsyncIterator[AccountInfo]:
+        stmt = _stream_stmt(filter_)
+
+        result = await self._session.stream(stmt)
+
+        try:
+            async for row in result:
+                yield _load(row)
+        finally:
+            await result.close()
@@ -0,0 +1,14 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from account.application.ports.distributed_lock import DistributedLock
+
+
+class PostgresAdvisoryLock(DistributedLock):
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def try_acquire(self, name: str) -> bool:
+        stmt = select(func.pg_try_advisory_xact_lock(func.hashtext(name)))
+
+        return bool(self._session.scalar(stmt))
@@ -1,17 +1,103 @@
+from datetime import UTC, date, datetime, time, timedelta
 from uuid import UUID
 
-from sqlalchemy import exists, select
+from sqlalchemy import Delete, Select, delete, exists, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from account.application.models import RefreshSession
+from account.application.ports.clock import Clock
 from account.application.ports.data.refresh_session_gateway import (
+    AsyncRefreshSessionGateway,
     RefreshSessionGateway,
 )
+from account.infrastructure.auth.refresh_token_digest import refresh_token_digest
+
+PARTITION_PREFIX = "refresh_sessions_p"
+PARTITION_DATE_FORMAT = "%Y%m%d"
+DEFAULT_PARTITION = "refresh_sessions_default"
+PARTITION_LOCK_TIMEOUT = "1s"
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+def _partition_name(day: date) -> str:
+    return f"{PARTITION_PREFIX}{day.strftime(PARTITION_DATE_FORMAT)}"
+
+
+def _partition_bounds(day: date) -> tuple[datetime, datetime]:
+    lower = datetime.combine(day, time(), UTC)
+
+    return lower, lower + timedelta(days=1)
+
+
+def _with_id_stmt(
+    user_id: UUID, session_id: UUID, now: datetime
+) -> Select[tuple[RefreshSession]]:
+    return select(RefreshSession).where(
+        RefreshSession.id == session_id,
+        RefreshSession.user_id == user_id,
+        RefreshSession.expires_in >= now,
+    )
+
+
+def _active_for_stmt(user_id: UUID, now: datetime) -> Select[tuple[RefreshSession]]:
+    return (
+        select(RefreshSession)
+        .where(
+            RefreshSession.user_id == user_id,
+            RefreshSession.expires_in >= now,
+        )
+        .order_by(RefreshSession.created_at.desc())
+    )
+
+
+def _evict_oldest_stmt(user_id: UUID, keep: int, now: datetime) -> Delete:
+    evicted_ids = (
+        select(RefreshSession.id)
+        .where(
+            RefreshSession.user_id == user_id,
+            RefreshSession.expires_in >= now,
+        )
+        .order_by(RefreshSession.created_at.desc())
+        .offset(keep)
+    )
+
+    return (
+        delete(RefreshSession)
+        .where(
+            RefreshSession.user_id == user_id,
+            RefreshSession.expires_in >= now,
+            RefreshSession.id.in_(evicted_ids.scalar_subquery()),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _remove_all_stmt(user_id: UUID, now: datetime) -> Delete:
+    return (
+        delete(RefreshSession)
+        .where(
+            RefreshSession.user_id == user_id,
+            RefreshSession.expires_in >= now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _with_refresh_token_stmt(
+    refresh_token: str, now: datetime
+) -> Select[tuple[RefreshSession]]:
+    return select(RefreshSession).where(
+        RefreshSession.token_digest == refresh_token_digest(refresh_token),
+        RefreshSession.expires_in >= now,
+    )
 
 
 class RefreshSessionMapper(RefreshSessionGateway):
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, clock: Clock) -> None:
         self._session = session
+        self._clock = clock
 
     def add(self, refresh_session: RefreshSession) -> None:
         self._session.add(refresh_session)
@@ -19,19 +105,198 @@ class RefreshSessionMapper(RefreshSessionGateway):
     def remove(self, refresh_session: RefreshSession) -> None:
         self._session.delete(refresh_session)
 
-    def with_user_id(self, user_id: UUID) -> RefreshSession | None:
-        stmt = select(RefreshSession).where(RefreshSession.user_id == user_id)
+    def with_id(self, user_id: UUID, session_id: UUID) -> RefreshSession | None:
+        stmt = _with_id_stmt(user_id, session_id, self._clock.now())
 
         return self._session.scalar(stmt)
 
+    def active_for(self, user_id: UUID) -> list[RefreshSession]:
+        stmt = _active_for_stmt(user_id, self._clock.now())
+
+        return list(self._session.scalars(stmt))
+
+    def evict_oldest(self, user_id: UUID, keep: int) -> int:
+        stmt = _evict_oldest_stmt(user_id, keep, self._clock.now())
+
+        return self._session.execute(stmt).rowcount
+
+    def remove_all(self, user_id: UUID) -> int:
+        stmt = _remove_all_stmt(user_id, self._clock.now())
+
+        return self._session.execute(stmt).rowcount
+
     def with_refresh_token(self, refresh_token: str) -> RefreshSession | None:
-        stmt = select(RefreshSession).where(
-            RefreshSession.refresh_token == refresh_token
-        )
+        stmt = _with_refresh_token_stmt(refresh_token, self._clock.now())
 
         return self._session.scalar(stmt)
 
     def exists_with_refresh(self, refresh_token: str) -> bool:
-        stmt = select(exists().where(RefreshSession.refresh_token == refresh_token))
+        stmt = select(
+            exists().where(
+                RefreshSession.token_digest == refresh_token_digest(refresh_token),
+                RefreshSession.expires_in >= self._clock.now(),
+            )
+        )
 
         return bool(self._session.scalar(stmt))
+
+    def remove_expired(self, now: datetime, limit: int) -> int:
+        expired_ids = (
+            select(RefreshSession.id)
+            .where(RefreshSession.expires_in < now)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            delete(RefreshSession)
+            .where(
+                RefreshSession.expires_in < now,
+                RefreshSession.id.in_(expired_ids.scalar_subquery()),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        return self._session.execute(stmt).rowcount
+
+    def refresh_statistics(self) -> None:
+        self._session.execute(text("ANALYZE refresh_sessions"))
+
+    def _partition_days(self) -> set[date]:
+        stmt = text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'refresh_sessions'::regclass AND c.relkind = 'r'"
+        )
+
+        return {
+            datetime.strptime(
+                name.removeprefix(PARTITION_PREFIX), PARTITION_DATE_FORMAT
+            )
+            .replace(tzinfo=UTC)
+            .date()
+            for name in self._session.scalars(stmt)
+            if name.startswith(PARTITION_PREFIX)
+        }
+
+    def _create_partition(self, day: date) -> None:
+        name = _partition_name(day)
+        lower, upper = _partition_bounds(day)
+        bounds = {"lower": lower, "upper": upper}
+
+        self._session.execute(
+            text(f"CREATE TABLE {name} (LIKE refresh_sessions INCLUDING DEFAULTS)")
+        )
+        # Rows that landed in the default partition before this partition
+        # existed would make ATTACH fail, so they are moved over first.
+        self._session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "  # noqa: S608
+                "WHERE expires_in >= :lower AND expires_in < :upper "
+                f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+            ),
+            bounds,
+        )
+        self._session.execute(
+            text(
+                f"ALTER TABLE refresh_sessions ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{lower.isoformat()}') "
+                f"TO ('{upper.isoformat()}')"
+            )
+        )
+
+    def create_partitions(self, now: datetime, until: datetime) -> int:
+        existing_days = self._partition_days()
+        day = now.astimezone(UTC).date()
+        last_day = until.astimezone(UTC).date()
+        created = 0
+
+        while day <= last_day:
+            if day not in existing_days:
+                self._create_partition(day)
+
+                created += 1
+
+            day += timedelta(days=1)
+
+        return created
+
+    def _detach_partition(self, name: str) -> bool:
+        # DETACH ... CONCURRENTLY is refused while the default partition
+        # exists, so the ACCESS EXCLUSIVE lock is bounded by lock_timeout
+        # and the partition is retried on the next run instead.
+        try:
+            with self._session.begin_nested():
+                self._session.execute(
+                    text(f"ALTER TABLE refresh_sessions DETACH PARTITION {name}")
+                )
+        except OperationalError as exc:
+            if getattr(exc.orig, "sqlstate", None) != LOCK_NOT_AVAILABLE:
+                raise
+
+            return False
+
+        return True
+
+    def drop_expired_partitions(self, now: datetime) -> int:
+        self._session.execute(
+            text(f"SET LOCAL lock_timeout = '{PARTITION_LOCK_TIMEOUT}'")
+        )
+        dropped = 0
+
+        for day in sorted(self._partition_days()):
+            _, upper = _partition_bounds(day)
+
+            if upper > now:
+                break
+
+            if not self._detach_partition(_partition_name(day)):
+                break
+
+            self._session.execute(text(f"DROP TABLE {_partition_name(day)}"))
+
+            dropped += 1
+
+        return dropped
+
+
+class AsyncRefreshSessionMapper(AsyncRefreshSessionGateway):
+    def __init__(self, session: AsyncSession, clock: Clock) -> None:
+        self._session = session
+        self._clock = clock
+
+    def add(self, refresh_session: RefreshSession) -> None:
+        self._session.add(refresh_session)
+
+    async def remove(self, refresh_session: RefreshSession) -> None:
+        await self._session.delete(refresh_session)
+
+    async def with_id(
+        self, user_id: UUID, session_id: UUID
+    ) -> RefreshSession | None:
+        stmt = _with_id_stmt(user_id, session_id, self._clock.now())
+
+        return await self._session.scalar(stmt)
+
+    async def active_for(self, user_id: UUID) -> list[RefreshSession]:
+        stmt = _active_for_stmt(user_id, self._clock.now())
+
+        return list(await self._session.scalars(stmt))
+
+    async def evict_oldest(self, user_id: UUID, keep: int) -> int:
+        stmt = _evict_oldest_stmt(user_id, keep, self._clock.now())
+
+        result = await self._session.execute(stmt)
+
+        return result.rowcount
+
+    async def remove_all(self, user_id: UUID) -> int:
+        stmt = _remove_all_stmt(user_id, self._clock.now())
+
+        result = await self._session.execute(stmt)
+
+        return result.rowcount
+
+    async def with_refresh_token(self, refresh_token: str) -> RefreshSession | None:
+        stmt = _with_refresh_token_stmt(refresh_token, self._clock.now())
+
+        return await self._session.scalar(stmt)
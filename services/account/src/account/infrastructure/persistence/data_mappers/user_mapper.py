@@ -1,10 +1,92 @@
+from collections.abc import Iterable, Sequence
+from itertools import batched
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import exists, select
+from sqlalchemy import Select, Update, exists, select, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from account.application.models import User
-from account.application.ports.data.user_gateway import UserGateway
+from account.application.ports.data.account_reader import AccountFilter
+from account.application.ports.data.user_gateway import (
+    AsyncUserGateway,
+    UserChanges,
+    UserGateway,
+)
+from account.infrastructure.persistence.account_reader import apply_account_filter
+from account.infrastructure.persistence.tables import users as users_table
+
+INSERT_BATCH_SIZE = 1000
+
+
+def _identified_stmt(user_id: UUID) -> Select[tuple[User]]:
+    return select(User).where(User.id == user_id)
+
+
+def _named_with_stmt(username: str) -> Select[tuple[User]]:
+    return select(User).where(User.username == username)
+
+
+def _exists_named_stmt(username: str) -> Select[tuple[bool]]:
+    return select(exists().where(User.username == username))
+
+
+def _exists_identified_stmt(user_id: UUID) -> Select[tuple[bool]]:
+    return select(exists().where(User.id == user_id))
+
+
+def _existing_usernames_stmt(usernames: Iterable[str]) -> Select[tuple[str]]:
+    return select(User.username).where(User.username.in_(list(usernames)))
+
+
+def _existing_ids_stmt(user_ids: Iterable[UUID]) -> Select[tuple[UUID]]:
+    return select(User.id).where(User.id.in_(list(user_ids)))
+
+
+def _add_many_stmt(users: Sequence[User]) -> Insert:
+    return (
+        insert(users_table)
+        .values(
+            [
+                {
+                    "id": user.id,
+                    "first_name": user.first_name,
+                    "last_name": user.last_name,
+                    "username": user.username,
+                    "password_hash": user.password_hash,
+                    "is_active": user.is_active,
+                    "roles": list(user.roles),
+                }
+                for user in users
+            ]
+        )
+        .on_conflict_do_nothing()
+        .returning(users_table.c.username)
+    )
+
+
+def _changed_values(changes: UserChanges) -> dict[str, Any]:
+    values: dict[str, Any] = {}
+
+    if changes.roles is not None:
+        values["roles"] = list(changes.roles)
+
+    if changes.is_active is not None:
+        values["is_active"] = changes.is_active
+
+    return values
+
+
+def _update_many_stmt(filter_: AccountFilter, changes: UserChanges) -> Update:
+    stmt = (
+        update(users_table)
+        .values(_changed_values(changes))
+        .returning(users_table.c.id)
+    )
+
+    return apply_account_filter(stmt, filter_)
 
 
 class UserMapper(UserGateway):
@@ -14,22 +96,78 @@ class UserMapper(UserGateway):
     def add(self, user: User) -> None:
         self._session.add(user)
 
-    def idenified(self, user_id: UUID) -> User | None:
-        stmt = select(User).where(User.id == user_id)
+    def add_many(self, users: Sequence[User]) -> set[str]:
+        inserted: set[str] = set()
 
-        return self._session.scalar(stmt)
+        for batch in batched(users, INSERT_BATCH_SIZE):
+            inserted.update(self._session.scalars(_add_many_stmt(batch)))
 
-    def named_with(self, username: str) -> User | None:
-        stmt = select(User).where(User.username == username)
+        return inserted
 
-        return self._session.scalar(stmt)
+    def idenified(self, user_id: UUID) -> User | None:
+        return self._session.scalar(_identified_stmt(user_id))
 
-    def exists_named(self, username: str) -> bool:
-        stmt = select(exists().where(User.username == username))
+    def named_with(self, username: str) -> User | None:
+        return self._session.scalar(_named_with_stmt(username))
 
-        return bool(self._session.scalar(stmt))
+    def exists_named(self, username: str) -> bool:
+        return bool(self._session.scalar(_exists_named_stmt(username)))
 
     def exists_identified(self, user_id: UUID) -> bool:
-        stmt = select(exists().where(User.id == user_id))
+        return bool(self._session.scalar(_exists_identified_stmt(user_id)))
+
+    def existing_usernames(self, usernames: Iterable[str]) -> set[str]:
+        return set(self._session.scalars(_existing_usernames_stmt(usernames)))
+
+    def existing_ids(self, user_ids: Iterable[UUID]) -> set[UUID]:
+        return set(self._session.scalars(_existing_ids_stmt(user_ids)))
+
+    def update_many(
+        self, filter_: AccountFilter, changes: UserChanges
+    ) -> list[UUID]:
+        return list(self._session.scalars(_update_many_stmt(filter_, changes)))
+
+
+class AsyncUserMapper(AsyncUserGateway):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def add(self, user: User) -> None:
+        self._session.add(user)
+
+    async def idenified(self, user_id: UUID) -> User | None:
+        return await self._session.scalar(_identified_stmt(user_id))
+
+    async def named_with(self, username: str) -> User | None:
+        return await self._session.scalar(_named_with_stmt(username))
+
+    async def exists_named(self, username: str) -> bool:
+        return bool(await self._session.scalar(_exists_named_stmt(username)))
+
+    async def exists_identified(self, user_id: UUID) -> bool:
+        return bool(await self._session.scalar(_exists_identified_stmt(user_id)))
+
+    async def add_many(self, users: Sequence[User]) -> set[str]:
+        inserted: set[str] = set()
+
+        for batch in batched(users, INSERT_BATCH_SIZE):
+            inserted.update(await self._session.scalars(_add_many_stmt(batch)))
+
+        return inserted
+
+    async def existing_usernames(self, usernames: Iterable[str]) -> set[str]:
+        result = await self._session.scalars(_existing_usernames_stmt(usernames))
+
+        return set(result)
+
+    async def existing_ids(self, user_ids: Iterable[UUID]) -> set[UUID]:
+        result = await self._session.scalars(_existing_ids_stmt(user_ids))
+
+        return set(result)
+
+    async def update_many(
+        self, filter_: AccountFilter, changes: UserChanges
+    ) -> list[UUID]:
+        result = await self._session.scalars(_update_many_stmt(filter_, changes))
 
-        return bool(self._session.scalar(stmt))
+        return list(result)
@@ -0,0 +1,33 @@
+from sqlalchemy import Connection, Engine
+
+from account.infrastructure.metrics import MetricsRegistry
+from account.infrastructure.persistence.doctor_directory import (
+    DIRECTORY_CHANNEL,
+    DoctorDirectory,
+    decode_change,
+)
+from account.infrastructure.persistence.notification_listener import (
+    NotificationListener,
+)
+
+
+def directory_listener(
+    engine: Engine, doctor_directory: DoctorDirectory, metrics: MetricsRegistry
+) -> NotificationListener:
+    def invalidate(_: Connection) -> None:
+        doctor_directory.invalidate()
+
+    def apply_change(payload: str) -> None:
+        origin, published_at = decode_change(payload)
+
+        if origin != doctor_directory.origin:
+            doctor_directory.invalidate(published_at)
+
+    return NotificationListener(
+        engine,
+        DIRECTORY_CHANNEL,
+        on_connect=invalidate,
+        on_notify=apply_change,
+        metrics=metrics,
+        metrics_prefix="doctor_directory",
+    )
@@ -0,0 +1,298 @@
+import json
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+from itertools import chain
+from threading import Lock
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import Select, event, func, inspect, select
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from account.application.models import User, UserRole
+from account.application.ports.clock import Clock
+from account.application.ports.data.account_reader import (
+    AccountFilter,
+    AccountInfo,
+    AccountReader,
+    AsyncAccountReader,
+    ManyAccountFilter,
+)
+from account.infrastructure.directory_config import DirectoryConfig
+from account.infrastructure.metrics import MetricsRegistry
+from account.infrastructure.persistence.tables import users
+
+DIRECTORY_CHANNEL = "doctor_directory"
+CHANGED_KEY = "directory_changed"
+
+DIRECTORY_ATTRIBUTES = ("first_name", "last_name", "username", "roles", "is_active")
+
+ENTRY_AGE_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+_MISSING = object()
+
+
+def encode_change(origin: str, published_at: datetime) -> str:
+    return json.dumps({"origin": origin, "published_at": published_at.isoformat()})
+
+
+def decode_change(payload: str) -> tuple[str, datetime]:
+    raw = json.loads(payload)
+
+    return raw["origin"], datetime.fromisoformat(raw["published_at"])
+
+
+def _notify_stmt(payload: str) -> Select[tuple[None]]:
+    return select(func.pg_notify(DIRECTORY_CHANNEL, payload))
+
+
+def _writes_users(state: ORMExecuteState) -> bool:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return False
+
+    table = getattr(state.statement, "table", None)
+
+    return table is not None and table.name == users.name
+
+
+def _changes_directory(session: Session) -> bool:
+    if any(
+        isinstance(instance, User)
+        for instance in chain(session.new, session.deleted)
+    ):
+        return True
+
+    return any(
+        inspect(instance).attrs[name].history.has_changes()
+        for instance in session.dirty
+        if isinstance(instance, User)
+        for name in DIRECTORY_ATTRIBUTES
+    )
+
+
+def _forget_changed(session: Session, *_: Any) -> None:
+    session.info.pop(CHANGED_KEY, None)
+
+
+class DoctorDirectory:
+    def __init__(
+        self,
+        directory_config: DirectoryConfig,
+        clock: Clock,
+        metrics: MetricsRegistry,
+    ) -> None:
+        self._config = directory_config
+        self._clock = clock
+        self._origin = uuid4().hex
+        self._lock = Lock()
+        self._version = 0
+        self._entries: OrderedDict[AccountFilter, tuple[int, datetime, Any]] = (
+            OrderedDict()
+        )
+
+        self._hits = metrics.counter("doctor_directory_hits")
+        self._misses = metrics.counter("doctor_directory_misses")
+        self._hit_ratio = metrics.gauge("doctor_directory_hit_ratio")
+        self._size = metrics.gauge("doctor_directory_size")
+        self._invalidations = metrics.counter("doctor_directory_invalidations")
+        self._entry_age = metrics.histogram(
+            "doctor_directory_entry_age_seconds", ENTRY_AGE_BUCKETS
+        )
+        self._propagation_lag = metrics.gauge(
+            "doctor_directory_propagation_lag_seconds"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.cache_size > 0
+
+    @property
+    def origin(self) -> str:
+        return self._origin
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def caches(self, filter_: AccountFilter) -> bool:
+        return (
+            self.enabled
+            and filter_.role is UserRole.DOCTOR
+            and filter_.only_active
+            and filter_.user_ids is None
+        )
+
+    def _record(self, *, hit: bool) -> None:
+        (self._hits if hit else self._misses).inc()
+
+        lookups = self._hits.value + self._misses.value
+        self._hit_ratio.set(self._hits.value / lookups)
+
+    def lookup(self, filter_: AccountFilter) -> Any:
+        now = self._clock.now()
+
+        with self._lock:
+            entry = self._entries.get(filter_)
+
+            if entry is not None and (
+                entry[0] != self._version or now - entry[1] >= self._config.cache_ttl
+            ):
+                del self._entries[filter_]
+                entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(filter_)
+
+        if entry is None:
+            self._record(hit=False)
+
+            return _MISSING
+
+        self._record(hit=True)
+        self._entry_age.observe((now - entry[1]).total_seconds())
+
+        return entry[2]
+
+    def store(self, filter_: AccountFilter, version: int, value: Any) -> None:
+        with self._lock:
+            if version != self._version:
+                return
+
+            self._entries[filter_] = (version, self._clock.now(), value)
+            self._entries.move_to_end(filter_)
+
+            while len(self._entries) > self._config.cache_size:
+                self._entries.popitem(last=False)
+
+            self._size.set(len(self._entries))
+
+    def invalidate(self, published_at: datetime | None = None) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+        self._size.set(0)
+        self._invalidations.inc()
+
+        if published_at is not None:
+            lag = self._clock.now() - published_at
+            self._propagation_lag.set(max(lag.total_seconds(), 0))
+
+    def _note_write(self, session: Session) -> None:
+        if session.info.get(CHANGED_KEY):
+            return
+
+        session.info[CHANGED_KEY] = True
+
+        if self._config.channel == "postgres":
+            payload = encode_change(self._origin, self._clock.now())
+            session.connection().execute(_notify_stmt(payload))
+
+    def _execute_written(self, state: ORMExecuteState) -> None:
+        if _writes_users(state):
+            self._note_write(state.session)
+
+    def _flush_written(self, session: Session, _: Any) -> None:
+        if _changes_directory(session):
+            self._note_write(session)
+
+    def _commit_changed(self, session: Session) -> None:
+        if session.info.pop(CHANGED_KEY, False):
+            self.invalidate()
+
+    def track_writes(self, session_class: type[Session]) -> None:
+        event.listen(session_class, "do_orm_execute", self._execute_written)
+        event.listen(session_class, "after_flush", self._flush_written)
+        event.listen(session_class, "after_commit", self._commit_changed)
+        event.listen(session_class, "after_rollback", _forget_changed)
+
+
+class CachedAccountReader(AccountReader):
+    def __init__(
+        self,
+        reader: AccountReader,
+        primary_reader: AccountReader,
+        directory: DoctorDirectory,
+    ) -> None:
+        self._reader = reader
+        self._primary_reader = primary_reader
+        self._directory = directory
+
+    def read(self, filter_: ManyAccountFilter) -> list[AccountInfo]:
+        if not self._directory.caches(filter_):
+            return self._reader.read(filter_)
+
+        cached = self._directory.lookup(filter_)
+
+        if cached is not _MISSING:
+            return list(cached)
+
+        version = self._directory.version
+        accounts = self._primary_reader.read(filter_)
+        self._directory.store(filter_, version, tuple(accounts))
+
+        return accounts
+
+    def read_one(self, filter_: AccountFilter) -> AccountInfo | None:
+        if not self._directory.caches(filter_):
+            return self._reader.read_one(filter_)
+
+        cached = self._directory.lookup(filter_)
+
+        if cached is not _MISSING:
+            return cached
+
+        version = self._directory.version
+        account = self._primary_reader.read_one(filter_)
+        self._directory.store(filter_, version, account)
+
+        return account
+
+    def stream(self, filter_: AccountFilter) -> Iterator[AccountInfo]:
+        return self._reader.stream(filter_)
+
+
+class CachedAsyncAccountReader(AsyncAccountReader):
+    def __init__(
+        self,
+        reader: AsyncAccountReader,
+        primary_reader: AsyncAccountReader,
+        directory: DoctorDirectory,
+    ) -> None:
+        self._reader = reader
+        self._primary_reader = primary_reader
+        self._directory = directory
+
+    async def read(self, filter_: ManyAccountFilter) -> list[AccountInfo]:
+        if not self._directory.caches(filter_):
+            return await self._reader.read(filter_)
+
+        cached = self._directory.lookup(filter_)
+
+        if cached is not _MISSING:
+            return list(cached)
+
+        version = self._directory.version
+        accounts = await self._primary_reader.read(filter_)
+        self._directory.store(filter_, version, tuple(accounts))
+
+        return accounts
+
+    async def read_one(self, filter_: AccountFilter) -> AccountInfo | None:
+        if not self._directory.caches(filter_):
+            return await self._reader.read_one(filter_)
+
+        cached = self._directory.lookup(filter_)
+
+        if cached is not _MISSING:
+            return cached
+
+        version = self._directory.version
+        account = await self._primary_reader.read_one(filter_)
+        self._directory.store(filter_, version, account)
+
+        return account
+
+    def stream(self, filter_: AccountFilter) -> AsyncIterator[AccountInfo]:
+        return self._reader.stream(filter_)
@@ -0,0 +1,298 @@
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from typing import Any
+from uuid import UUID
+
+from account.application.models import User
+from account.application.ports.data.account_reader import (
+    AccountFilter,
+    AccountInfo,
+    AccountReader,
+    AsyncAccountReader,
+    ManyAccountFilter,
+)
+from account.application.ports.data.user_gateway import (
+    AsyncUserGateway,
+    UserChanges,
+    UserGateway,
+)
+
+_UNKNOWN = object()
+
+
+def _project(user: User) -> AccountInfo:
+    return AccountInfo(
+        user.id,
+        user.first_name,
+        user.last_name,
+        user.username,
+        frozenset(user.roles),
+        user.is_active,
+    )
+
+
+def _answerable_id(filter_: AccountFilter) -> UUID | None:
+    if filter_.user_ids is not None or filter_.name_filter is not None:
+        return None
+
+    return filter_.user_id
+
+
+def _matches(account: AccountInfo, filter_: AccountFilter) -> bool:
+    if filter_.role is not None and filter_.role not in account.roles:
+        return False
+
+    return account.is_active or not filter_.only_active
+
+
+class IdentityMap:
+    def __init__(self) -> None:
+        self._users: dict[UUID, User | None] = {}
+        self._loaded_usernames: dict[UUID, str] = {}
+        self._missing_usernames: set[str] = set()
+        self._projections: dict[UUID, AccountInfo] = {}
+
+    def identified(self, user_id: UUID) -> Any:
+        return self._users.get(user_id, _UNKNOWN)
+
+    def named(self, username: str) -> Any:
+        for user_id, loaded_username in self._loaded_usernames.items():
+            user = self._users.get(user_id)
+
+            # Renamed in memory: only the database, after autoflush, knows
+            # which of the two names is taken.
+            if user is not None and user.username != loaded_username:
+                if username in {user.username, loaded_username}:
+                    return _UNKNOWN
+            elif loaded_username == username:
+                return user
+
+        if username in self._missing_usernames:
+            return None
+
+        return _UNKNOWN
+
+    def projection(self, user_id: UUID) -> AccountInfo | None:
+        user = self._users.get(user_id)
+
+        if user is not None:
+            return _project(user)
+
+        return self._projections.get(user_id)
+
+    def remember(self, user: User) -> None:
+        self._users[user.id] = user
+        self._loaded_usernames[user.id] = user.username
+        self._missing_usernames.discard(user.username)
+
+    def remember_identified(self, user_id: UUID, user: User | None) -> None:
+        if user is None:
+            self._users[user_id] = None
+        else:
+            self.remember(user)
+
+    def remember_named(self, username: str, user: User | None) -> None:
+        if user is None:
+            self._missing_usernames.add(username)
+        else:
+            self.remember(user)
+
+    def remember_projection(self, account: AccountInfo) -> None:
+        self._projections[account.id] = account
+
+    def clear(self) -> None:
+        self._users.clear()
+        self._loaded_usernames.clear()
+        self._missing_usernames.clear()
+        self._projections.clear()
+
+
+class IdentityMappedUserGateway(UserGateway):
+    def __init__(self, user_gateway: UserGateway, identity_map: IdentityMap) -> None:
+        self._user_gateway = user_gateway
+        self._identity_map = identity_map
+
+    def add(self, user: User) -> None:
+        self._user_gateway.add(user)
+        self._identity_map.remember(user)
+
+    def add_many(self, users: Sequence[User]) -> set[str]:
+        inserted = self._user_gateway.add_many(users)
+        self._identity_map.clear()
+
+        return inserted
+
+    def idenified(self, user_id: UUID) -> User | None:
+        user = self._identity_map.identified(user_id)
+
+        if user is _UNKNOWN:
+            user = self._user_gateway.idenified(user_id)
+            self._identity_map.remember_identified(user_id, user)
+
+        return user
+
+    def named_with(self, username: str) -> User | None:
+        user = self._identity_map.named(username)
+
+        if user is _UNKNOWN:
+            user = self._user_gateway.named_with(username)
+            self._identity_map.remember_named(username, user)
+
+        return user
+
+    def exists_named(self, username: str) -> bool:
+        user = self._identity_map.named(username)
+
+        if user is _UNKNOWN:
+            return self._user_gateway.exists_named(username)
+
+        return user is not None
+
+    def exists_identified(self, user_id: UUID) -> bool:
+        user = self._identity_map.identified(user_id)
+
+        if user is _UNKNOWN:
+            return self._user_gateway.exists_identified(user_id)
+
+        return user is not None
+
+    def existing_usernames(self, usernames: Iterable[str]) -> set[str]:
+        return self._user_gateway.existing_usernames(usernames)
+
+    def existing_ids(self, user_ids: Iterable[UUID]) -> set[UUID]:
+        return self._user_gateway.existing_ids(user_ids)
+
+    def update_many(
+        self, filter_: AccountFilter, changes: UserChanges
+    ) -> list[UUID]:
+        affected = self._user_gateway.update_many(filter_, changes)
+        self._identity_map.clear()
+
+        return affected
+
+
+class AsyncIdentityMappedUserGateway(AsyncUserGateway):
+    def __init__(
+        self, user_gateway: AsyncUserGateway, identity_map: IdentityMap
+    ) -> None:
+        self._user_gateway = user_gateway
+        self._identity_map = identity_map
+
+    def add(self, user: User) -> None:
+        self._user_gateway.add(user)
+        self._identity_map.remember(user)
+
+    async def idenified(self, user_id: UUID) -> User | None:
+        user = self._identity_map.identified(user_id)
+
+        if user is _UNKNOWN:
+            user = await self._user_gateway.idenified(user_id)
+            self._identity_map.remember_identified(user_id, user)
+
+        return user
+
+    async def named_with(self, username: str) -> User | None:
+        user = self._identity_map.named(username)
+
+        if user is _UNKNOWN:
+            user = await self._user_gateway.named_with(username)
+            self._identity_map.remember_named(username, user)
+
+        return user
+
+    async def exists_named(self, username: str) -> bool:
+        user = self._identity_map.named(username)
+
+        if user is _UNKNOWN:
+            return await self._user_gateway.exists_named(username)
+
+        return user is not None
+
+    async def exists_identified(self, user_id: UUID) -> bool:
+        user = self._identity_map.identified(user_id)
+
+        if user is _UNKNOWN:
+            return await self._user_gateway.exists_identified(user_id)
+
+        return user is not None
+
+    async def add_many(self, users: Sequence[User]) -> set[str]:
+        inserted = await self._user_gateway.add_many(users)
+        self._identity_map.clear()
+
+        return inserted
+
+    async def existing_usernames(self, usernames: Iterable[str]) -> set[str]:
+        return await self._user_gateway.existing_usernames(usernames)
+
+    async def existing_ids(self, user_ids: Iterable[UUID]) -> set[UUID]:
+        return await self._user_gateway.existing_ids(user_ids)
+
+    async def update_many(
+        self, filter_: AccountFilter, changes: UserChanges
+    ) -> list[UUID]:
+        affected = await self._user_gateway.update_many(filter_, changes)
+        self._identity_map.clear()
+
+        return affected
+
+
+class IdentityMappedAccountReader(AccountReader):
+    def __init__(self, reader: AccountReader, identity_map: IdentityMap) -> None:
+        self._reader = reader
+        self._identity_map = identity_map
+
+    def read(self, filter_: ManyAccountFilter) -> list[AccountInfo]:
+        return self._reader.read(filter_)
+
+    def read_one(self, filter_: AccountFilter) -> AccountInfo | None:
+        user_id = _answerable_id(filter_)
+
+        if user_id is None:
+            return self._reader.read_one(filter_)
+
+        account = self._identity_map.projection(user_id)
+
+        if account is not None:
+            return account if _matches(account, filter_) else None
+
+        account = self._reader.read_one(filter_)
+
+        if account is not None:
+            self._identity_map.remember_projection(account)
+
+        return account
+
+    def stream(self, filter_: AccountFilter) -> Iterator[AccountInfo]:
+        return self._reader.stream(filter_)
+
+
+class AsyncIdentityMappedAccountReader(AsyncAccountReader):
+    def __init__(
+        self, reader: AsyncAccountReader, identity_map: IdentityMap
+    ) -> None:
+        self._reader = reader
+        self._identity_map = identity_map
+
+    async def read(self, filter_: ManyAccountFilter) -> list[AccountInfo]:
+        return await self._reader.read(filter_)
+
+    async def read_one(self, filter_: AccountFilter) -> AccountInfo | None:
+        user_id = _answerable_id(filter_)
+
+        if user_id is None:
+            return await self._reader.read_one(filter_)
+
+        account = self._identity_map.projection(user_id)
+
+        if account is not None:
+            return account if _matches(account, filter_) else None
+
+        account = await self._reader.read_one(filter_)
+
+        if account is not None:
+            self._identity_map.remember_projection(account)
+
+        return account
+
+    def stream(self, filter_: AccountFilter) -> AsyncIterator[AccountInfo]:
+        return self._reader.stream(filter_)
@@ -1,3 +1,4 @@
+from sqlalchemy import inspect
 from sqlalchemy.orm import registry
 
 from account.application.models import RefreshSession, User
@@ -9,6 +10,9 @@ from account.infrastructure.persistence.tables import (
 
 
 def setup_mappers() -> None:
+    if inspect(User, raiseerr=False) is not None:
+        return
+
     mapper_registry = registry(metadata=metadata)
 
     mapper_registry.map_imperatively(User, users)
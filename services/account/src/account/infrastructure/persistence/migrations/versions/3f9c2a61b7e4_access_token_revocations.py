@@ -0,0 +1,43 @@
+"""access token revocations
+
+Revision ID: 3f9c2a61b7e4
+Revises: a60bb944dff7
+Create Date: 2026-10-18 11:02:41.208317
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a61b7e4"
+down_revision: str | None = "a60bb944dff7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "access_token_revocations",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("jti", sa.String(), nullable=True),
+        sa.Column("issued_before", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expires_in", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_access_token_revocations_expires_in",
+        "access_token_revocations",
+        ["expires_in"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_access_token_revocations_expires_in",
+        table_name="access_token_revocations",
+    )
+    op.drop_table("access_token_revocations")
@@ -0,0 +1,83 @@
+"""users lookup indexes
+
+Revision ID: 5b0e7d41c9a2
+Revises: 3f9c2a61b7e4
+Create Date: 2026-10-18 11:48:09.530172
+
+"""
+
+import logging
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b0e7d41c9a2"
+down_revision: str | None = "3f9c2a61b7e4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+NOT_NULL_COLUMNS = (
+    "first_name",
+    "last_name",
+    "username",
+    "password_hash",
+    "is_active",
+    "roles",
+)
+
+
+def _trigram_available() -> bool:
+    stmt = sa.text(
+        "SELECT EXISTS (SELECT FROM pg_available_extensions WHERE name = 'pg_trgm')"
+    )
+
+    return bool(op.get_bind().scalar(stmt))
+
+
+def upgrade() -> None:
+    for column in NOT_NULL_COLUMNS:
+        op.alter_column("users", column, nullable=False)
+
+    op.alter_column("refresh_sessions", "user_id", nullable=False)
+    op.alter_column("refresh_sessions", "created_at", nullable=False)
+
+    op.create_index("ux_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_roles", "users", ["roles"], postgresql_using="gin")
+    op.create_index(
+        "ix_users_active_doctors",
+        "users",
+        ["id"],
+        postgresql_where=sa.text("is_active AND roles @> '{DOCTOR}'::userrole[]"),
+    )
+
+    if not _trigram_available():
+        logger.warning(
+            "pg_trgm is not available: skipping ix_users_full_name_trgm, "
+            "account name filters will scan the users table. Install the "
+            "PostgreSQL contrib extensions and create the index by hand."
+        )
+
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_users_full_name_trgm ON users "
+        "USING gin ((first_name || ' ' || last_name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_users_full_name_trgm")
+    op.drop_index("ix_users_active_doctors", table_name="users")
+    op.drop_index("ix_users_roles", table_name="users")
+    op.drop_index("ux_users_username", table_name="users")
+
+    op.alter_column("refresh_sessions", "created_at", nullable=True)
+    op.alter_column("refresh_sessions", "user_id", nullable=True)
+
+    for column in NOT_NULL_COLUMNS:
+        op.alter_column("users", column, nullable=True)
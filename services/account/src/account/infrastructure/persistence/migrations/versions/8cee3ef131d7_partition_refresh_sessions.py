@@ -0,0 +1,131 @@
+"""partition refresh sessions
+
+Revision ID: 8cee3ef131d7
+Revises: d79c7d920531
+Create Date: 2026-10-18 10:13:26.672634
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8cee3ef131d7"
+down_revision: str | None = "d79c7d920531"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE refresh_sessions RENAME TO refresh_sessions_unpartitioned"
+    )
+    op.execute(
+        "ALTER TABLE refresh_sessions_unpartitioned "
+        "RENAME CONSTRAINT refresh_sessions_pkey "
+        "TO refresh_sessions_unpartitioned_pkey"
+    )
+    op.execute(
+        "ALTER INDEX ix_refresh_sessions_token_digest "
+        "RENAME TO ix_refresh_sessions_unpartitioned_token_digest"
+    )
+    op.execute(
+        """
+        CREATE TABLE refresh_sessions (
+            id UUID NOT NULL,
+            user_id UUID CONSTRAINT refresh_sessions_user_id_fkey
+                REFERENCES users (id),
+            token_digest BYTEA NOT NULL,
+            expires_in TIMESTAMP WITH TIME ZONE NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (id, expires_in)
+        ) PARTITION BY RANGE (expires_in)
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_refresh_sessions_token_digest "
+        "ON refresh_sessions (token_digest, expires_in)"
+    )
+    op.execute(
+        "CREATE TABLE refresh_sessions_default PARTITION OF refresh_sessions DEFAULT"
+    )
+    # Daily UTC partitions covering every live session; the maintenance
+    # scheduler keeps creating them ahead of time from here on.
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            day DATE;
+        BEGIN
+            FOR day IN
+                SELECT generate_series(
+                    (now() AT TIME ZONE 'UTC')::date,
+                    (
+                        SELECT coalesce(max(expires_in), now()) AT TIME ZONE 'UTC'
+                        FROM refresh_sessions_unpartitioned
+                    )::date,
+                    interval '1 day'
+                )::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF refresh_sessions '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'refresh_sessions_p' || to_char(day, 'YYYYMMDD'),
+                    day::timestamp AT TIME ZONE 'UTC',
+                    (day + 1)::timestamp AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO refresh_sessions
+            (id, user_id, token_digest, expires_in, created_at)
+        SELECT id, user_id, token_digest, expires_in, created_at
+        FROM refresh_sessions_unpartitioned
+        WHERE expires_in >= now()
+        """
+    )
+    op.execute("DROP TABLE refresh_sessions_unpartitioned")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE refresh_sessions RENAME TO refresh_sessions_partitioned")
+    op.execute(
+        "ALTER TABLE refresh_sessions_partitioned "
+        "RENAME CONSTRAINT refresh_sessions_pkey "
+        "TO refresh_sessions_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER INDEX ix_refresh_sessions_token_digest "
+        "RENAME TO ix_refresh_sessions_partitioned_token_digest"
+    )
+    op.execute(
+        """
+        CREATE TABLE refresh_sessions (
+            id UUID NOT NULL PRIMARY KEY,
+            user_id UUID CONSTRAINT refresh_sessions_user_id_fkey
+                REFERENCES users (id),
+            token_digest BYTEA NOT NULL,
+            expires_in TIMESTAMP WITH TIME ZONE,
+            created_at TIMESTAMP WITH TIME ZONE
+        )
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_refresh_sessions_token_digest "
+        "ON refresh_sessions (token_digest)"
+    )
+    op.execute(
+        """
+        INSERT INTO refresh_sessions
+            (id, user_id, token_digest, expires_in, created_at)
+        SELECT id, user_id, token_digest, expires_in, created_at
+        FROM refresh_sessions_partitioned
+        WHERE expires_in >= now()
+        """
+    )
+    op.execute("DROP TABLE refresh_sessions_partitioned")
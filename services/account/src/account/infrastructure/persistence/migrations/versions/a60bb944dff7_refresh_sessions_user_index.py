@@ -0,0 +1,31 @@
+"""refresh sessions user index
+
+Revision ID: a60bb944dff7
+Revises: 8cee3ef131d7
+Create Date: 2026-10-18 10:15:17.415716
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a60bb944dff7"
+down_revision: str | None = "8cee3ef131d7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_refresh_sessions_user_id_created_at",
+        "refresh_sessions",
+        ["user_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_refresh_sessions_user_id_created_at", table_name="refresh_sessions"
+    )
@@ -0,0 +1,44 @@
+"""users keyset indexes
+
+Revision ID: c4a81e7f2d36
+Revises: 5b0e7d41c9a2
+Create Date: 2026-10-18 12:31:44.208519
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a81e7f2d36"
+down_revision: str | None = "5b0e7d41c9a2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+ACTIVE_DOCTORS = sa.text("is_active AND roles @> '{DOCTOR}'::userrole[]")
+
+
+def upgrade() -> None:
+    op.create_index("ix_users_username_id", "users", ["username", "id"])
+
+    op.drop_index("ix_users_active_doctors", table_name="users")
+    op.create_index(
+        "ix_users_active_doctors",
+        "users",
+        ["username", "id"],
+        postgresql_where=ACTIVE_DOCTORS,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_active_doctors", table_name="users")
+    op.create_index(
+        "ix_users_active_doctors",
+        "users",
+        ["id"],
+        postgresql_where=ACTIVE_DOCTORS,
+    )
+
+    op.drop_index("ix_users_username_id", table_name="users")
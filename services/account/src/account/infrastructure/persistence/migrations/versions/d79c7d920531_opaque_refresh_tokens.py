@@ -0,0 +1,71 @@
+"""opaque refresh tokens
+
+Revision ID: d79c7d920531
+Revises: 66667bf53531
+Create Date: 2026-10-18 10:10:55.607364
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d79c7d920531"
+down_revision: str | None = "66667bf53531"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Existing sessions hold JWT refresh tokens whose plain value is needed
+    # to compute a digest, so they cannot be migrated and are dropped.
+    op.execute("DELETE FROM refresh_sessions")
+
+    op.drop_column("refresh_sessions", "refresh_token")
+    op.add_column(
+        "refresh_sessions",
+        sa.Column("token_digest", sa.LargeBinary(length=32), nullable=False),
+    )
+    op.create_index(
+        "ix_refresh_sessions_token_digest",
+        "refresh_sessions",
+        ["token_digest"],
+        unique=True,
+    )
+    op.alter_column(
+        "refresh_sessions",
+        "expires_in",
+        type_=sa.DateTime(timezone=True),
+        postgresql_using="expires_in AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        "refresh_sessions",
+        "created_at",
+        type_=sa.DateTime(timezone=True),
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM refresh_sessions")
+
+    op.alter_column(
+        "refresh_sessions",
+        "created_at",
+        type_=sa.DateTime(),
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        "refresh_sessions",
+        "expires_in",
+        type_=sa.DateTime(),
+        postgresql_using="expires_in AT TIME ZONE 'UTC'",
+    )
+    op.drop_index("ix_refresh_sessions_token_digest", table_name="refresh_sessions")
+    op.drop_column("refresh_sessions", "token_digest")
+    op.add_column(
+        "refresh_sessions",
+        sa.Column("refresh_token", sa.String(), nullable=True),
+    )
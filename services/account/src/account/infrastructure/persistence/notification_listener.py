@@ -0,0 +1,81 @@
+import logging
+from collections.abc import Callable
+from datetime import timedelta
+from threading import Event, Thread
+
+from sqlalchemy import Connection, Engine
+
+from account.infrastructure.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationListener:
+    def __init__(
+        self,
+        engine: Engine,
+        channel: str,
+        on_connect: Callable[[Connection], None],
+        on_notify: Callable[[str], None],
+        metrics: MetricsRegistry,
+        metrics_prefix: str,
+        on_poll: Callable[[], object] | None = None,
+        poll_interval: timedelta = timedelta(seconds=5),
+    ) -> None:
+        self._engine = engine
+        self._channel = channel
+        self._on_connect = on_connect
+        self._on_notify = on_notify
+        self._on_poll = on_poll
+        self._poll_interval = poll_interval
+        self._stopped = Event()
+        self._thread = Thread(
+            target=self._run_forever, name=f"{channel}-listener", daemon=True
+        )
+        self._received = metrics.counter(f"{metrics_prefix}_notifications_received")
+        self._reconnects = metrics.counter(f"{metrics_prefix}_listener_reconnects")
+
+    def _listen(self) -> None:
+        with self._engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.exec_driver_sql(f"LISTEN {self._channel}")
+
+            self._on_connect(connection)
+
+            driver_connection = connection.connection.driver_connection
+            timeout = self._poll_interval.total_seconds()
+
+            while not self._stopped.is_set():
+                for notify in driver_connection.notifies(timeout=timeout):
+                    self._on_notify(notify.payload)
+                    self._received.inc()
+
+                    if self._stopped.is_set():
+                        break
+
+                if self._on_poll is not None:
+                    self._on_poll()
+
+    def _run_forever(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._listen()
+
+            except Exception:
+                self._reconnects.inc()
+
+                logger.exception(
+                    "Listener on %s failed, reconnecting", self._channel
+                )
+
+                self._stopped.wait(self._poll_interval.total_seconds())
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+        if self._thread.is_alive():
+            self._thread.join()
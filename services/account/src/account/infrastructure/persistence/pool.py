@@ -0,0 +1,103 @@
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import PoolProxiedConnection, QueuePool
+
+from account.infrastructure.metrics import MetricsRegistry
+from account.infrastructure.pool_config import PoolConfig
+
+CHECKOUT_WAIT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+def pool_options(pool_config: PoolConfig) -> dict[str, Any]:
+    return {
+        "pool_size": pool_config.size,
+        "max_overflow": pool_config.max_overflow,
+        "pool_pre_ping": pool_config.pre_ping,
+        "pool_recycle": (
+            -1
+            if pool_config.recycle is None
+            else int(pool_config.recycle.total_seconds())
+        ),
+        "pool_timeout": pool_config.timeout.total_seconds(),
+    }
+
+
+class PoolMetrics:
+    def __init__(self, metrics: MetricsRegistry, prefix: str) -> None:
+        self._size = metrics.gauge(f"{prefix}_size")
+        self._checked_out = metrics.gauge(f"{prefix}_checked_out")
+        self._overflow = metrics.gauge(f"{prefix}_overflow")
+        self._checkout_wait = metrics.histogram(
+            f"{prefix}_checkout_wait_seconds", CHECKOUT_WAIT_BUCKETS
+        )
+        self._checkout_timeouts = metrics.counter(f"{prefix}_checkout_timeouts")
+        self._opened = metrics.counter(f"{prefix}_connections_opened")
+        self._closed = metrics.counter(f"{prefix}_connections_closed")
+        self._invalidated = metrics.counter(f"{prefix}_connections_invalidated")
+
+    def observe_checkout(self, wait: float, *, timed_out: bool = False) -> None:
+        self._checkout_wait.observe(wait)
+
+        if timed_out:
+            self._checkout_timeouts.inc()
+
+    def _observe_opened(self, pool: QueuePool) -> None:
+        self._opened.inc()
+        self._observe_overflow(pool)
+
+    def _observe_closed(self, pool: QueuePool) -> None:
+        self._closed.inc()
+        self._observe_overflow(pool)
+
+    def _observe_overflow(self, pool: QueuePool) -> None:
+        connections = self._opened.value - self._closed.value
+        self._overflow.set(max(connections - pool.size(), 0))
+
+    def pool_class[P: QueuePool](self, base: type[P]) -> type[P]:
+        pool_metrics = self
+
+        class InstrumentedPool(base):  # type: ignore[valid-type, misc]
+            def connect(self) -> PoolProxiedConnection:
+                started_at = perf_counter()
+
+                try:
+                    connection = super().connect()
+
+                except PoolTimeoutError:
+                    pool_metrics.observe_checkout(
+                        perf_counter() - started_at, timed_out=True
+                    )
+
+                    raise
+
+                pool_metrics.observe_checkout(perf_counter() - started_at)
+
+                return connection
+
+        return InstrumentedPool
+
+    def attach(self, pool: QueuePool) -> None:
+        self._size.set(pool.size())
+
+        event.listen(pool, "checkout", lambda *_: self._checked_out.inc())
+        event.listen(pool, "checkin", lambda *_: self._checked_out.dec())
+        event.listen(pool, "detach", lambda *_: self._checked_out.dec())
+        event.listen(pool, "connect", lambda *_: self._observe_opened(pool))
+        event.listen(pool, "close", lambda *_: self._observe_closed(pool))
+        event.listen(pool, "close_detached", lambda *_: self._observe_closed(pool))
+        event.listen(pool, "invalidate", lambda *_: self._invalidated.inc())
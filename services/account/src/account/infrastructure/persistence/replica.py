@@ -0,0 +1,142 @@
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy import Connection, event, text
+from sqlalchemy.orm import Session, SessionTransaction
+
+from account.application.ports.clock import Clock
+from account.infrastructure.metrics import MetricsRegistry
+from account.infrastructure.replica_config import ReplicaConfig
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+ACTOR_KEY = "replica_actor"
+WRITTEN_KEY = "replica_written"
+WRITERS_PRUNE_SIZE = 1024
+
+_lag_stmt = text(
+    "SELECT COALESCE(CASE "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+    "END, 0)"
+)
+
+
+def isolated_session_class() -> type[Session]:
+    return type(Session.__name__, (Session,), {})
+
+
+def _mark_written(session: Session, _: Any) -> None:
+    session.info[WRITTEN_KEY] = True
+
+
+def _forget_written(session: Session, *_: Any) -> None:
+    session.info.pop(WRITTEN_KEY, None)
+
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        replica_config: ReplicaConfig,
+        clock: Clock,
+        metrics: MetricsRegistry,
+    ) -> None:
+        self._config = replica_config
+        self._clock = clock
+        self._lock = Lock()
+        self._written_at: dict[UUID, datetime] = {}
+        self._lag_probed_at: datetime | None = None
+
+        self._replica_reads = metrics.counter("db_reader_routed_replica")
+        self._primary_reads = metrics.counter("db_reader_routed_primary")
+        self._pinned_reads = metrics.counter("db_reader_pinned_primary")
+        self._lag = metrics.gauge("db_replica_lag_seconds")
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.connection_string is not None
+
+    def bind_actor(self, session: Session, user_id: UUID | None) -> None:
+        session.info[ACTOR_KEY] = user_id
+
+    def note_write(self, user_id: UUID) -> None:
+        now = self._clock.now()
+
+        with self._lock:
+            self._written_at[user_id] = now
+
+            if len(self._written_at) > WRITERS_PRUNE_SIZE:
+                horizon = now - self._config.read_your_writes
+                self._written_at = {
+                    writer: written_at
+                    for writer, written_at in self._written_at.items()
+                    if written_at > horizon
+                }
+
+    def _wrote_recently(self, user_id: UUID) -> bool:
+        written_at = self._written_at.get(user_id)
+
+        if written_at is None:
+            return False
+
+        return self._clock.now() - written_at < self._config.read_your_writes
+
+    def routes_to_replica(self, user_id: UUID | None) -> bool:
+        if not self.enabled:
+            self._primary_reads.inc()
+
+            return False
+
+        if user_id is not None and self._wrote_recently(user_id):
+            self._pinned_reads.inc()
+            self._primary_reads.inc()
+
+            return False
+
+        self._replica_reads.inc()
+
+        return True
+
+    def _commit_written(self, session: Session) -> None:
+        if not session.info.pop(WRITTEN_KEY, False):
+            return
+
+        user_id = session.info.get(ACTOR_KEY)
+
+        if user_id is not None:
+            self.note_write(user_id)
+
+    def track_writes(self, session_class: type[Session]) -> None:
+        event.listen(session_class, "after_flush", _mark_written)
+        event.listen(session_class, "after_commit", self._commit_written)
+        event.listen(session_class, "after_rollback", _forget_written)
+
+    def _lag_probe_due(self) -> bool:
+        now = self._clock.now()
+
+        with self._lock:
+            if (
+                self._lag_probed_at is not None
+                and now - self._lag_probed_at < self._config.lag_probe_interval
+            ):
+                return False
+
+            self._lag_probed_at = now
+
+        return True
+
+    def _begin_read_only(
+        self,
+        _: Session,
+        __: SessionTransaction,
+        connection: Connection,
+    ) -> None:
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+        if self.enabled and self._lag_probe_due():
+            self._lag.set(float(connection.execute(_lag_stmt).scalar_one()))
+
+    def read_only(self, session_class: type[Session]) -> None:
+        event.listen(session_class, "after_begin", self._begin_read_only)
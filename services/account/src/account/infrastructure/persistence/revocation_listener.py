@@ -0,0 +1,39 @@
+from sqlalchemy import Connection, Engine, select
+
+from account.application.ports.clock import Clock
+from account.infrastructure.auth.revocation_list import RevocationList
+from account.infrastructure.metrics import MetricsRegistry
+from account.infrastructure.persistence.notification_listener import (
+    NotificationListener,
+)
+from account.infrastructure.persistence.tables import access_token_revocations
+from account.infrastructure.persistence.token_revoker import (
+    REVOCATIONS_CHANNEL,
+    decode_revocation,
+    revocation_from_row,
+)
+
+
+def revocation_listener(
+    engine: Engine,
+    clock: Clock,
+    revocation_list: RevocationList,
+    metrics: MetricsRegistry,
+) -> NotificationListener:
+    def load_snapshot(connection: Connection) -> None:
+        stmt = select(access_token_revocations).where(
+            access_token_revocations.c.expires_in > clock.now()
+        )
+
+        for row in connection.execute(stmt):
+            revocation_list.apply(revocation_from_row(row))
+
+    return NotificationListener(
+        engine,
+        REVOCATIONS_CHANNEL,
+        on_connect=load_snapshot,
+        on_notify=lambda payload: revocation_list.apply(decode_revocation(payload)),
+        on_poll=lambda: revocation_list.prune(clock.now()),
+        metrics=metrics,
+        metrics_prefix="revocation",
+    )
@@ -1,13 +1,19 @@
 from sqlalchemy import (
     UUID,
+    BigInteger,
     Boolean,
     Column,
     DateTime,
     Enum,
     ForeignKey,
+    Identity,
+    Index,
+    LargeBinary,
     MetaData,
     String,
     Table,
+    literal_column,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY
 
@@ -19,21 +25,52 @@ users = Table(
     "users",
     metadata,
     Column("id", UUID, primary_key=True),
-    Column("first_name", String),
-    Column("last_name", String),
-    Column("username", String),
-    Column("password_hash", String),
-    Column("is_active", Boolean),
-    Column("roles", ARRAY(Enum(UserRole))),
+    Column("first_name", String, nullable=False),
+    Column("last_name", String, nullable=False),
+    Column("username", String, nullable=False),
+    Column("password_hash", String, nullable=False),
+    Column("is_active", Boolean, nullable=False),
+    Column("roles", ARRAY(Enum(UserRole)), nullable=False),
+    Index("ux_users_username", "username", unique=True),
+    Index("ix_users_username_id", "username", "id"),
+    Index("ix_users_roles", "roles", postgresql_using="gin"),
+    Index(
+        "ix_users_active_doctors",
+        "username",
+        "id",
+        postgresql_where=text("is_active AND roles @> '{DOCTOR}'::userrole[]"),
+    ),
 )
 
+users_full_name = users.c.first_name + literal_column("' '") + users.c.last_name
+
 
 refresh_sessions = Table(
     "refresh_sessions",
     metadata,
     Column("id", UUID, primary_key=True),
-    Column("user_id", ForeignKey("users.id")),
-    Column("refresh_token", String),
-    Column("expires_in", DateTime),
-    Column("created_at", DateTime),
+    Column("user_id", ForeignKey("users.id"), nullable=False),
+    Column("token_digest", LargeBinary(32), nullable=False),
+    Column("expires_in", DateTime(timezone=True), primary_key=True),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Index(
+        "ix_refresh_sessions_token_digest",
+        "token_digest",
+        "expires_in",
+        unique=True,
+    ),
+    Index("ix_refresh_sessions_user_id_created_at", "user_id", "created_at"),
+    postgresql_partition_by="RANGE (expires_in)",
+)
+
+
+access_token_revocations = Table(
+    "access_token_revocations",
+    metadata,
+    Column("id", BigInteger, Identity(), primary_key=True),
+    Column("user_id", UUID, nullable=False),
+    Column("jti", String),
+    Column("issued_before", DateTime(timezone=True)),
+    Column("expires_in", DateTime(timezone=True), nullable=False),
+    Index("ix_access_token_revocations_expires_in", "expires_in"),
 )
@@ -0,0 +1,175 @@
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Insert,
+    Row,
+    Select,
+    Text,
+    delete,
+    event,
+    func,
+    insert,
+    literal,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from account.infrastructure.auth.auth_config import AuthConfig
+from account.infrastructure.auth.local_token_revoker import (
+    AsyncLocalTokenRevoker,
+    LocalTokenRevoker,
+)
+from account.infrastructure.auth.revocation_list import Revocation, RevocationList
+from account.infrastructure.persistence.tables import access_token_revocations
+
+REVOCATIONS_CHANNEL = "access_token_revocations"
+REVOCATION_COLUMNS = ("user_id", "jti", "issued_before", "expires_in")
+PENDING_KEY = "pending_revocations"
+
+
+def revocation_to_row(revocation: Revocation) -> dict[str, Any]:
+    return {
+        "user_id": revocation.user_id,
+        "jti": revocation.jti,
+        "issued_before": revocation.issued_before,
+        "expires_in": revocation.expires_in,
+    }
+
+
+def revocation_from_row(row: Row[Any]) -> Revocation:
+    return Revocation(
+        user_id=row.user_id,
+        jti=row.jti,
+        issued_before=row.issued_before,
+        expires_in=row.expires_in,
+    )
+
+
+def encode_revocation(revocation: Revocation) -> str:
+    return json.dumps(
+        {
+            "user_id": str(revocation.user_id),
+            "jti": revocation.jti,
+            "issued_before": (
+                revocation.issued_before.isoformat()
+                if revocation.issued_before is not None
+                else None
+            ),
+            "expires_in": revocation.expires_in.isoformat(),
+        }
+    )
+
+
+def decode_revocation(payload: str) -> Revocation:
+    raw = json.loads(payload)
+
+    return Revocation(
+        user_id=UUID(raw["user_id"]),
+        jti=raw["jti"],
+        issued_before=(
+            datetime.fromisoformat(raw["issued_before"])
+            if raw["issued_before"] is not None
+            else None
+        ),
+        expires_in=datetime.fromisoformat(raw["expires_in"]),
+    )
+
+
+def _insert_stmt(revocations: Sequence[Revocation]) -> Insert:
+    rows = [revocation_to_row(revocation) for revocation in revocations]
+    columns = [access_token_revocations.c[name] for name in REVOCATION_COLUMNS]
+    unnested = func.unnest(
+        *(
+            literal([row[column.name] for row in rows], ARRAY(column.type))
+            for column in columns
+        )
+    ).table_valued(*REVOCATION_COLUMNS)
+
+    return insert(access_token_revocations).from_select(
+        REVOCATION_COLUMNS, select(unnested.render_derived())
+    )
+
+
+def _notify_stmt(revocations: Sequence[Revocation]) -> Select[tuple[None]]:
+    payloads = func.unnest(
+        literal(
+            [encode_revocation(revocation) for revocation in revocations],
+            ARRAY(Text),
+        )
+    ).column_valued("payload")
+
+    return select(func.pg_notify(REVOCATIONS_CHANNEL, payloads))
+
+
+def _forget_pending(session: Session, *_: Any) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+def track_revocations(
+    session_class: type[Session], revocation_list: RevocationList
+) -> None:
+    def apply_pending(session: Session) -> None:
+        for revocation in session.info.pop(PENDING_KEY, ()):
+            revocation_list.apply(revocation)
+
+    event.listen(session_class, "after_commit", apply_pending)
+    event.listen(session_class, "after_rollback", _forget_pending)
+
+
+class PostgresTokenRevoker(LocalTokenRevoker):
+    def __init__(
+        self,
+        session: Session,
+        auth_config: AuthConfig,
+        revocation_list: RevocationList,
+    ) -> None:
+        super().__init__(auth_config, revocation_list)
+
+        self._session = session
+
+    def _publish(self, revocations: Sequence[Revocation]) -> None:
+        if not revocations:
+            return
+
+        self._session.execute(_insert_stmt(revocations))
+        self._session.execute(_notify_stmt(revocations))
+        self._session.info.setdefault(PENDING_KEY, []).extend(revocations)
+
+    def remove_expired(self, now: datetime, limit: int) -> int:
+        expired = (
+            select(access_token_revocations.c.id)
+            .where(access_token_revocations.c.expires_in < now)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(access_token_revocations).where(
+            access_token_revocations.c.id.in_(expired.scalar_subquery())
+        )
+
+        return self._session.execute(stmt).rowcount
+
+
+class AsyncPostgresTokenRevoker(AsyncLocalTokenRevoker):
+    def __init__(
+        self,
+        session: AsyncSession,
+        auth_config: AuthConfig,
+        revocation_list: RevocationList,
+    ) -> None:
+        super().__init__(auth_config, revocation_list)
+
+        self._session = session
+
+    async def _publish(self, revocations: Sequence[Revocation]) -> None:
+        if not revocations:
+            return
+
+        await self._session.execute(_insert_stmt(revocations))
+        await self._session.execute(_notify_stmt(revocations))
+        self._session.info.setdefault(PENDING_KEY, []).extend(revocations)
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    size: int = 5
+    max_overflow: int = 10
+    pre_ping: bool = True
+    recycle: timedelta | None = timedelta(minutes=30)
+    timeout: timedelta = timedelta(seconds=30)
@@ -1,81 +1,271 @@
-from collections.abc import Iterable
+from collections.abc import AsyncIterable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import NewType
 
 from dishka import (
+    AsyncContainer,
     Container,
     Provider,
     Scope,
     alias,
     from_context,
+    make_async_container,
     make_container,
     provide,
 )
 from fastapi import Request
 from passlib.context import CryptContext
 from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 
-from account.application.ports.auth.identity_provider import IdentityProvider
+from account.application.policies import SessionPolicy
+from account.application.ports.auth.identity_provider import (
+    AsyncIdentityProvider,
+    IdentityProvider,
+)
 from account.application.ports.auth.jwt_token_provider import JwtTokenProvider
 from account.application.ports.auth.password_service import PasswordService
+from account.application.ports.auth.token_revoker import (
+    AsyncTokenRevoker,
+    TokenRevoker,
+)
 from account.application.ports.clock import Clock
-from account.application.ports.commitable import Commitable
-from account.application.ports.data.account_reader import AccountReader
+from account.application.ports.commitable import AsyncCommitable, Commitable
+from account.application.ports.data.account_reader import (
+    AccountReader,
+    AsyncAccountReader,
+)
 from account.application.ports.data.refresh_session_gateway import (
+    AsyncRefreshSessionGateway,
     RefreshSessionGateway,
 )
-from account.application.ports.data.user_gateway import UserGateway
+from account.application.ports.data.user_gateway import AsyncUserGateway, UserGateway
+from account.application.ports.distributed_lock import DistributedLock
 from account.application.ports.factory.refresh_session_factory import (
     RefreshSessionFactory,
 )
 from account.application.ports.factory.user_factory import UserFactory
 from account.application.services.account_service import AccountService
+from account.application.services.async_account_service import AsyncAccountService
+from account.application.services.async_authentication_service import (
+    AsyncAuthenticationService,
+)
 from account.application.services.authentication_service import AuthenticationService
+from account.application.services.maintenance_service import MaintenanceService
 from account.infrastructure.auth.auth_config import AuthConfig
 from account.infrastructure.auth.auth_token_gettable import AuthTokenGettable
+from account.infrastructure.auth.crypt_context_calibration import (
+    calibrated_crypt_context,
+    configured_rounds,
+)
+from account.infrastructure.auth.crypto_operations import CryptoOperationsRecorder
+from account.infrastructure.auth.executor_password_service import (
+    ExecutorPasswordService,
+)
+from account.infrastructure.auth.hashing_config import HashingConfig
 from account.infrastructure.auth.http_identity_provider import (
+    AsyncHttpIdentityProvider,
     HttpIdentityProvider,
 )
 from account.infrastructure.auth.jose_jwt_token_provider import (
     JoseJwtTokenProvider,
 )
+from account.infrastructure.auth.jwt_key_ring import JwtKeyRing
+from account.infrastructure.auth.local_token_revoker import (
+    AsyncLocalTokenRevoker,
+    LocalTokenRevoker,
+)
 from account.infrastructure.auth.passlib_password_service import (
     PasslibPasswordService,
 )
+from account.infrastructure.auth.password_pool_config import PasswordPoolConfig
 from account.infrastructure.auth.refresh_session_factory import (
     RefreshSessionFactoryImpl,
 )
+from account.infrastructure.auth.revocation_list import RevocationList
+from account.infrastructure.auth.token_cache import ValidatedTokenCache
+from account.infrastructure.directory_config import DirectoryConfig
+from account.infrastructure.maintenance_config import MaintenanceConfig
+from account.infrastructure.metrics import MetricsRegistry
 from account.infrastructure.persistence.account_reader import (
     SqlalchemyAccountReader,
+    SqlalchemyAsyncAccountReader,
 )
+from account.infrastructure.persistence.advisory_lock import PostgresAdvisoryLock
 from account.infrastructure.persistence.data_mappers.refresh_session_mapper import (
+    AsyncRefreshSessionMapper,
     RefreshSessionMapper,
 )
 from account.infrastructure.persistence.data_mappers.user_mapper import (
+    AsyncUserMapper,
     UserMapper,
 )
+from account.infrastructure.persistence.doctor_directory import (
+    CachedAccountReader,
+    CachedAsyncAccountReader,
+    DoctorDirectory,
+)
+from account.infrastructure.persistence.identity_map import (
+    AsyncIdentityMappedAccountReader,
+    AsyncIdentityMappedUserGateway,
+    IdentityMap,
+    IdentityMappedAccountReader,
+    IdentityMappedUserGateway,
+)
+from account.infrastructure.persistence.pool import PoolMetrics, pool_options
+from account.infrastructure.persistence.replica import (
+    ReplicaRouter,
+    isolated_session_class,
+)
+from account.infrastructure.persistence.token_revoker import (
+    AsyncPostgresTokenRevoker,
+    PostgresTokenRevoker,
+    track_revocations,
+)
+from account.infrastructure.pool_config import PoolConfig
+from account.infrastructure.replica_config import ReplicaConfig
+from account.infrastructure.seed_config import SeedConfig
 from account.infrastructure.user_factory import UserFactoryImpl
 from account.infrastructure.utc_clock import UTCClock
 from account.presentation.auth import FastAPIAuthTokenGettable
 
 type ConnectionString = str
+# NewType rather than `type` aliases: Dishka resolves an alias to the type it
+# names, which would let these override the primary engine and sessionmakers.
+ListenerEngine = NewType("ListenerEngine", Engine)
+ReplicaSessionmaker = NewType("ReplicaSessionmaker", sessionmaker[Session])
+AsyncReplicaSessionmaker = NewType(
+    "AsyncReplicaSessionmaker", async_sessionmaker[AsyncSession]
+)
+
+
+def _create_engine(
+    connection_string: str,
+    pool_config: PoolConfig,
+    metrics_registry: MetricsRegistry,
+    prefix: str,
+) -> Engine:
+    pool_metrics = PoolMetrics(metrics_registry, prefix)
+    engine = create_engine(
+        connection_string,
+        poolclass=pool_metrics.pool_class(QueuePool),
+        **pool_options(pool_config),
+    )
+
+    pool_metrics.attach(engine.pool)
+
+    return engine
+
+
+def _create_async_engine(
+    connection_string: str,
+    pool_config: PoolConfig,
+    metrics_registry: MetricsRegistry,
+    prefix: str,
+) -> AsyncEngine:
+    pool_metrics = PoolMetrics(metrics_registry, prefix)
+    engine = create_async_engine(
+        connection_string,
+        poolclass=pool_metrics.pool_class(AsyncAdaptedQueuePool),
+        **pool_options(pool_config),
+    )
+
+    pool_metrics.attach(engine.sync_engine.pool)
+
+    return engine
 
 
 class PersistenceProvider(Provider):
     connection_string = from_context(ConnectionString, scope=Scope.APP)
+    pool_config = from_context(PoolConfig, scope=Scope.APP)
+    replica_config = from_context(ReplicaConfig, scope=Scope.APP)
+    seed_config = from_context(SeedConfig, scope=Scope.APP)
+    directory_config = from_context(DirectoryConfig, scope=Scope.APP)
+
+    replica_router = provide(ReplicaRouter, scope=Scope.APP)
+    doctor_directory = provide(DoctorDirectory, scope=Scope.APP)
 
     @provide(scope=Scope.APP)
     def provide_engine(
-        self, connection_string: ConnectionString
+        self,
+        connection_string: ConnectionString,
+        pool_config: PoolConfig,
+        metrics_registry: MetricsRegistry,
     ) -> Iterable[Engine]:
-        engine = create_engine(connection_string)
+        engine = _create_engine(
+            connection_string, pool_config, metrics_registry, "db_pool"
+        )
 
         yield engine
 
         engine.dispose()
 
     @provide(scope=Scope.APP)
-    def provide_sessionmaker(self, engine: Engine) -> sessionmaker[Session]:
-        return sessionmaker(bind=engine)
+    def provide_listener_engine(
+        self, connection_string: ConnectionString
+    ) -> Iterable[ListenerEngine]:
+        engine = ListenerEngine(create_engine(connection_string, poolclass=NullPool))
+
+        yield engine
+
+        engine.dispose()
+
+    @provide(scope=Scope.APP)
+    def provide_sessionmaker(
+        self,
+        engine: Engine,
+        replica_router: ReplicaRouter,
+        doctor_directory: DoctorDirectory,
+        auth_config: AuthConfig,
+        revocation_list: RevocationList,
+    ) -> sessionmaker[Session]:
+        primary_sessionmaker = sessionmaker(bind=engine)
+
+        if replica_router.enabled:
+            replica_router.track_writes(primary_sessionmaker.class_)
+
+        if doctor_directory.enabled:
+            doctor_directory.track_writes(primary_sessionmaker.class_)
+
+        if auth_config.revocation_channel != "local":
+            track_revocations(primary_sessionmaker.class_, revocation_list)
+
+        return primary_sessionmaker
+
+    @provide(scope=Scope.APP)
+    def provide_replica_sessionmaker(
+        self,
+        engine: Engine,
+        replica_config: ReplicaConfig,
+        pool_config: PoolConfig,
+        metrics_registry: MetricsRegistry,
+        replica_router: ReplicaRouter,
+    ) -> Iterable[ReplicaSessionmaker]:
+        if replica_config.connection_string is None:
+            yield ReplicaSessionmaker(sessionmaker(bind=engine))
+
+            return
+
+        replica_engine = _create_engine(
+            replica_config.connection_string,
+            pool_config,
+            metrics_registry,
+            "db_replica_pool",
+        )
+        replica_sessionmaker = sessionmaker(bind=replica_engine)
+        replica_router.read_only(replica_sessionmaker.class_)
+
+        yield ReplicaSessionmaker(replica_sessionmaker)
+
+        replica_engine.dispose()
 
     @provide(scope=Scope.REQUEST)
     def provide_session(
@@ -86,21 +276,74 @@ class PersistenceProvider(Provider):
 
     commitable = alias(source=Session, provides=Commitable)
 
-    account_reader = provide(
-        SqlalchemyAccountReader,
-        scope=Scope.REQUEST,
-        provides=AccountReader,
-    )
-    user_gateway = provide(
-        UserMapper,
-        scope=Scope.REQUEST,
-        provides=UserGateway,
-    )
+    @provide(scope=Scope.REQUEST)
+    def provide_account_reader(
+        self,
+        session: Session,
+        replica_sessionmaker: ReplicaSessionmaker,
+        replica_router: ReplicaRouter,
+        doctor_directory: DoctorDirectory,
+        identity_map: IdentityMap,
+        identity_provider: IdentityProvider,
+    ) -> Iterable[AccountReader]:
+        user_id = (
+            identity_provider.user_id()
+            if replica_router.enabled and identity_provider.is_authenticated()
+            else None
+        )
+        replica_router.bind_actor(session, user_id)
+        primary_reader = SqlalchemyAccountReader(session)
+
+        if not replica_router.routes_to_replica(user_id):
+            yield IdentityMappedAccountReader(
+                CachedAccountReader(
+                    primary_reader, primary_reader, doctor_directory
+                ),
+                identity_map,
+            )
+
+            return
+
+        with replica_sessionmaker() as replica_session:
+            yield IdentityMappedAccountReader(
+                CachedAccountReader(
+                    SqlalchemyAccountReader(replica_session),
+                    primary_reader,
+                    doctor_directory,
+                ),
+                identity_map,
+            )
+
+    identity_map = provide(IdentityMap, scope=Scope.REQUEST)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_user_gateway(
+        self, session: Session, identity_map: IdentityMap
+    ) -> UserGateway:
+        return IdentityMappedUserGateway(UserMapper(session), identity_map)
+
     refresh_session_gateway = provide(
         RefreshSessionMapper,
         scope=Scope.REQUEST,
         provides=RefreshSessionGateway,
     )
+    distributed_lock = provide(
+        PostgresAdvisoryLock,
+        scope=Scope.REQUEST,
+        provides=DistributedLock,
+    )
+
+    @provide(scope=Scope.REQUEST)
+    def provide_token_revoker(
+        self,
+        session: Session,
+        auth_config: AuthConfig,
+        revocation_list: RevocationList,
+    ) -> TokenRevoker:
+        if auth_config.revocation_channel == "local":
+            return LocalTokenRevoker(auth_config, revocation_list)
+
+        return PostgresTokenRevoker(session, auth_config, revocation_list)
 
 
 class FactoryProvider(Provider):
@@ -115,6 +358,8 @@ class FactoryProvider(Provider):
 class AuthProvider(Provider):
     request = from_context(Request, scope=Scope.REQUEST)
     auth_config = from_context(AuthConfig, scope=Scope.APP)
+    password_pool_config = from_context(PasswordPoolConfig, scope=Scope.APP)
+    hashing_config = from_context(HashingConfig, scope=Scope.APP)
 
     identity_provider = provide(
         HttpIdentityProvider,
@@ -126,11 +371,10 @@ class AuthProvider(Provider):
         scope=Scope.APP,
         provides=JwtTokenProvider,
     )
-    password_service = provide(
-        PasslibPasswordService,
-        scope=Scope.APP,
-        provides=PasswordService,
-    )
+    token_cache = provide(ValidatedTokenCache, scope=Scope.APP)
+    key_ring = provide(JwtKeyRing, scope=Scope.APP)
+    crypto_operations = provide(CryptoOperationsRecorder, scope=Scope.APP)
+    revocation_list = provide(RevocationList, scope=Scope.APP)
     auth_token_gettable = provide(
         FastAPIAuthTokenGettable,
         scope=Scope.REQUEST,
@@ -138,25 +382,266 @@ class AuthProvider(Provider):
     )
 
     @provide(scope=Scope.APP)
-    def provide_crypt_context(self) -> CryptContext:
-        return CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def provide_crypt_context(
+        self,
+        hashing_config: HashingConfig,
+        metrics_registry: MetricsRegistry,
+    ) -> CryptContext:
+        rounds = configured_rounds(hashing_config)
+
+        metrics_registry.gauge("password_hash_rounds").set(rounds)
+
+        return calibrated_crypt_context(hashing_config, rounds)
+
+    @provide(scope=Scope.APP)
+    def provide_password_service(
+        self,
+        crypt_context: CryptContext,
+        password_pool_config: PasswordPoolConfig,
+        metrics_registry: MetricsRegistry,
+    ) -> Iterable[PasswordService]:
+        if password_pool_config.workers <= 0:
+            yield PasslibPasswordService(crypt_context)
+
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=password_pool_config.workers,
+            mp_context=get_context("spawn"),
+        )
+
+        yield ExecutorPasswordService(
+            crypt_context,
+            executor,
+            password_pool_config,
+            metrics_registry,
+        )
+
+        executor.shutdown(cancel_futures=True)
 
 
 class ClockProvider(Provider):
     clock = provide(UTCClock, scope=Scope.APP, provides=Clock)
 
 
+class MetricsProvider(Provider):
+    metrics_registry = provide(MetricsRegistry, scope=Scope.APP)
+
+
 class ServicesProvider(Provider):
+    # Stays REQUEST-scoped: every service holds the request's session-bound
+    # gateways or identity provider.
     scope = Scope.REQUEST
 
+    maintenance_config = from_context(MaintenanceConfig, scope=Scope.APP)
+    session_policy = from_context(SessionPolicy, scope=Scope.APP)
+
     account_service = provide(AccountService)
     authentication_service = provide(AuthenticationService)
+    maintenance_service = provide(MaintenanceService)
+
+
+class SharedProvider(Provider):
+    scope = Scope.APP
+
+    auth_config = from_context(AuthConfig)
+    session_policy = from_context(SessionPolicy)
+    connection_string = from_context(ConnectionString)
+    pool_config = from_context(PoolConfig)
+    replica_config = from_context(ReplicaConfig)
+    replica_router = from_context(ReplicaRouter)
+    doctor_directory = from_context(DoctorDirectory)
+    clock = from_context(Clock)
+    metrics_registry = from_context(MetricsRegistry)
+    jwt_token_provider = from_context(JwtTokenProvider)
+    revocation_list = from_context(RevocationList)
+    password_service = from_context(PasswordService)
+    user_factory = from_context(UserFactory)
+    refresh_session_factory = from_context(RefreshSessionFactory)
+
+
+class AsyncPersistenceProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def provide_engine(
+        self,
+        connection_string: ConnectionString,
+        pool_config: PoolConfig,
+        metrics_registry: MetricsRegistry,
+    ) -> AsyncIterable[AsyncEngine]:
+        engine = _create_async_engine(
+            connection_string, pool_config, metrics_registry, "db_async_pool"
+        )
+
+        yield engine
+
+        await engine.dispose()
+
+    @provide(scope=Scope.APP)
+    def provide_sessionmaker(
+        self,
+        engine: AsyncEngine,
+        replica_router: ReplicaRouter,
+        doctor_directory: DoctorDirectory,
+        auth_config: AuthConfig,
+        revocation_list: RevocationList,
+    ) -> async_sessionmaker[AsyncSession]:
+        primary_sessionmaker = async_sessionmaker(
+            bind=engine,
+            expire_on_commit=False,
+            sync_session_class=isolated_session_class(),
+        )
+
+        if replica_router.enabled:
+            replica_router.track_writes(
+                primary_sessionmaker.kw["sync_session_class"]
+            )
+
+        if doctor_directory.enabled:
+            doctor_directory.track_writes(
+                primary_sessionmaker.kw["sync_session_class"]
+            )
+
+        if auth_config.revocation_channel != "local":
+            track_revocations(
+                primary_sessionmaker.kw["sync_session_class"], revocation_list
+            )
+
+        return primary_sessionmaker
+
+    @provide(scope=Scope.APP)
+    async def provide_replica_sessionmaker(
+        self,
+        engine: AsyncEngine,
+        replica_config: ReplicaConfig,
+        pool_config: PoolConfig,
+        metrics_registry: MetricsRegistry,
+        replica_router: ReplicaRouter,
+    ) -> AsyncIterable[AsyncReplicaSessionmaker]:
+        if replica_config.connection_string is None:
+            yield AsyncReplicaSessionmaker(
+                async_sessionmaker(bind=engine, expire_on_commit=False)
+            )
+
+            return
+
+        replica_engine = _create_async_engine(
+            replica_config.connection_string,
+            pool_config,
+            metrics_registry,
+            "db_async_replica_pool",
+        )
+        replica_sessionmaker = async_sessionmaker(
+            bind=replica_engine,
+            expire_on_commit=False,
+            sync_session_class=isolated_session_class(),
+        )
+        replica_router.read_only(replica_sessionmaker.kw["sync_session_class"])
+
+        yield AsyncReplicaSessionmaker(replica_sessionmaker)
+
+        await replica_engine.dispose()
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_session(
+        self, sessionmaker: async_sessionmaker[AsyncSession]
+    ) -> AsyncIterable[AsyncSession]:
+        async with sessionmaker() as session:
+            yield session
+
+    commitable = alias(source=AsyncSession, provides=AsyncCommitable)
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_account_reader(
+        self,
+        session: AsyncSession,
+        replica_sessionmaker: AsyncReplicaSessionmaker,
+        replica_router: ReplicaRouter,
+        doctor_directory: DoctorDirectory,
+        identity_map: IdentityMap,
+        identity_provider: AsyncIdentityProvider,
+    ) -> AsyncIterable[AsyncAccountReader]:
+        user_id = (
+            identity_provider.user_id()
+            if replica_router.enabled and identity_provider.is_authenticated()
+            else None
+        )
+        replica_router.bind_actor(session.sync_session, user_id)
+        primary_reader = SqlalchemyAsyncAccountReader(session)
+
+        if not replica_router.routes_to_replica(user_id):
+            yield AsyncIdentityMappedAccountReader(
+                CachedAsyncAccountReader(
+                    primary_reader, primary_reader, doctor_directory
+                ),
+                identity_map,
+            )
+
+            return
+
+        async with replica_sessionmaker() as replica_session:
+            yield AsyncIdentityMappedAccountReader(
+                CachedAsyncAccountReader(
+                    SqlalchemyAsyncAccountReader(replica_session),
+                    primary_reader,
+                    doctor_directory,
+                ),
+                identity_map,
+            )
+
+    identity_map = provide(IdentityMap, scope=Scope.REQUEST)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_user_gateway(
+        self, session: AsyncSession, identity_map: IdentityMap
+    ) -> AsyncUserGateway:
+        return AsyncIdentityMappedUserGateway(AsyncUserMapper(session), identity_map)
+
+    refresh_session_gateway = provide(
+        AsyncRefreshSessionMapper,
+        scope=Scope.REQUEST,
+        provides=AsyncRefreshSessionGateway,
+    )
+
+    @provide(scope=Scope.REQUEST)
+    def provide_token_revoker(
+        self,
+        session: AsyncSession,
+        auth_config: AuthConfig,
+        revocation_list: RevocationList,
+    ) -> AsyncTokenRevoker:
+        if auth_config.revocation_channel == "local":
+            return AsyncLocalTokenRevoker(auth_config, revocation_list)
+
+        return AsyncPostgresTokenRevoker(session, auth_config, revocation_list)
+
+
+class AsyncAuthProvider(Provider):
+    request = from_context(Request, scope=Scope.REQUEST)
+
+    identity_provider = provide(
+        AsyncHttpIdentityProvider,
+        scope=Scope.REQUEST,
+        provides=AsyncIdentityProvider,
+    )
+    auth_token_gettable = provide(
+        FastAPIAuthTokenGettable,
+        scope=Scope.REQUEST,
+        provides=AuthTokenGettable,
+    )
+
+
+class AsyncServicesProvider(Provider):
+    scope = Scope.REQUEST
+
+    account_service = provide(AsyncAccountService)
+    authentication_service = provide(AsyncAuthenticationService)
 
 
 PROVIDERS = (
     AuthProvider(),
     ClockProvider(),
     FactoryProvider(),
+    MetricsProvider(),
     ServicesProvider(),
     PersistenceProvider(),
 )
@@ -164,3 +649,31 @@ PROVIDERS = (
 
 def setup_container(context: dict) -> Container:
     return make_container(*PROVIDERS, context=context)
+
+
+ASYNC_PROVIDERS = (
+    AsyncAuthProvider(),
+    AsyncPersistenceProvider(),
+    AsyncServicesProvider(),
+    SharedProvider(),
+)
+
+SHARED_DEPENDENCIES = (
+    Clock,
+    MetricsRegistry,
+    ReplicaRouter,
+    DoctorDirectory,
+    JwtTokenProvider,
+    RevocationList,
+    PasswordService,
+    UserFactory,
+    RefreshSessionFactory,
+)
+
+
+def setup_async_container(context: dict, container: Container) -> AsyncContainer:
+    shared = {
+        dependency: container.get(dependency) for dependency in SHARED_DEPENDENCIES
+    }
+
+    return make_async_container(*ASYNC_PROVIDERS, context=context | shared)
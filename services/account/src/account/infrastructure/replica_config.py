@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class ReplicaConfig:
+    connection_string: str | None = None
+    read_your_writes: timedelta = timedelta(seconds=5)
+    lag_probe_interval: timedelta = timedelta(seconds=10)
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+from account.application.models import UserRole
+
+
+@dataclass(frozen=True, kw_only=True)
+class SeedAccount:
+    first_name: str
+    last_name: str
+    username: str
+    password: str
+    roles: frozenset[UserRole]
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    accounts: tuple[SeedAccount, ...]
+
+
+DEFAULT_SEED_ACCOUNTS = (
+    SeedAccount(
+        first_name="Admin",
+        last_name="Admin",
+        username="admin",
+        password="admin",  # noqa: S106
+        roles=frozenset({UserRole.ADMIN}),
+    ),
+    SeedAccount(
+        first_name="Manager",
+        last_name="Manager",
+        username="manager",
+        password="manager",  # noqa: S106
+        roles=frozenset({UserRole.MANAGER}),
+    ),
+    SeedAccount(
+        first_name="Doctor",
+        last_name="Doctor",
+        username="doctor",
+        password="doctor",  # noqa: S106
+        roles=frozenset({UserRole.DOCTOR}),
+    ),
+    SeedAccount(
+        first_name="User",
+        last_name="User",
+        username="user",
+        password="user",  # noqa: S106
+        roles=frozenset({UserRole.USER}),
+    ),
+)
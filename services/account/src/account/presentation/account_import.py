@@ -0,0 +1,170 @@
+import csv
+import json
+from codecs import getincrementaldecoder
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+from starlette.status import HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+from account.application.services.account_service import (
+    AccountRequest,
+    ImportRow,
+    InvalidImportRow,
+)
+
+MAX_IMPORT_ROWS = 10_000
+
+MAX_IMPORT_BYTES = 4 * 1024 * 1024
+
+CSV_MEDIA_TYPE = "text/csv"
+
+IMPORT_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "array",
+                    "items": {"$ref": "#/components/schemas/AccountRequest"},
+                    "maxItems": MAX_IMPORT_ROWS,
+                }
+            },
+            CSV_MEDIA_TYPE: {
+                "schema": {"type": "string"},
+                "example": "first_name,last_name,username,password,roles\n"
+                "Ivan,Ivanov,ivanov,secret,DOCTOR USER\n",
+            },
+        },
+    }
+}
+
+_account_request = TypeAdapter(AccountRequest)
+
+
+def _invalid_body(message: str) -> RequestValidationError:
+    return RequestValidationError(
+        [{"type": "value_error", "loc": ("body",), "msg": message, "input": None}]
+    )
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        f"At most {MAX_IMPORT_BYTES} bytes per import",
+    )
+
+
+async def _bounded_body(request: Request) -> AsyncIterator[bytes]:
+    content_length = request.headers.get("content-length", "")
+
+    if content_length.isdigit() and int(content_length) > MAX_IMPORT_BYTES:
+        raise _too_large()
+
+    received = 0
+
+    async for chunk in request.stream():
+        received += len(chunk)
+
+        if received > MAX_IMPORT_BYTES:
+            raise _too_large()
+
+        yield chunk
+
+
+async def _csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[list[str]]:
+    decoder = getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    record: list[str] = []
+    quotes = 0
+
+    async for chunk in chunks:
+        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+
+        for line in lines:
+            record.append(f"{line}\n")
+            quotes += line.count('"')
+
+            # A quoted field may span lines, so a record ends only once its
+            # quotes are balanced.
+            if quotes % 2 == 0:
+                for values in csv.reader(record):
+                    yield values
+
+                record.clear()
+                quotes = 0
+
+    record.append(pending + decoder.decode(b"", final=True))
+
+    for values in csv.reader(record):
+        yield values
+
+
+async def _csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[dict[str, Any]]:
+    header: list[str] | None = None
+
+    async for values in _csv_records(chunks):
+        if not values:
+            continue
+
+        if header is None:
+            header = values
+
+            continue
+
+        row = dict(zip(header, values, strict=False))
+
+        yield row | {"roles": (row.get("roles") or "").split()}
+
+
+async def _json_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    rows = json.loads(b"".join([chunk async for chunk in chunks]))
+
+    if not isinstance(rows, list):
+        raise _invalid_body("Expected a list of accounts")
+
+    for row in rows:
+        yield row
+
+
+def _error_message(error: ErrorDetails) -> str:
+    location = ".".join(str(part) for part in error["loc"])
+
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+def _import_row(row: Any) -> ImportRow:
+    try:
+        return _account_request.validate_python(row)
+    except ValidationError as exc:
+        username = row.get("username") if isinstance(row, dict) else None
+
+        return InvalidImportRow(
+            username if isinstance(username, str) else "",
+            [_error_message(error) for error in exc.errors()],
+        )
+
+
+async def account_import_requests(request: Request) -> list[ImportRow]:
+    content_type = request.headers.get("content-type", "")
+    chunks = _bounded_body(request)
+    rows = (
+        _csv_rows(chunks)
+        if content_type.startswith(CSV_MEDIA_TYPE)
+        else _json_rows(chunks)
+    )
+    requests: list[ImportRow] = []
+
+    try:
+        async for row in rows:
+            if len(requests) == MAX_IMPORT_ROWS:
+                raise _invalid_body(f"At most {MAX_IMPORT_ROWS} accounts per import")
+
+            requests.append(_import_row(row))
+    except (UnicodeDecodeError, ValueError, csv.Error) as exc:
+        raise _invalid_body(str(exc)) from exc
+
+    return requests
@@ -12,7 +12,7 @@ class HTTPBearer(_HTTPBearer):
         self, request: Request
     ) -> HTTPAuthorizationCredentials | None:
         try:
-            return await super().__call__(request)
+            credentials = await super().__call__(request)
 
         except HTTPException as e:
             if e.status_code == HTTP_403_FORBIDDEN:
@@ -20,6 +20,11 @@ class HTTPBearer(_HTTPBearer):
 
             raise
 
+        if credentials is not None:
+            request.state.auth_token = credentials.credentials
+
+        return credentials
+
 
 AuthRequired = Security(HTTPBearer())
 
@@ -29,6 +34,11 @@ class FastAPIAuthTokenGettable(AuthTokenGettable):
         self._request = request
 
     def get_auth_token(self) -> str:
+        parsed_token: str | None = getattr(self._request.state, "auth_token", None)
+
+        if parsed_token is not None:
+            return parsed_token
+
         token = self._request.headers.get("Authorization")
 
         if token is None or not token.startswith("Bearer "):
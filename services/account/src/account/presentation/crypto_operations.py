@@ -0,0 +1,21 @@
+from collections.abc import Awaitable, Callable
+
+from fastapi import FastAPI, Request, Response
+
+from account.infrastructure.auth.crypto_operations import CryptoOperationsRecorder
+
+
+async def crypto_operations_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    recorder: CryptoOperationsRecorder = request.app.state.dishka_container.get(
+        CryptoOperationsRecorder
+    )
+
+    with recorder.request_scope():
+        return await call_next(request)
+
+
+def setup_crypto_operations(app: FastAPI) -> None:
+    app.middleware("http")(crypto_operations_middleware)
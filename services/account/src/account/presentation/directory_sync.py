@@ -0,0 +1,31 @@
+from fastapi import FastAPI
+
+from account.infrastructure.directory_config import DirectoryConfig
+from account.infrastructure.metrics import MetricsRegistry
+from account.infrastructure.persistence.directory_listener import directory_listener
+from account.infrastructure.persistence.doctor_directory import DoctorDirectory
+from account.infrastructure.providers import ListenerEngine
+
+
+def setup_directory_sync(app: FastAPI) -> None:
+    def start() -> None:
+        container = app.state.dishka_container
+        directory_config: DirectoryConfig = container.get(DirectoryConfig)
+        doctor_directory: DoctorDirectory = container.get(DoctorDirectory)
+
+        if directory_config.channel != "postgres" or not doctor_directory.enabled:
+            return
+
+        app.state.directory_listener = directory_listener(
+            container.get(ListenerEngine),
+            doctor_directory,
+            container.get(MetricsRegistry),
+        )
+        app.state.directory_listener.start()
+
+    def stop() -> None:
+        if hasattr(app.state, "directory_listener"):
+            app.state.directory_listener.stop()
+
+    app.add_event_handler("startup", start)
+    app.add_event_handler("shutdown", stop)
@@ -1,15 +1,38 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
+from contextlib import AsyncExitStack
 from inspect import Parameter
 from typing import ParamSpec, get_type_hints
 
-from dishka import Container
+from dishka import AsyncContainer, Container
 from dishka.integrations.base import wrap_injection
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request
+from starlette.routing import Route
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 P = ParamSpec("P")
 
+CONTAINER_ATTRIBUTE = "__dishka_container_attribute__"
 
-def inject[T](func: Callable[P, T]) -> Callable[P, T]:
+
+def _request_container(request: Request) -> Container:
+    container = getattr(request.state, "dishka_container", None)
+
+    if container is None:
+        container = request.state.dishka_exit_stack.enter_context(
+            request.app.state.dishka_container({Request: request})
+        )
+        request.state.dishka_container = container
+
+    return container
+
+
+def _inject[T](
+    func: Callable[P, T],
+    *,
+    is_async: bool,
+    container_getter: Callable[[Request], Container | AsyncContainer],
+    container_attribute: str,
+) -> Callable[P, T]:
     hints = get_type_hints(func)
     request_hint = next(
         (name for name, hint in hints.items() if hint is Request),
@@ -26,24 +49,93 @@ def inject[T](func: Callable[P, T]) -> Callable[P, T]:
     else:
         additional_params = []
     param_name = request_hint or "___dishka_request"
-    return wrap_injection(
+    injected = wrap_injection(
         func=func,
-        is_async=False,
+        is_async=is_async,
         additional_params=additional_params,
-        container_getter=lambda _, p: p[param_name].state.dishka_container,
+        container_getter=lambda _, p: container_getter(p[param_name]),
+    )
+    setattr(injected, CONTAINER_ATTRIBUTE, container_attribute)
+
+    return injected
+
+
+def inject[T](func: Callable[P, T]) -> Callable[P, T]:
+    return _inject(
+        func,
+        is_async=False,
+        container_getter=_request_container,
+        container_attribute="dishka_container",
+    )
+
+
+def inject_async[T](func: Callable[P, T]) -> Callable[P, T]:
+    return _inject(
+        func,
+        is_async=True,
+        container_getter=lambda request: request.state.dishka_async_container,
+        container_attribute="dishka_async_container",
+    )
+
+
+def _route_path(request: Request) -> str:
+    return request.scope["path"].removeprefix(request.scope.get("root_path", ""))
+
+
+def _bypassed_paths(app: FastAPI, container_attribute: str) -> frozenset[str]:
+    routes = [route for route in app.routes if isinstance(route, Route)]
+    injected = {
+        route.path
+        for route in routes
+        if getattr(route.endpoint, CONTAINER_ATTRIBUTE, None) == container_attribute
+    }
+
+    return frozenset(
+        route.path
+        for route in routes
+        if not route.param_convertors and route.path not in injected
     )
 
 
-async def dishka_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    container: Container = request.app.state.dishka_container
+class DishkaMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+
+            return
+
+        async with AsyncExitStack() as stack:
+            Request(scope).state.dishka_exit_stack = stack
+
+            await self.app(scope, receive, send)
+
+
+class AsyncDishkaMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+
+            return
 
-    with container({Request: request}) as request_container:
-        request.state.dishka_container = request_container
+        request = Request(scope)
 
-        return await call_next(request)
+        if _route_path(request) in request.app.state.dishka_async_bypassed_paths:
+            await self.app(scope, receive, send)
+
+            return
+
+        container: AsyncContainer = request.app.state.dishka_async_container
+
+        async with container({Request: request}) as request_container:
+            request.state.dishka_async_container = request_container
+
+            await self.app(scope, receive, send)
 
 
 def set_container(app: FastAPI, container: Container) -> None:
@@ -59,5 +151,20 @@ def unset_container(app: FastAPI) -> None:
 def setup_dishka(app: FastAPI, container: Container) -> None:
     set_container(app, container)
 
-    app.middleware("http")(dishka_middleware)
+    app.add_middleware(DishkaMiddleware)
     app.add_event_handler("shutdown", lambda: unset_container(app))
+
+
+def setup_async_dishka(app: FastAPI, container: AsyncContainer) -> None:
+    app.state.dishka_async_container = container
+    app.state.dishka_async_bypassed_paths = _bypassed_paths(
+        app, "dishka_async_container"
+    )
+
+    async def close() -> None:
+        await app.state.dishka_async_container.close()
+
+        del app.state.dishka_async_container
+
+    app.add_middleware(AsyncDishkaMiddleware)
+    app.add_event_handler("shutdown", close)
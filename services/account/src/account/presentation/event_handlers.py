@@ -2,64 +2,67 @@ from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
 
-from account.application.models import UserRole
 from account.application.ports.auth.password_service import PasswordService
 from account.application.ports.commitable import Commitable
 from account.application.ports.data.user_gateway import UserGateway
+from account.application.ports.distributed_lock import DistributedLock
 from account.application.ports.factory.user_factory import UserFactory
+from account.infrastructure.seed_config import SeedConfig
 
 if TYPE_CHECKING:
     from dishka import Container
 
+SEED_LOCK_NAME = "account-seed"
+
 
 def initialize_accounts_state_on_startup(app: FastAPI) -> None:
     container: Container = app.state.dishka_container
+    seed_config: SeedConfig = container.get(SeedConfig)
+
+    if not seed_config.accounts:
+        return
 
     with container() as request_container:
-        factory: UserFactory = request_container.get(UserFactory)
-        commitable: Commitable = request_container.get(Commitable)
+        lock: DistributedLock = request_container.get(DistributedLock)
+
+        if not lock.try_acquire(SEED_LOCK_NAME):
+            return
+
         user_gateway: UserGateway = request_container.get(UserGateway)
-        password_service: PasswordService = request_container.get(PasswordService)
 
-        admin_user = factory.new_user(
-            first_name="Admin",
-            last_name="Admin",
-            username="admin",
-            password_hash=password_service.hash("admin"),
-            roles={UserRole.ADMIN},
-        )
-        manager_user = factory.new_user(
-            first_name="Manager",
-            last_name="Manager",
-            username="manager",
-            password_hash=password_service.hash("manager"),
-            roles={UserRole.MANAGER},
-        )
-        doctor_user = factory.new_user(
-            first_name="Doctor",
-            last_name="Doctor",
-            username="doctor",
-            password_hash=password_service.hash("doctor"),
-            roles={UserRole.DOCTOR},
-        )
-        standart_user = factory.standart_user(
-            first_name="User",
-            last_name="User",
-            username="user",
-            password_hash=password_service.hash("user"),
+        existing_usernames = user_gateway.existing_usernames(
+            account.username for account in seed_config.accounts
         )
+        missing_accounts = [
+            account
+            for account in seed_config.accounts
+            if account.username not in existing_usernames
+        ]
 
-        if not user_gateway.exists_named(admin_user.username):
-            user_gateway.add(admin_user)
+        if not missing_accounts:
+            return
 
-        if not user_gateway.exists_named(manager_user.username):
-            user_gateway.add(manager_user)
+        factory: UserFactory = request_container.get(UserFactory)
+        commitable: Commitable = request_container.get(Commitable)
+        password_service: PasswordService = request_container.get(PasswordService)
 
-        if not user_gateway.exists_named(doctor_user.username):
-            user_gateway.add(doctor_user)
+        password_hashes = password_service.hash_many(
+            [account.password for account in missing_accounts]
+        )
+        new_users = [
+            factory.new_user(
+                first_name=account.first_name,
+                last_name=account.last_name,
+                username=account.username,
+                password_hash=password_hash,
+                roles=set(account.roles),
+            )
+            for account, password_hash in zip(
+                missing_accounts, password_hashes, strict=True
+            )
+        ]
 
-        if not user_gateway.exists_named(standart_user.username):
-            user_gateway.add(standart_user)
+        user_gateway.add_many(new_users)
 
         commitable.commit()
 
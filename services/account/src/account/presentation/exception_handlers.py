@@ -4,7 +4,10 @@ from starlette.responses import JSONResponse
 from account.application.errors import (
     AuthenticationError,
     AuthorizationError,
+    InvalidCursorError,
+    InvalidSelectionError,
     InvalidTokenError,
+    ServiceOverloadedError,
     UserAlreadyDeletedError,
     UserAlreadyExistsError,
     UserNotFoundError,
@@ -47,16 +50,41 @@ async def invalid_token_error_handler(
     )
 
 
+async def invalid_cursor_error_handler(
+    _: Request, exc: InvalidCursorError
+) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"message": str(exc)})
+
+
+async def invalid_selection_error_handler(
+    _: Request, exc: InvalidSelectionError
+) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"message": str(exc)})
+
+
 async def user_already_deleted_handler(
     _: Request, exc: UserAlreadyDeletedError
 ) -> JSONResponse:
     return JSONResponse(status_code=410, content={"message": str(exc)})
 
 
+async def service_overloaded_handler(
+    _: Request, exc: ServiceOverloadedError
+) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"message": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
 def setup_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(UserNotFoundError, user_not_found_handler)
     app.add_exception_handler(UserAlreadyExistsError, user_already_exists_handler)
     app.add_exception_handler(AuthenticationError, authentication_error_handler)
     app.add_exception_handler(AuthorizationError, authorization_error_handler)
     app.add_exception_handler(InvalidTokenError, invalid_token_error_handler)
+    app.add_exception_handler(InvalidCursorError, invalid_cursor_error_handler)
+    app.add_exception_handler(InvalidSelectionError, invalid_selection_error_handler)
     app.add_exception_handler(UserAlreadyDeletedError, user_already_deleted_handler)
+    app.add_exception_handler(ServiceOverloadedError, service_overloaded_handler)
@@ -0,0 +1,109 @@
+import csv
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from enum import StrEnum
+from io import StringIO
+
+from account.application.ports.data.account_reader import AccountInfo
+
+EXPORT_CHUNK_ROWS = 500
+
+CSV_COLUMNS = ("id", "first_name", "last_name", "username", "roles", "is_active")
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def export_headers(format_: ExportFormat) -> dict[str, str]:
+    return {"Content-Disposition": f'attachment; filename="accounts.{format_}"'}
+
+
+def _roles(account: AccountInfo) -> list[str]:
+    return sorted(role.value for role in account.roles)
+
+
+def _ndjson_row(account: AccountInfo) -> str:
+    row = {
+        "id": str(account.id),
+        "first_name": account.first_name,
+        "last_name": account.last_name,
+        "username": account.username,
+        "roles": _roles(account),
+        "is_active": account.is_active,
+    }
+
+    return json.dumps(row, ensure_ascii=False) + "\n"
+
+
+def _csv_line(values: Iterable[object]) -> str:
+    buffer = StringIO()
+    csv.writer(buffer).writerow(values)
+
+    return buffer.getvalue()
+
+
+def _csv_row(account: AccountInfo) -> str:
+    return _csv_line(
+        (
+            account.id,
+            account.first_name,
+            account.last_name,
+            account.username,
+            " ".join(_roles(account)),
+            account.is_active,
+        )
+    )
+
+
+class _Chunker:
+    def __init__(self, format_: ExportFormat) -> None:
+        self._encode = _csv_row if format_ is ExportFormat.CSV else _ndjson_row
+        self._lines = [_csv_line(CSV_COLUMNS)] if format_ is ExportFormat.CSV else []
+
+    def add(self, account: AccountInfo) -> str | None:
+        self._lines.append(self._encode(account))
+
+        if len(self._lines) < EXPORT_CHUNK_ROWS:
+            return None
+
+        return self.flush()
+
+    def flush(self) -> str:
+        chunk = "".join(self._lines)
+        self._lines.clear()
+
+        return chunk
+
+
+def export_chunks(
+    accounts: Iterable[AccountInfo], format_: ExportFormat
+) -> Iterator[str]:
+    chunker = _Chunker(format_)
+
+    for account in accounts:
+        if chunk := chunker.add(account):
+            yield chunk
+
+    if chunk := chunker.flush():
+        yield chunk
+
+
+async def export_chunks_async(
+    accounts: AsyncIterable[AccountInfo], format_: ExportFormat
+) -> AsyncIterator[str]:
+    chunker = _Chunker(format_)
+
+    async for account in accounts:
+        if chunk := chunker.add(account):
+            yield chunk
+
+    if chunk := chunker.flush():
+        yield chunk
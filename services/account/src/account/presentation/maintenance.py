@@ -0,0 +1,97 @@
+import logging
+from threading import Event, Thread
+from time import perf_counter
+
+from dishka import Container
+from fastapi import FastAPI
+
+from account.application.services.maintenance_service import MaintenanceService
+from account.infrastructure.maintenance_config import MaintenanceConfig
+from account.infrastructure.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class MaintenanceScheduler:
+    def __init__(self, container: Container) -> None:
+        self._container = container
+        self._config: MaintenanceConfig = container.get(MaintenanceConfig)
+        self._stopped = Event()
+        self._thread = Thread(
+            target=self._run_forever, name="maintenance", daemon=True
+        )
+
+        metrics: MetricsRegistry = container.get(MetricsRegistry)
+
+        self._runs = metrics.counter("maintenance_runs")
+        self._failures = metrics.counter("maintenance_failures")
+        self._reclaimed = metrics.counter("maintenance_sessions_reclaimed")
+        self._partitions_created = metrics.counter("maintenance_partitions_created")
+        self._partitions_dropped = metrics.counter("maintenance_partitions_dropped")
+        self._revocations_reclaimed = metrics.counter(
+            "maintenance_revocations_reclaimed"
+        )
+        self._run_time = metrics.histogram("maintenance_run_seconds")
+
+    def run_once(self) -> int:
+        started_at = perf_counter()
+
+        with self._container() as request_container:
+            maintenance_service = request_container.get(MaintenanceService)
+
+            partitions = maintenance_service.rotate_partitions(
+                self._config.partition_lookahead
+            )
+            reclaimed = maintenance_service.purge_expired_sessions(
+                self._config.batch_size, self._config.max_batches
+            )
+            revocations_reclaimed = maintenance_service.purge_expired_revocations(
+                self._config.batch_size, self._config.max_batches
+            )
+
+        self._runs.inc()
+        self._reclaimed.inc(reclaimed)
+        self._partitions_created.inc(partitions.created)
+        self._partitions_dropped.inc(partitions.dropped)
+        self._revocations_reclaimed.inc(revocations_reclaimed)
+        self._run_time.observe(perf_counter() - started_at)
+
+        return reclaimed
+
+    def _run_forever(self) -> None:
+        interval = self._config.interval.total_seconds()
+
+        while not self._stopped.is_set():
+            try:
+                self.run_once()
+
+            except Exception:
+                self._failures.inc()
+
+                logger.exception("Maintenance run failed")
+
+            self._stopped.wait(interval)
+
+    def start(self) -> None:
+        if self._config.enabled:
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+        if self._thread.is_alive():
+            self._thread.join()
+
+
+def setup_maintenance(app: FastAPI) -> None:
+    def start() -> None:
+        app.state.maintenance_scheduler = MaintenanceScheduler(
+            app.state.dishka_container
+        )
+        app.state.maintenance_scheduler.start()
+
+    def stop() -> None:
+        app.state.maintenance_scheduler.stop()
+
+    app.add_event_handler("startup", start)
+    app.add_event_handler("shutdown", stop)
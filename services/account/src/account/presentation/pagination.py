@@ -0,0 +1,42 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from uuid import UUID
+
+from account.application.errors import InvalidCursorError
+from account.application.ports.data.account_reader import AccountCursor, AccountInfo
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(account: AccountInfo) -> str:
+    raw = json.dumps([account.username, str(account.id)], separators=(",", ":"))
+
+    return urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(value: str | None) -> AccountCursor | None:
+    if value is None:
+        return None
+
+    padded = value + "=" * (-len(value) % 4)
+
+    try:
+        username, id_ = json.loads(urlsafe_b64decode(padded))
+    except (Base64Error, ValueError, TypeError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+    if not isinstance(username, str) or not isinstance(id_, str):
+        raise InvalidCursorError("Invalid cursor")
+
+    try:
+        return AccountCursor(username=username, id=UUID(id_))
+    except ValueError as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+
+def next_page_headers(accounts: list[AccountInfo], count: int) -> dict[str, str]:
+    if not accounts or len(accounts) < count:
+        return {}
+
+    return {NEXT_CURSOR_HEADER: encode_cursor(accounts[-1])}
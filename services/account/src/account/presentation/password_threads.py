@@ -0,0 +1,76 @@
+from collections.abc import Awaitable, Callable
+from functools import partial, wraps
+from inspect import signature
+from typing import ParamSpec
+
+from anyio import CapacityLimiter, Semaphore, move_on_after
+from anyio.to_thread import run_sync
+from fastapi import FastAPI, Request
+
+from account.application.errors import ServiceOverloadedError
+from account.infrastructure.auth.password_pool_config import PasswordPoolConfig
+from account.infrastructure.metrics import MetricsRegistry
+
+P = ParamSpec("P")
+
+
+class PasswordThreads:
+    def __init__(
+        self, pool_config: PasswordPoolConfig, metrics: MetricsRegistry
+    ) -> None:
+        self._admission = Semaphore(pool_config.max_in_flight)
+        self._limiter = CapacityLimiter(pool_config.max_in_flight)
+        self._queue_timeout = pool_config.queue_timeout.total_seconds()
+        self._rejected = metrics.counter("password_pool_rejected")
+
+    async def run_sync[T](self, func: Callable[[], T]) -> T:
+        admitted = False
+
+        with move_on_after(self._queue_timeout):
+            await self._admission.acquire()
+            admitted = True
+
+        if not admitted:
+            self._rejected.inc()
+
+            raise ServiceOverloadedError("Too many concurrent password operations")
+
+        try:
+            return await run_sync(func, limiter=self._limiter)
+        finally:
+            self._admission.release()
+
+
+def _request_parameter(func: Callable[..., object]) -> str:
+    for name, parameter in signature(func).parameters.items():
+        if parameter.annotation is Request:
+            return name
+
+    raise TypeError(
+        f"{func.__qualname__} takes no Request parameter; "
+        "apply password_bound above inject"
+    )
+
+
+def password_bound[T](func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
+    request_parameter = _request_parameter(func)
+
+    @wraps(func)
+    async def offloaded(*args: P.args, **kwargs: P.kwargs) -> T:
+        request: Request = kwargs[request_parameter]
+        password_threads: PasswordThreads = request.app.state.password_threads
+
+        return await password_threads.run_sync(partial(func, *args, **kwargs))
+
+    return offloaded
+
+
+def setup_password_threads(app: FastAPI) -> None:
+    def start() -> None:
+        container = app.state.dishka_container
+        app.state.password_threads = PasswordThreads(
+            container.get(PasswordPoolConfig),
+            container.get(MetricsRegistry),
+        )
+
+    app.add_event_handler("startup", start)
@@ -0,0 +1,34 @@
+from fastapi import FastAPI
+
+from account.application.ports.clock import Clock
+from account.infrastructure.auth.auth_config import AuthConfig
+from account.infrastructure.auth.revocation_list import RevocationList
+from account.infrastructure.metrics import MetricsRegistry
+from account.infrastructure.persistence.revocation_listener import (
+    revocation_listener,
+)
+from account.infrastructure.providers import ListenerEngine
+
+
+def setup_revocation_sync(app: FastAPI) -> None:
+    def start() -> None:
+        container = app.state.dishka_container
+        auth_config: AuthConfig = container.get(AuthConfig)
+
+        if auth_config.revocation_channel != "postgres":
+            return
+
+        app.state.revocation_listener = revocation_listener(
+            container.get(ListenerEngine),
+            container.get(Clock),
+            container.get(RevocationList),
+            container.get(MetricsRegistry),
+        )
+        app.state.revocation_listener.start()
+
+    def stop() -> None:
+        if hasattr(app.state, "revocation_listener"):
+            app.state.revocation_listener.stop()
+
+    app.add_event_handler("startup", start)
+    app.add_event_handler("shutdown", stop)
@@ -1,11 +1,23 @@
 from account.presentation.routers.account_router import account_router
+from account.presentation.routers.async_account_router import async_account_router
+from account.presentation.routers.async_authentication_router import (
+    async_authentication_router,
+)
+from account.presentation.routers.async_doctor_router import async_doctor_router
 from account.presentation.routers.authentication_router import (
     authentication_router,
 )
 from account.presentation.routers.doctor_router import doctor_router
+from account.presentation.routers.metrics_router import metrics_router
+from account.presentation.routers.well_known_router import well_known_router
 
 __all__ = (
     "account_router",
+    "async_account_router",
+    "async_authentication_router",
+    "async_doctor_router",
     "authentication_router",
     "doctor_router",
+    "metrics_router",
+    "well_known_router",
 )
@@ -2,17 +2,35 @@ from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Response
+from fastapi.responses import StreamingResponse
 
 from account.application.ports.data.account_reader import AccountInfo
 from account.application.services.account_service import (
     AccountRequest,
+    AccountSelection,
     AccountService,
+    BulkChangeReport,
+    BulkUpdateRequest,
+    ImportReport,
+    ImportRow,
     UpdateMeRequest,
 )
+from account.presentation.account_import import (
+    IMPORT_OPENAPI,
+    account_import_requests,
+)
 from account.presentation.auth import AuthRequired
 from account.presentation.dishka import inject
+from account.presentation.export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    export_chunks,
+    export_headers,
+)
 from account.presentation.models import Message
+from account.presentation.pagination import decode_cursor, next_page_headers
+from account.presentation.password_threads import password_bound
 
 account_router = APIRouter(
     prefix="/Accounts", dependencies=[AuthRequired], tags=["Аккаунты"]
@@ -49,9 +67,80 @@ def all_(
     *,
     from_: Annotated[int, Query(alias="from")] = 0,
     count: Annotated[int, Query()] = 10,
+    after: Annotated[str | None, Query()] = None,
+    response: Response,
     account_service: FromDishka[AccountService],
 ) -> list[AccountInfo]:
-    return account_service.all_accounts(from_, count)
+    accounts = account_service.all_accounts(from_, count, decode_cursor(after))
+    response.headers.update(next_page_headers(accounts, count))
+
+    return accounts
+
+
+@account_router.get(
+    "/Export",
+    status_code=200,
+    summary="Выгрузка списка аккаунтов",
+    response_class=StreamingResponse,
+)
+@inject
+def export(
+    *,
+    format_: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    account_service: FromDishka[AccountService],
+) -> StreamingResponse:
+    accounts = account_service.export_accounts()
+
+    return StreamingResponse(
+        export_chunks(accounts, format_),
+        media_type=MEDIA_TYPES[format_],
+        headers=export_headers(format_),
+    )
+
+
+@account_router.post(
+    "/Import",
+    status_code=200,
+    summary="Массовый импорт аккаунтов",
+    openapi_extra=IMPORT_OPENAPI,
+)
+@password_bound
+@inject
+def import_(
+    *,
+    requests: Annotated[list[ImportRow], Depends(account_import_requests)],
+    dry_run: Annotated[bool, Query()] = False,
+    account_service: FromDishka[AccountService],
+) -> ImportReport:
+    return account_service.import_accounts(requests, dry_run=dry_run)
+
+
+@account_router.put(
+    "/Bulk",
+    status_code=200,
+    summary="Массовое изменение ролей аккаунтов",
+    responses={400: {"model": Message, "description": "Invalid selection"}},
+)
+@inject
+def bulk_update(
+    request: BulkUpdateRequest,
+    account_service: FromDishka[AccountService],
+) -> BulkChangeReport:
+    return account_service.bulk_update_accounts(request)
+
+
+@account_router.post(
+    "/Bulk/Delete",
+    status_code=200,
+    summary="Массовое мягкое удаление аккаунтов",
+    responses={400: {"model": Message, "description": "Invalid selection"}},
+)
+@inject
+def bulk_delete(
+    selection: AccountSelection,
+    account_service: FromDishka[AccountService],
+) -> BulkChangeReport:
+    return account_service.bulk_delete_accounts(selection)
 
 
 @account_router.get(
@@ -63,6 +152,7 @@ def all_(
         409: {"model": Message, "description": "User already exists"},
     },
 )
+@password_bound
 @inject
 def create(
     request: AccountRequest,
@@ -0,0 +1,192 @@
+from typing import Annotated
+from uuid import UUID
+
+from dishka import FromDishka
+from fastapi import APIRouter, Depends, Path, Query, Response
+from fastapi.responses import StreamingResponse
+
+from account.application.ports.data.account_reader import AccountInfo
+from account.application.services.account_service import (
+    AccountRequest,
+    AccountSelection,
+    BulkChangeReport,
+    BulkUpdateRequest,
+    ImportReport,
+    ImportRow,
+    UpdateMeRequest,
+)
+from account.application.services.async_account_service import AsyncAccountService
+from account.presentation.account_import import (
+    IMPORT_OPENAPI,
+    account_import_requests,
+)
+from account.presentation.auth import AuthRequired
+from account.presentation.dishka import inject_async
+from account.presentation.export import (
+    MEDIA_TYPES,
+    ExportFormat,
+    export_chunks_async,
+    export_headers,
+)
+from account.presentation.models import Message
+from account.presentation.pagination import decode_cursor, next_page_headers
+
+async_account_router = APIRouter(
+    prefix="/Accounts", dependencies=[AuthRequired], tags=["Аккаунты"]
+)
+
+
+@async_account_router.get(
+    "/Me",
+    status_code=200,
+    summary="Получение данных о текущем аккаунте",  # noqa: RUF001
+)
+@inject_async
+async def me(account_service: FromDishka[AsyncAccountService]) -> AccountInfo:
+    return await account_service.get_me()
+
+
+@async_account_router.put(
+    "/Update",
+    status_code=204,
+    summary="Обновление своего аккаунта",
+    responses={409: {"model": Message, "description": "Username already used"}},
+)
+@inject_async
+async def update_me(
+    request: UpdateMeRequest,
+    account_service: FromDishka[AsyncAccountService],
+) -> None:
+    await account_service.update_me(request)
+
+
+@async_account_router.get("/", status_code=200, summary="Получение списка аккаунтов")
+@inject_async
+async def all_(
+    *,
+    from_: Annotated[int, Query(alias="from")] = 0,
+    count: Annotated[int, Query()] = 10,
+    after: Annotated[str | None, Query()] = None,
+    response: Response,
+    account_service: FromDishka[AsyncAccountService],
+) -> list[AccountInfo]:
+    accounts = await account_service.all_accounts(from_, count, decode_cursor(after))
+    response.headers.update(next_page_headers(accounts, count))
+
+    return accounts
+
+
+@async_account_router.get(
+    "/Export",
+    status_code=200,
+    summary="Выгрузка списка аккаунтов",
+    response_class=StreamingResponse,
+)
+@inject_async
+async def export(
+    *,
+    format_: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    account_service: FromDishka[AsyncAccountService],
+) -> StreamingResponse:
+    accounts = account_service.export_accounts()
+
+    return StreamingResponse(
+        export_chunks_async(accounts, format_),
+        media_type=MEDIA_TYPES[format_],
+        headers=export_headers(format_),
+    )
+
+
+@async_account_router.post(
+    "/Import",
+    status_code=200,
+    summary="Массовый импорт аккаунтов",
+    openapi_extra=IMPORT_OPENAPI,
+)
+@inject_async
+async def import_(
+    *,
+    requests: Annotated[list[ImportRow], Depends(account_import_requests)],
+    dry_run: Annotated[bool, Query()] = False,
+    account_service: FromDishka[AsyncAccountService],
+) -> ImportReport:
+    return await account_service.import_accounts(requests, dry_run=dry_run)
+
+
+@async_account_router.put(
+    "/Bulk",
+    status_code=200,
+    summary="Массовое изменение ролей аккаунтов",
+    responses={400: {"model": Message, "description": "Invalid selection"}},
+)
+@inject_async
+async def bulk_update(
+    request: BulkUpdateRequest,
+    account_service: FromDishka[AsyncAccountService],
+) -> BulkChangeReport:
+    return await account_service.bulk_update_accounts(request)
+
+
+@async_account_router.post(
+    "/Bulk/Delete",
+    status_code=200,
+    summary="Массовое мягкое удаление аккаунтов",
+    responses={400: {"model": Message, "description": "Invalid selection"}},
+)
+@inject_async
+async def bulk_delete(
+    selection: AccountSelection,
+    account_service: FromDishka[AsyncAccountService],
+) -> BulkChangeReport:
+    return await account_service.bulk_delete_accounts(selection)
+
+
+@async_account_router.get(
+    "/{id}",
+    status_code=201,
+    summary="Создание администратором нового аккаунта",
+    responses={
+        201: {"model": Message, "description": "Account created"},
+        409: {"model": Message, "description": "User already exists"},
+    },
+)
+@inject_async
+async def create(
+    request: AccountRequest,
+    account_service: FromDishka[AsyncAccountService],
+) -> Message:
+    await account_service.create_account(request)
+
+    return Message("Account created")
+
+
+@async_account_router.put(
+    "/{id}",
+    status_code=204,
+    summary="Изменение администратором аккаунта по id",
+    responses={404: {"model": Message, "description": "Account not found"}},
+)
+@inject_async
+async def update(
+    id_: Annotated[UUID, Path(alias="id")],
+    request: AccountRequest,
+    account_service: FromDishka[AsyncAccountService],
+) -> None:
+    await account_service.update_account(id_, request)
+
+
+@async_account_router.delete(
+    "/{id}",
+    status_code=204,
+    summary="Мягкое удаление аккаунта по id",
+    responses={
+        404: {"model": Message, "description": "Account not found"},
+        410: {"model": Message, "description": "Account already deleted"},
+    },
+)
+@inject_async
+async def delete(
+    id_: Annotated[UUID, Path(alias="id")],
+    account_service: FromDishka[AsyncAccountService],
+) -> None:
+    await account_service.delete_account(id_)
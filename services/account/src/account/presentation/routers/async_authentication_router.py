@@ -0,0 +1,176 @@
+from typing import Annotated
+
+from dishka import FromDishka
+from fastapi import APIRouter, Body, Header, Query, Response
+
+from account.application.models import TokenPayload
+from account.application.ports.clock import Clock
+from account.application.services.async_authentication_service import (
+    AsyncAuthenticationService,
+)
+from account.application.services.authentication_service import (
+    CredentialsResponse,
+    SessionInfo,
+    SignInRequest,
+    SignUpRequest,
+    TokenValidationResult,
+)
+from account.infrastructure.auth.auth_config import AuthConfig
+from account.presentation.auth import AuthRequired
+from account.presentation.dishka import inject_async
+from account.presentation.models import Message
+from account.presentation.routers.authentication_router import (
+    MAX_VALIDATE_BATCH_SIZE,
+)
+from account.presentation.validation_cache import (
+    etag_matches,
+    validation_cache_headers,
+)
+
+async_authentication_router = APIRouter(
+    prefix="/Authentication", tags=["Аутентификация и авторизация"]
+)
+
+
+@async_authentication_router.post(
+    "/SignUp",
+    status_code=201,
+    summary="Регистрация нового аккаунта",
+    responses={
+        201: {"model": Message, "description": "Account created"},
+        409: {
+            "model": Message,
+            "description": "Account with this username already exists",
+        },
+    },
+)
+@inject_async
+async def sign_up(
+    request: SignUpRequest,
+    authentication_service: FromDishka[AsyncAuthenticationService],
+) -> Message:
+    await authentication_service.sign_up(request)
+
+    return Message("Account created")
+
+
+@async_authentication_router.post(
+    "/SignIn",
+    status_code=200,
+    summary="Получение новой пары jwt пользователя",
+    responses={
+        200: {"model": CredentialsResponse},
+        401: {"model": Message, "description": "Invalid username or password"},
+    },
+)
+@inject_async
+async def sign_in(
+    request: SignInRequest,
+    authentication_service: FromDishka[AsyncAuthenticationService],
+) -> CredentialsResponse:
+    return await authentication_service.sign_in(request)
+
+
+@async_authentication_router.put(
+    "/SignOut",
+    status_code=204,
+    dependencies=[AuthRequired],
+    summary="Выход из аккаунта",
+)
+@inject_async
+async def sign_out(
+    authentication_service: FromDishka[AsyncAuthenticationService],
+) -> None:
+    await authentication_service.sign_out()
+
+
+@async_authentication_router.put(
+    "/SignOutAll",
+    status_code=204,
+    dependencies=[AuthRequired],
+    summary="Выход из аккаунта на всех устройствах",
+)
+@inject_async
+async def sign_out_all(
+    authentication_service: FromDishka[AsyncAuthenticationService],
+) -> None:
+    await authentication_service.sign_out_everywhere()
+
+
+@async_authentication_router.get(
+    "/Sessions",
+    status_code=200,
+    dependencies=[AuthRequired],
+    summary="Список активных сессий",
+)
+@inject_async
+async def sessions(
+    authentication_service: FromDishka[AsyncAuthenticationService],
+) -> list[SessionInfo]:
+    return await authentication_service.active_sessions()
+
+
+@async_authentication_router.get(
+    "/Validate",
+    status_code=200,
+    summary="Интроспекция токена",
+    response_model=TokenPayload,
+    responses={
+        200: {"model": TokenPayload},
+        304: {"description": "Token payload not modified"},
+        401: {"model": Message, "description": "Invalid token"},
+    },
+)
+@inject_async
+async def validate(
+    *,
+    access_token: Annotated[str, Query(required=True, alias="accessToken")],
+    if_none_match: Annotated[str | None, Header()] = None,
+    response: Response,
+    authentication_service: FromDishka[AsyncAuthenticationService],
+    clock: FromDishka[Clock],
+    auth_config: FromDishka[AuthConfig],
+) -> TokenPayload | Response:
+    jwt_token = authentication_service.introspect(access_token)
+    headers = validation_cache_headers(jwt_token, clock, auth_config)
+
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+
+    return jwt_token.payload
+
+
+@async_authentication_router.post(
+    "/ValidateBatch",
+    status_code=200,
+    summary="Пакетная интроспекция токенов",
+    responses={200: {"model": list[TokenValidationResult]}},
+)
+@inject_async
+async def validate_batch(
+    access_tokens: Annotated[
+        list[str],
+        Body(embed=True, alias="accessTokens", max_length=MAX_VALIDATE_BATCH_SIZE),
+    ],
+    authentication_service: FromDishka[AsyncAuthenticationService],
+) -> list[TokenValidationResult]:
+    return authentication_service.validate_many(access_tokens)
+
+
+@async_authentication_router.post(
+    "/Refresh",
+    status_code=200,
+    summary="Обновление пары токенов",
+    responses={
+        200: {"model": CredentialsResponse},
+        401: {"model": Message, "description": "Invalid refresh token"},
+    },
+)
+@inject_async
+async def refresh(
+    refresh_token: Annotated[str, Body(required=True, alias="refreshToken")],
+    authentication_service: FromDishka[AsyncAuthenticationService],
+) -> CredentialsResponse:
+    return await authentication_service.refresh(refresh_token)
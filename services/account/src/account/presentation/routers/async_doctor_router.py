@@ -0,0 +1,48 @@
+from typing import Annotated
+from uuid import UUID
+
+from dishka import FromDishka
+from fastapi import APIRouter, Path, Query, Response
+
+from account.application.ports.data.account_reader import AccountInfo
+from account.application.services.async_account_service import AsyncAccountService
+from account.presentation.auth import AuthRequired
+from account.presentation.dishka import inject_async
+from account.presentation.pagination import decode_cursor, next_page_headers
+
+async_doctor_router = APIRouter(
+    prefix="/Doctors", dependencies=[AuthRequired], tags=["Доктора"]
+)
+
+
+@async_doctor_router.get("/", status_code=200, summary="Получение списка докторов")
+@inject_async
+async def all_(
+    *,
+    name_filter: Annotated[str | None, Query()] = None,
+    from_: Annotated[int, Query(alias="from")] = 0,
+    count: Annotated[int, Query()] = 10,
+    after: Annotated[str | None, Query()] = None,
+    response: Response,
+    account_service: FromDishka[AsyncAccountService],
+) -> list[AccountInfo]:
+    accounts = await account_service.all_doctors(
+        from_, count, name_filter, decode_cursor(after)
+    )
+    response.headers.update(next_page_headers(accounts, count))
+
+    return accounts
+
+
+@async_doctor_router.get(
+    "/{id}",
+    status_code=200,
+    summary="Получение информации о докторе по Id",  # noqa: RUF001
+    responses={404: {"description": "Doctor not found"}},
+)
+@inject_async
+async def doctor_identified(
+    id_: Annotated[UUID, Path(alias="id")],
+    account_service: FromDishka[AsyncAccountService],
+) -> AccountInfo:
+    return await account_service.doctor_identified(id_)
@@ -1,18 +1,30 @@
 from typing import Annotated
 
 from dishka import FromDishka
-from fastapi import APIRouter, Body, Query
+from fastapi import APIRouter, Body, Header, Query, Response
 
 from account.application.models import TokenPayload
+from account.application.ports.clock import Clock
 from account.application.services.authentication_service import (
     AuthenticationService,
     CredentialsResponse,
+    SessionInfo,
     SignInRequest,
     SignUpRequest,
+    TokenValidationResult,
 )
+from account.infrastructure.auth.auth_config import AuthConfig
 from account.presentation.auth import AuthRequired
 from account.presentation.dishka import inject
 from account.presentation.models import Message
+from account.presentation.password_threads import password_bound
+from account.presentation.validation_cache import (
+    etag_matches,
+    validation_cache_headers,
+)
+
+MAX_VALIDATE_BATCH_SIZE = 500
+
 
 authentication_router = APIRouter(
     prefix="/Authentication", tags=["Аутентификация и авторизация"]
@@ -31,6 +43,7 @@ authentication_router = APIRouter(
         },
     },
 )
+@password_bound
 @inject
 def sign_up(
     request: SignUpRequest,
@@ -50,6 +63,7 @@ def sign_up(
         401: {"model": Message, "description": "Invalid username or password"},
     },
 )
+@password_bound
 @inject
 def sign_in(
     request: SignInRequest,
@@ -71,21 +85,79 @@ def sign_out(
     authentication_service.sign_out()
 
 
+@authentication_router.put(
+    "/SignOutAll",
+    status_code=204,
+    dependencies=[AuthRequired],
+    summary="Выход из аккаунта на всех устройствах",
+)
+@inject
+def sign_out_all(
+    authentication_service: FromDishka[AuthenticationService],
+) -> None:
+    authentication_service.sign_out_everywhere()
+
+
+@authentication_router.get(
+    "/Sessions",
+    status_code=200,
+    dependencies=[AuthRequired],
+    summary="Список активных сессий",
+)
+@inject
+def sessions(
+    authentication_service: FromDishka[AuthenticationService],
+) -> list[SessionInfo]:
+    return authentication_service.active_sessions()
+
+
 @authentication_router.get(
     "/Validate",
     status_code=200,
     summary="Интроспекция токена",
+    response_model=TokenPayload,
     responses={
         200: {"model": TokenPayload},
+        304: {"description": "Token payload not modified"},
         401: {"model": Message, "description": "Invalid token"},
     },
 )
 @inject
 def validate(
+    *,
     access_token: Annotated[str, Query(required=True, alias="accessToken")],
+    if_none_match: Annotated[str | None, Header()] = None,
+    response: Response,
+    authentication_service: FromDishka[AuthenticationService],
+    clock: FromDishka[Clock],
+    auth_config: FromDishka[AuthConfig],
+) -> TokenPayload | Response:
+    jwt_token = authentication_service.introspect(access_token)
+    headers = validation_cache_headers(jwt_token, clock, auth_config)
+
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+
+    return jwt_token.payload
+
+
+@authentication_router.post(
+    "/ValidateBatch",
+    status_code=200,
+    summary="Пакетная интроспекция токенов",
+    responses={200: {"model": list[TokenValidationResult]}},
+)
+@inject
+def validate_batch(
+    access_tokens: Annotated[
+        list[str],
+        Body(embed=True, alias="accessTokens", max_length=MAX_VALIDATE_BATCH_SIZE),
+    ],
     authentication_service: FromDishka[AuthenticationService],
-) -> TokenPayload:
-    return authentication_service.validate(access_token)
+) -> list[TokenValidationResult]:
+    return authentication_service.validate_many(access_tokens)
 
 
 @authentication_router.post(
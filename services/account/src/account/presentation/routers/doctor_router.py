@@ -2,12 +2,13 @@ from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, Path, Query, Response
 
 from account.application.ports.data.account_reader import AccountInfo
 from account.application.services.account_service import AccountService
 from account.presentation.auth import AuthRequired
 from account.presentation.dishka import inject
+from account.presentation.pagination import decode_cursor, next_page_headers
 
 doctor_router = APIRouter(
     prefix="/Doctors", dependencies=[AuthRequired], tags=["Доктора"]
@@ -21,9 +22,16 @@ def all_(
     name_filter: Annotated[str | None, Query()] = None,
     from_: Annotated[int, Query(alias="from")] = 0,
     count: Annotated[int, Query()] = 10,
+    after: Annotated[str | None, Query()] = None,
+    response: Response,
     account_service: FromDishka[AccountService],
 ) -> list[AccountInfo]:
-    return account_service.all_doctors(from_, count, name_filter)
+    accounts = account_service.all_doctors(
+        from_, count, name_filter, decode_cursor(after)
+    )
+    response.headers.update(next_page_headers(accounts, count))
+
+    return accounts
 
 
 @doctor_router.get(
@@ -0,0 +1,15 @@
+from dishka import FromDishka
+from fastapi import APIRouter
+
+from account.infrastructure.metrics import MetricsRegistry, MetricValue
+from account.presentation.dishka import inject
+
+metrics_router = APIRouter(prefix="/Metrics", tags=["Метрики"])
+
+
+@metrics_router.get("/", status_code=200, summary="Метрики сервиса")
+@inject
+def metrics(
+    metrics_registry: FromDishka[MetricsRegistry],
+) -> dict[str, MetricValue]:
+    return metrics_registry.collect()
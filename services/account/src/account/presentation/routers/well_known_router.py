@@ -0,0 +1,30 @@
+from typing import Any
+
+from dishka import FromDishka
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from account.infrastructure.auth.auth_config import AuthConfig
+from account.infrastructure.auth.jwt_key_ring import JwtKeyRing
+from account.presentation.dishka import inject
+
+well_known_router = APIRouter(prefix="/.well-known", tags=["Ключи подписи"])
+
+
+@well_known_router.get(
+    "/jwks.json",
+    status_code=200,
+    summary="Публичные ключи для локальной проверки токенов",
+    response_model=dict[str, list[dict[str, Any]]],
+)
+@inject
+def jwks(
+    key_ring: FromDishka[JwtKeyRing],
+    auth_config: FromDishka[AuthConfig],
+) -> JSONResponse:
+    max_age = int(auth_config.jwks_max_age.total_seconds())
+
+    return JSONResponse(
+        content=key_ring.jwks(),
+        headers={"Cache-Control": f"public, max-age={max_age}"},
+    )
@@ -0,0 +1,30 @@
+from hashlib import sha256
+
+from account.application.models import JwtToken
+from account.application.ports.clock import Clock
+from account.infrastructure.auth.auth_config import AuthConfig
+
+
+def validation_cache_headers(
+    jwt_token: JwtToken, clock: Clock, auth_config: AuthConfig
+) -> dict[str, str]:
+    lifetime = min(
+        jwt_token.expires_in - clock.now(),
+        auth_config.revocation_horizon,
+    )
+    max_age = max(int(lifetime.total_seconds()), 0)
+    etag = sha256(jwt_token.value.encode()).hexdigest()[:32]
+
+    return {
+        "Cache-Control": f"public, max-age={max_age}",
+        "ETag": f'"{etag}"',
+    }
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if if_none_match is None:
+        return False
+
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
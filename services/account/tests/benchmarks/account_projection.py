@@ -0,0 +1,122 @@
+"""Account listing cost per 10k rows: full users rows vs the AccountInfo projection.
+
+Run from services/account against a migrated database:
+
+    PYTHONPATH=src python -m tests.benchmarks.account_projection
+"""
+
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from os import environ
+from uuid import UUID, uuid4
+
+from sqlalchemy import Connection, Select, create_engine, func, insert, select, text
+
+from account.application.models import UserRole
+from account.application.ports.data.account_reader import ManyAccountFilter
+from account.infrastructure.persistence.account_reader import _load, _read_stmt
+from account.infrastructure.persistence.tables import users
+
+ROWS = 10_000
+
+
+@dataclass(frozen=True)
+class FullAccountInfo:
+    id: UUID
+    first_name: str
+    last_name: str
+    username: str
+    roles: set[UserRole]
+    is_active: bool
+
+
+def _full_stmt() -> Select:
+    return select(users).order_by(users.c.username, users.c.id).limit(ROWS)
+
+
+def _projected_stmt() -> Select:
+    return _read_stmt(ManyAccountFilter(from_=0, count=ROWS, only_active=False))
+
+
+def _load_full(connection: Connection) -> list[FullAccountInfo]:
+    return [
+        FullAccountInfo(
+            id=row["id"],
+            first_name=row["first_name"],
+            last_name=row["last_name"],
+            username=row["username"],
+            roles=set(row["roles"]),
+            is_active=row["is_active"],
+        )
+        for row in connection.execute(_full_stmt()).mappings()
+    ]
+
+
+def _load_projected(connection: Connection) -> list[object]:
+    return [_load(row) for row in connection.execute(_projected_stmt())]
+
+
+def _fetched_bytes(connection: Connection, stmt: Select) -> int:
+    rows = stmt.subquery("rows")
+
+    return connection.scalar(
+        select(func.sum(func.pg_column_size(text("rows.*")))).select_from(rows)
+    )
+
+
+def _peak_memory(load: Callable[[], list[object]]) -> tuple[int, int]:
+    tracemalloc.start()
+
+    try:
+        rows = load()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del rows
+
+    return retained, peak
+
+
+def main() -> None:
+    engine = create_engine(environ["DB_CONNECTION_STRING"])
+
+    with engine.connect() as connection, connection.begin() as transaction:
+        connection.execute(
+            insert(users),
+            [
+                {
+                    "id": uuid4(),
+                    "first_name": f"first{i}",
+                    "last_name": f"last{i}",
+                    "username": f"bench{i:07}",
+                    "password_hash": "$2b$12$" + "x" * 53,
+                    "is_active": True,
+                    "roles": [UserRole.USER],
+                }
+                for i in range(ROWS)
+            ],
+        )
+
+        for name, stmt, load in (
+            ("full rows", _full_stmt(), _load_full),
+            ("projection", _projected_stmt(), _load_projected),
+        ):
+            fetched = _fetched_bytes(connection, stmt)
+            load(connection)
+            retained, peak = _peak_memory(lambda load=load: load(connection))
+
+            print(
+                f"{name:<12} fetched {fetched / 1e6:.2f} MB, "
+                f"retained {retained / 1e6:.2f} MB, peak {peak / 1e6:.2f} MB "
+                f"per {ROWS} rows"
+            )
+
+        transaction.rollback()
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
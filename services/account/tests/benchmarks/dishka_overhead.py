@@ -0,0 +1,157 @@
+"""Per-request Dishka cost: container open/close, service graph, route latency.
+
+Route latency is measured twice: with the baseline middleware behaviour, where
+every request eagerly opens a REQUEST container (both of them in async mode),
+and with the lazy containers that only injecting routes open. ServicesProvider
+stays REQUEST-scoped in both, since every service depends on the request's
+SQLAlchemy session or identity provider.
+
+Run from services/account against a migrated database, in either mode:
+
+    PYTHONPATH=src PERSISTENCE_MODE=async python -m tests.benchmarks.dishka_overhead
+"""
+
+from collections.abc import Awaitable, Callable
+from time import perf_counter
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from account.application.services.account_service import AccountService
+from account.application.services.async_account_service import AsyncAccountService
+from account.bootstrap import bootstrap
+from account.presentation.dishka import _request_container
+
+ITERATIONS = 2000
+
+REQUESTS = 200
+
+ROUNDS = 5
+
+ROUTES = ("/openapi.json", "/ui-swagger", "/Metrics/", "/Doctors/", "/Accounts/Me")
+
+
+def _timed(func: Callable[[], object], iterations: int) -> float:
+    func()
+
+    started_at = perf_counter()
+
+    for _ in range(iterations):
+        func()
+
+    return (perf_counter() - started_at) / iterations * 1e6
+
+
+async def _timed_async(
+    func: Callable[[], Awaitable[object]], iterations: int
+) -> float:
+    await func()
+
+    started_at = perf_counter()
+
+    for _ in range(iterations):
+        await func()
+
+    return (perf_counter() - started_at) / iterations * 1e6
+
+
+def _report(label: str, microseconds: float) -> None:
+    print(f"{label:<40} {microseconds:8.0f} us")
+
+
+class EagerContainerMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            _request_container(Request(scope))
+
+        await self.app(scope, receive, send)
+
+
+def _open_eagerly(app: FastAPI) -> FastAPI:
+    app.user_middleware.append(Middleware(EagerContainerMiddleware))
+
+    if hasattr(app.state, "dishka_async_bypassed_paths"):
+        app.state.dishka_async_bypassed_paths = frozenset()
+
+    return app
+
+
+def _headers(client: TestClient) -> dict[str, str]:
+    response = client.post(
+        "/Authentication/SignIn",
+        json={"username": "admin", "password": "admin"},
+    )
+
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def _route_latency(client: TestClient, route: str, headers: dict[str, str]) -> float:
+    return _timed(lambda: client.get(route, headers=headers), REQUESTS)
+
+
+def main() -> None:
+    eager_app = _open_eagerly(bootstrap())
+    app = bootstrap()
+
+    with TestClient(eager_app) as eager_client, TestClient(app) as client:
+        request = Request({"type": "http", "headers": [], "query_string": b""})
+        container = app.state.dishka_container
+
+        def open_sync() -> None:
+            with container({Request: request}):
+                pass
+
+        def resolve_sync() -> None:
+            with container({Request: request}) as request_container:
+                request_container.get(AccountService)
+
+        _report("sync container open/close", _timed(open_sync, ITERATIONS))
+        _report("sync AccountService graph", _timed(resolve_sync, ITERATIONS))
+
+        async_container = getattr(app.state, "dishka_async_container", None)
+
+        if async_container is not None:
+
+            async def open_async() -> None:
+                async with async_container({Request: request}):
+                    pass
+
+            async def resolve_async() -> None:
+                async with async_container({Request: request}) as request_container:
+                    await request_container.get(AsyncAccountService)
+
+            _report(
+                "async container open/close",
+                client.portal.call(_timed_async, open_async, ITERATIONS),
+            )
+            _report(
+                "async AsyncAccountService graph",
+                client.portal.call(_timed_async, resolve_async, ITERATIONS),
+            )
+
+        eager_headers = _headers(eager_client)
+        headers = _headers(client)
+
+        print(f"{'GET':<40} {'eager':>11} {'lazy':>11} {'saved':>11}")
+
+        for route in ROUTES:
+            eager = lazy = float("inf")
+
+            for _ in range(ROUNDS):
+                eager = min(
+                    eager, _route_latency(eager_client, route, eager_headers)
+                )
+                lazy = min(lazy, _route_latency(client, route, headers))
+
+            print(
+                f"{route:<40} {eager:8.0f} us {lazy:8.0f} us {eager - lazy:8.0f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+from collections.abc import Iterator
+from os import environ
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import Engine, create_engine
+
+from account.infrastructure.persistence.map import setup_mappers
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session")
+def connection_string() -> str:
+    connection_string = environ.get("DB_CONNECTION_STRING")
+
+    if connection_string is None:
+        pytest.skip("DB_CONNECTION_STRING is not set")
+
+    return connection_string
+
+
+@pytest.fixture(scope="session")
+def engine(connection_string: str) -> Iterator[Engine]:
+    config = Config(ROOT / "alembic.ini")
+    config.set_main_option(
+        "script_location",
+        str(ROOT / "src/account/infrastructure/persistence/migrations"),
+    )
+    command.upgrade(config, "head")
+
+    setup_mappers()
+
+    engine = create_engine(connection_string)
+
+    yield engine
+
+    engine.dispose()
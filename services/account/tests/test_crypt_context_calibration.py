@@ -0,0 +1,71 @@
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from account.infrastructure.auth import crypt_context_calibration
+from account.infrastructure.auth.crypt_context_calibration import configured_rounds
+from account.infrastructure.auth.hashing_config import HashingConfig
+
+CALIBRATED_ROUNDS = 12
+
+PINNED_ROUNDS = 10
+
+
+@pytest.fixture
+def calibrations(monkeypatch: pytest.MonkeyPatch) -> list[HashingConfig]:
+    calibrations = []
+
+    def calibrate_rounds(hashing_config: HashingConfig) -> int:
+        calibrations.append(hashing_config)
+
+        return CALIBRATED_ROUNDS
+
+    monkeypatch.setattr(
+        crypt_context_calibration, "calibrate_rounds", calibrate_rounds
+    )
+
+    return calibrations
+
+
+def test_pinned_rounds_skip_calibration(calibrations: list[HashingConfig]) -> None:
+    hashing_config = HashingConfig(
+        scheme="bcrypt",
+        verify_budget=timedelta(milliseconds=250),
+        rounds=PINNED_ROUNDS,
+    )
+
+    assert configured_rounds(hashing_config) == PINNED_ROUNDS
+    assert calibrations == []
+
+
+def test_pinned_rounds_out_of_range() -> None:
+    hashing_config = HashingConfig(
+        scheme="bcrypt", verify_budget=timedelta(milliseconds=250), rounds=40
+    )
+
+    with pytest.raises(ValueError, match="between"):
+        configured_rounds(hashing_config)
+
+
+def test_calibrated_rounds_are_cached(
+    calibrations: list[HashingConfig], tmp_path: Path
+) -> None:
+    rounds_cache = tmp_path / "rounds.json"
+    hashing_config = HashingConfig(
+        scheme="bcrypt",
+        verify_budget=timedelta(milliseconds=250),
+        rounds_cache=rounds_cache,
+    )
+    slower_config = HashingConfig(
+        scheme="bcrypt",
+        verify_budget=timedelta(milliseconds=500),
+        rounds_cache=rounds_cache,
+    )
+
+    configured_rounds(hashing_config)
+    configured_rounds(hashing_config)
+    configured_rounds(slower_config)
+
+    assert calibrations == [hashing_config, slower_config]
+    assert configured_rounds(hashing_config) == CALIBRATED_ROUNDS
@@ -0,0 +1,65 @@
+from uuid import UUID
+
+from account.application.models import User, UserRole
+from account.infrastructure.persistence.identity_map import (
+    IdentityMap,
+    IdentityMappedUserGateway,
+)
+
+
+class StoredUsers:
+    def __init__(self, *users: User) -> None:
+        self.users = {user.username: user for user in users}
+        self.lookups: list[str] = []
+
+    def idenified(self, user_id: UUID) -> User | None:
+        return next(
+            (user for user in self.users.values() if user.id == user_id), None
+        )
+
+    def named_with(self, username: str) -> User | None:
+        self.lookups.append(username)
+
+        return self.users.get(username)
+
+    def exists_named(self, username: str) -> bool:
+        self.lookups.append(username)
+
+        return username in self.users
+
+
+def _user(username: str) -> User:
+    return User(
+        first_name="First",
+        last_name="Last",
+        username=username,
+        password_hash="",
+        roles={UserRole.USER},
+    )
+
+
+def test_loaded_username_is_answered_from_the_map() -> None:
+    user = _user("ivanov")
+    stored = StoredUsers(user)
+    gateway = IdentityMappedUserGateway(stored, IdentityMap())  # type: ignore[arg-type]
+
+    gateway.idenified(user.id)
+
+    assert gateway.named_with("ivanov") is user
+    assert gateway.exists_named("ivanov")
+    assert stored.lookups == []
+
+
+def test_renamed_user_is_looked_up_in_the_database() -> None:
+    user = _user("ivanov")
+    stored = StoredUsers(user)
+    gateway = IdentityMappedUserGateway(stored, IdentityMap())  # type: ignore[arg-type]
+
+    gateway.named_with("petrov")
+    gateway.idenified(user.id)
+    user.username = "petrov"
+
+    gateway.exists_named("ivanov")
+    gateway.exists_named("petrov")
+
+    assert stored.lookups == ["petrov", "ivanov", "petrov"]
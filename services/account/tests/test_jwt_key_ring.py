@@ -0,0 +1,121 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from account.application.errors import InvalidTokenError
+from account.application.models import TokenPayload, UserRole
+from account.infrastructure.auth.auth_config import AuthConfig, SigningKey
+from account.infrastructure.auth.crypto_operations import CryptoOperationsRecorder
+from account.infrastructure.auth.jose_jwt_token_provider import JoseJwtTokenProvider
+from account.infrastructure.auth.jwt_key_ring import JwtKeyRing
+from account.infrastructure.auth.revocation_list import RevocationList
+from account.infrastructure.auth.token_cache import ValidatedTokenCache
+from account.infrastructure.metrics import MetricsRegistry
+
+STARTED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+
+OLD_KEY_RETIRES_AT = STARTED_AT + timedelta(minutes=10)
+
+
+class MovableClock:
+    def __init__(self, now: datetime) -> None:
+        self.tz = UTC
+        self._now = now
+
+    def now(self) -> datetime:
+        return self._now
+
+    def move_to(self, now: datetime) -> None:
+        self._now = now
+
+
+def _signing_key(kid: str, not_after: datetime | None = None) -> SigningKey:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    return SigningKey(
+        kid=kid,
+        public_key=private_key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode(),
+        private_key=private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ).decode(),
+        not_after=not_after,
+    )
+
+
+@pytest.fixture(scope="module")
+def auth_config() -> AuthConfig:
+    return AuthConfig(
+        jwt_secret="",
+        access_expiration=timedelta(hours=1),
+        refresh_expiration=timedelta(days=1),
+        jwt_algorithm="RS256",
+        signing_keys=(
+            _signing_key("old", not_after=OLD_KEY_RETIRES_AT),
+            _signing_key("new"),
+        ),
+        signing_key_id="old",
+    )
+
+
+@pytest.fixture
+def clock() -> MovableClock:
+    return MovableClock(STARTED_AT)
+
+
+@pytest.fixture
+def token_provider(
+    clock: MovableClock, auth_config: AuthConfig
+) -> JoseJwtTokenProvider:
+    metrics = MetricsRegistry()
+
+    return JoseJwtTokenProvider(
+        clock,
+        auth_config,
+        JwtKeyRing(clock, auth_config),
+        ValidatedTokenCache(clock, auth_config, metrics),
+        CryptoOperationsRecorder(metrics),
+        RevocationList(metrics),
+    )
+
+
+def test_new_key_takes_over_signing_after_not_after(
+    clock: MovableClock, auth_config: AuthConfig
+) -> None:
+    key_ring = JwtKeyRing(clock, auth_config)
+
+    assert key_ring.signing_key().kid == "old"
+
+    clock.move_to(OLD_KEY_RETIRES_AT + timedelta(seconds=1))
+
+    assert key_ring.signing_key().kid == "new"
+    assert key_ring.verification_key("old") is None
+    assert [key["kid"] for key in key_ring.jwks()["keys"]] == ["new"]
+
+
+def test_cached_token_stops_validating_when_its_key_retires(
+    clock: MovableClock, token_provider: JoseJwtTokenProvider
+) -> None:
+    payload = TokenPayload(user_id=uuid4(), roles={UserRole.USER})
+    clock.move_to(OLD_KEY_RETIRES_AT - timedelta(seconds=5))
+    token = token_provider.create_access_token(payload, clock.now()).value
+
+    assert token_provider.validate(token).payload == payload
+
+    clock.move_to(OLD_KEY_RETIRES_AT + timedelta(seconds=1))
+
+    with pytest.raises(InvalidTokenError):
+        token_provider.validate(token)
+
+    renewed = token_provider.create_access_token(payload, clock.now()).value
+
+    assert token_provider.validate(renewed).payload == payload
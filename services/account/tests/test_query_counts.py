@@ -0,0 +1,147 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, event
+from starlette.status import HTTP_200_OK, HTTP_204_NO_CONTENT, HTTP_409_CONFLICT
+
+from account.bootstrap import bootstrap
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *_: object) -> None:
+        self.count += 1
+
+
+@pytest.fixture(scope="module", params=["sync", "async"])
+def client(request: pytest.FixtureRequest, engine: Engine) -> Iterator[TestClient]:
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("PERSISTENCE_MODE", request.param)
+        monkeypatch.setenv("MAINTENANCE_ENABLED", "false")
+
+        with TestClient(bootstrap()) as client:
+            yield client
+
+
+@contextmanager
+def _counted_queries() -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+
+    event.listen(Engine, "before_cursor_execute", counter)
+
+    try:
+        yield counter
+    finally:
+        event.remove(Engine, "before_cursor_execute", counter)
+
+
+def _sign_in(client: TestClient, username: str, password: str) -> dict[str, str]:
+    response = client.post(
+        "/Authentication/SignIn",
+        json={"username": username, "password": password},
+    )
+
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def admin(client: TestClient) -> dict[str, str]:
+    return _sign_in(client, "admin", "admin")
+
+
+@pytest.fixture
+def user(client: TestClient) -> tuple[str, dict[str, str]]:
+    username = f"counted-{uuid4().hex}"
+
+    client.post(
+        "/Authentication/SignUp",
+        json={
+            "first_name": "Count",
+            "last_name": "Ed",
+            "username": username,
+            "password": "password",
+        },
+    )
+
+    return username, _sign_in(client, username, "password")
+
+
+def _account_request(username: str) -> dict[str, object]:
+    return {
+        "first_name": "Count",
+        "last_name": "Ed",
+        "username": username,
+        "password": "password",
+        "roles": ["USER"],
+    }
+
+
+def test_get_me(client: TestClient, user: tuple[str, dict[str, str]]) -> None:
+    _, headers = user
+
+    with _counted_queries() as queries:
+        response = client.get("/Accounts/Me", headers=headers)
+
+    assert response.status_code == HTTP_200_OK
+    assert queries.count == 1
+
+
+@pytest.mark.parametrize(
+    ("suffix", "status_code", "expected_queries"),
+    [("", HTTP_409_CONFLICT, 1), ("-renamed", HTTP_204_NO_CONTENT, 6)],
+    ids=["same_username", "renamed"],
+)
+def test_update_account(
+    client: TestClient,
+    admin: dict[str, str],
+    user: tuple[str, dict[str, str]],
+    suffix: str,
+    status_code: int,
+    expected_queries: int,
+) -> None:
+    username, headers = user
+    user_id = client.get("/Accounts/Me", headers=headers).json()["id"]
+
+    with _counted_queries() as queries:
+        response = client.put(
+            f"/Accounts/{user_id}",
+            json=_account_request(username + suffix),
+            headers=admin,
+        )
+
+    assert response.status_code == status_code
+    assert queries.count == expected_queries
+
+
+@pytest.mark.parametrize(
+    ("suffix", "status_code", "expected_queries"),
+    [("", HTTP_409_CONFLICT, 1), ("-renamed", HTTP_204_NO_CONTENT, 4)],
+    ids=["same_username", "renamed"],
+)
+def test_update_me(
+    client: TestClient,
+    user: tuple[str, dict[str, str]],
+    suffix: str,
+    status_code: int,
+    expected_queries: int,
+) -> None:
+    username, headers = user
+
+    with _counted_queries() as queries:
+        response = client.put(
+            "/Accounts/Update",
+            json={
+                "first_name": "Count",
+                "last_name": "Ed",
+                "username": username + suffix,
+            },
+            headers=headers,
+        )
+
+    assert response.status_code == status_code
+    assert queries.count == expected_queries
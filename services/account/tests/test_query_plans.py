@@ -0,0 +1,141 @@
+from collections.abc import Callable, Iterator
+from functools import partial
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Connection, Engine, Executable, event, insert, text
+
+from account.application.models import UserRole
+from account.application.ports.data.account_reader import (
+    AccountCursor,
+    AccountFilter,
+    ManyAccountFilter,
+)
+from account.infrastructure.persistence.account_reader import (
+    _read_one_stmt,
+    _read_stmt,
+)
+from account.infrastructure.persistence.data_mappers.user_mapper import (
+    _exists_named_stmt,
+    _named_with_stmt,
+)
+from account.infrastructure.persistence.tables import users
+
+USERS_COUNT = 20_000
+
+USERNAME_INDEXES = ("ux_users_username", "ix_users_username_id")
+
+TRIGRAM_INDEX = "ix_users_full_name_trgm"
+
+
+def _role(i: int) -> UserRole:
+    if i % 1000 == 1:
+        return UserRole.MANAGER
+
+    return UserRole.DOCTOR if i % 50 == 0 else UserRole.USER
+
+
+def _explained(
+    _connection: Connection,
+    _cursor: object,
+    statement: str,
+    parameters: object,
+    *_: object,
+) -> tuple[str, object]:
+    return f"EXPLAIN {statement}", parameters
+
+
+@pytest.fixture(scope="module")
+def connection(engine: Engine) -> Iterator[Connection]:
+    with engine.connect() as connection, connection.begin() as transaction:
+        connection.execute(
+            insert(users),
+            [
+                {
+                    "id": uuid4(),
+                    "first_name": f"first{i}",
+                    "last_name": f"last{i}",
+                    "username": f"plan{i}",
+                    "password_hash": "",
+                    "is_active": i % 10 != 0,
+                    "roles": [_role(i)],
+                }
+                for i in range(USERS_COUNT)
+            ],
+        )
+        connection.execute(text("ANALYZE users"))
+
+        event.listen(connection, "before_cursor_execute", _explained, retval=True)
+
+        yield connection
+
+        event.remove(connection, "before_cursor_execute", _explained)
+        transaction.rollback()
+
+
+def _plan(connection: Connection, stmt: Executable) -> str:
+    return "\n".join(connection.execute(stmt).scalars())
+
+
+def _read_filtered(**filter_: object) -> Executable:
+    return _read_stmt(ManyAccountFilter(from_=0, count=10, **filter_))
+
+
+@pytest.mark.parametrize(
+    ("stmt", "indexes"),
+    [
+        (partial(_named_with_stmt, "plan5"), USERNAME_INDEXES),
+        (partial(_exists_named_stmt, "plan5"), USERNAME_INDEXES),
+        (
+            partial(_read_one_stmt, AccountFilter(user_id=uuid4())),
+            ("users_pkey",),
+        ),
+        (
+            partial(_read_filtered, role=UserRole.DOCTOR),
+            ("ix_users_active_doctors",),
+        ),
+        (
+            partial(_read_filtered, role=UserRole.MANAGER, only_active=False),
+            ("ix_users_roles",),
+        ),
+        (
+            partial(_read_filtered, after=AccountCursor("plan5000", uuid4())),
+            USERNAME_INDEXES,
+        ),
+    ],
+    ids=[
+        "named_with",
+        "exists_named",
+        "read_one",
+        "read_active_doctors",
+        "read_by_role",
+        "read_after_cursor",
+    ],
+)
+def test_lookup_uses_index(
+    connection: Connection,
+    stmt: Callable[[], Executable],
+    indexes: tuple[str, ...],
+) -> None:
+    plan = _plan(connection, stmt())
+
+    assert any(index in plan for index in indexes), plan
+    assert "Seq Scan on users" not in plan, plan
+
+
+def test_name_filter_uses_trigram_index(
+    engine: Engine, connection: Connection
+) -> None:
+    with engine.connect() as inspected:
+        indexed = inspected.scalar(
+            text("SELECT EXISTS (SELECT FROM pg_indexes WHERE indexname = :name)"),
+            {"name": TRIGRAM_INDEX},
+        )
+
+    if not indexed:
+        pytest.skip("pg_trgm is not available on this server")
+
+    plan = _plan(connection, _read_filtered(name_filter="%first1234%"))
+
+    assert TRIGRAM_INDEX in plan, plan
+    assert "Seq Scan on users" not in plan, plan
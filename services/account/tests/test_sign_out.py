@@ -0,0 +1,67 @@
+from collections.abc import Iterator
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine
+from starlette.status import HTTP_200_OK, HTTP_204_NO_CONTENT, HTTP_401_UNAUTHORIZED
+
+from account.bootstrap import bootstrap
+
+
+@pytest.fixture(scope="module", params=["sync", "async"])
+def client(request: pytest.FixtureRequest, engine: Engine) -> Iterator[TestClient]:
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("PERSISTENCE_MODE", request.param)
+        monkeypatch.setenv("MAINTENANCE_ENABLED", "false")
+
+        with TestClient(bootstrap()) as client:
+            yield client
+
+
+@pytest.fixture
+def username(client: TestClient) -> str:
+    username = f"signed-out-{uuid4().hex}"
+
+    client.post(
+        "/Authentication/SignUp",
+        json={
+            "first_name": "Signed",
+            "last_name": "Out",
+            "username": username,
+            "password": "password",
+        },
+    )
+
+    return username
+
+
+def _sign_in(client: TestClient, username: str) -> dict[str, str]:
+    response = client.post(
+        "/Authentication/SignIn",
+        json={"username": username, "password": "password"},
+    )
+
+    return response.json()
+
+
+def test_sign_out_keeps_other_sessions(client: TestClient, username: str) -> None:
+    signed_out = _sign_in(client, username)
+    other = _sign_in(client, username)
+
+    response = client.put(
+        "/Authentication/SignOut",
+        headers={"Authorization": f"Bearer {signed_out['access_token']}"},
+    )
+
+    assert response.status_code == HTTP_204_NO_CONTENT
+
+    response = client.post("/Authentication/Refresh", json=other["refresh_token"])
+
+    assert response.status_code == HTTP_200_OK
+
+    response = client.post(
+        "/Authentication/Refresh", json=signed_out["refresh_token"]
+    )
+
+    assert response.status_code == HTTP_401_UNAUTHORIZED